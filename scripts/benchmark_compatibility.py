@@ -0,0 +1,57 @@
+import argparse
+import timeit
+from copy import copy
+
+from pdm_conda import mapping
+
+
+def make_candidates(count: int) -> list:
+    """Create numpy candidates with different versions and build strings.
+
+    :param count: number of candidates
+    :return: list of candidates
+    """
+    from pdm_conda.models.candidates import CondaCandidate
+    from pdm_conda.models.requirements import parse_requirement
+
+    req = parse_requirement("conda:numpy")
+    candidates = []
+    for i in range(count):
+        version = f"1.{i % 30}.{i % 7}"
+        build_string = f"py3{10 + i % 3}h{i:06x}_{i % 4}"
+        candidates.append(CondaCandidate(req, "numpy", version, build_string=build_string))
+    return candidates
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure candidates checked per second against a Conda requirement.")
+    parser.add_argument("--candidates", type=int, default=500, help="number of candidates")
+    parser.add_argument("--repeat", type=int, default=200, help="times candidates are filtered")
+    parser.add_argument("--requirement", default="conda:numpy >=1.21,<1.27 py311*", help="requirement to test")
+    args = parser.parse_args()
+
+    # avoid downloading the PyPI-Conda mapping
+    mapping.get_pypi_mapping = dict
+    from pdm_conda.models.requirements import parse_requirement
+
+    requirement = parse_requirement(args.requirement)
+    candidates = make_candidates(args.candidates)
+    benchmarks = {"is_compatible": lambda: [c for c in candidates if requirement.is_compatible(c)]}
+    if hasattr(requirement, "filter_compatible"):
+        benchmarks["filter_compatible"] = lambda: requirement.filter_compatible(candidates)
+    if hasattr(requirement, "version_contains"):
+        contains = requirement.version_contains()
+        benchmarks["version_contains"] = lambda: [c for c in candidates if contains(c.parsed_version)]
+
+    def specifier_copy():
+        # version test as done before, copying the specifier to allow prereleases
+        specifier = copy(requirement.specifier)
+        specifier.prereleases = True
+        return [c for c in candidates if specifier.contains(c.version)]
+
+    benchmarks["specifier_copy"] = specifier_copy
+
+    for name, func in benchmarks.items():
+        func()
+        elapsed = min(timeit.repeat(func, number=args.repeat, repeat=3))
+        print(f"{name}: {args.candidates * args.repeat / elapsed:,.0f} candidates/s")
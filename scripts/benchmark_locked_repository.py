@@ -0,0 +1,78 @@
+import argparse
+import sys
+import timeit
+from tempfile import TemporaryDirectory
+
+from pdm_conda import mapping
+
+
+def make_lockfile(count: int) -> dict:
+    """Create a synthetic lock file with Conda packages depending on the next one.
+
+    :param count: number of packages
+    :return: lock file data
+    """
+    packages = []
+    for i in range(count):
+        name = f"package-{i}"
+        packages.append(
+            {
+                "name": name,
+                "version": "1.0",
+                "conda_managed": True,
+                "channel": "conda-forge",
+                "build_string": "pyhd8ed1ab_0",
+                "build_number": 0,
+                "dependencies": [f"package-{i + 1} >=1.0"] if i < count - 1 else [],
+                "files": [
+                    {
+                        "url": f"https://conda.anaconda.org/conda-forge/noarch/{name}-1.0-pyhd8ed1ab_0.conda",
+                        "hash": "md5:d41d8cd98f00b204e9800998ecf8427e",
+                    },
+                ],
+            },
+        )
+    return {"package": packages}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure locked repository lookups per second with a large lock file.")
+    parser.add_argument("--packages", type=int, default=1000, help="number of locked packages")
+    parser.add_argument("--repeat", type=int, default=3, help="times all packages are looked up")
+    args = parser.parse_args()
+
+    # avoid downloading the PyPI-Conda mapping
+    mapping.get_pypi_mapping = dict
+    from pdm.core import Core
+    from pdm.models.python import PythonInfo
+    from pdm_conda.environments import CondaEnvironment
+    from pdm_conda.models.repositories import LockedCondaRepository
+    from pdm_conda.models.requirements import parse_requirement
+
+    with TemporaryDirectory() as root:
+        project = Core().create_project(root)
+        project.pyproject._data.update(
+            {
+                "project": {"name": "benchmark", "version": "0.0.0", "requires-python": ">=3.10"},
+                "tool": {"pdm": {"conda": {"runner": "conda"}}},
+            },
+        )
+        project.pyproject.write(False)
+        project.python = PythonInfo.from_path(sys.executable)
+        environment = CondaEnvironment(project)
+
+        lockfile = make_lockfile(args.packages)
+        requirements = [parse_requirement(f"conda:{p['name']}") for p in lockfile["package"]]
+        elapsed = timeit.timeit(
+            lambda: LockedCondaRepository(make_lockfile(args.packages), project.sources, environment),
+            number=1,
+        )
+        print(f"read lock file: {elapsed:.3f}s")
+        repository = LockedCondaRepository(lockfile, project.sources, environment)
+
+        def find_all():
+            for req in requirements:
+                list(repository.find_candidates(req))
+
+        elapsed = min(timeit.repeat(find_all, number=1, repeat=args.repeat))
+        print(f"find_candidates: {len(requirements) / elapsed:,.0f} lookups/s")
@@ -15,6 +15,7 @@ def main(core: Core):
     from pdm_conda import hooks, utils
     from pdm_conda.cli import utils as cli_utils
     from pdm_conda.cli.commands.add import Command as AddCommand
+    from pdm_conda.cli.commands.conda import Command as CondaCommand
     from pdm_conda.cli.commands.init import Command as InitCommand
     from pdm_conda.cli.commands.install import Command as InstallCommand
     from pdm_conda.cli.commands.list import Command as ListCommand
@@ -34,6 +35,7 @@ def main(core: Core):
 
     for cmd in [
         AddCommand,
+        CondaCommand,
         InitCommand,
         InstallCommand,
         ListCommand,
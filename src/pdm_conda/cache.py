@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import NamedTemporaryFile, mkdtemp
+from typing import TYPE_CHECKING
+
+from pdm_conda import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable
+    from typing import Any
+
+
+def repodata_fingerprint(pkgs_dirs: Iterable[Path]) -> str:
+    """Fingerprint of the channels repodata cached by Conda, it changes every time Conda refreshes any repodata.
+
+    :param pkgs_dirs: Conda packages directories
+    :return: fingerprint
+    """
+    stats = []
+    for pkgs_dir in pkgs_dirs:
+        cache_dir = Path(pkgs_dir) / "cache"
+        if not cache_dir.is_dir():
+            continue
+        for path in sorted(cache_dir.glob("*.json")):
+            with contextlib.suppress(OSError):
+                stat = path.stat()
+                stats.append(f"{path}:{stat.st_size}:{stat.st_mtime_ns}")
+    return hashlib.sha256("\n".join(stats).encode()).hexdigest()
+
+
+class FileCache:
+    """Directory of JSON entries, each entry is valid only while its fingerprint doesn't change and, if a TTL is
+    given, while it isn't expired.
+
+    When a max number of entries is given the least recently used entries are evicted.
+    """
+
+    def __init__(self, path: Path, ttl: int | None = None, max_entries: int | None = None) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Create cache key from parts.
+
+        :param parts: JSON serializable parts identifying the entry
+        :return: cache key
+        """
+        return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / f"{key}.json"
+
+    def get(self, key: str, fingerprint: str = "") -> Any | None:
+        """Get cached value if exists, fingerprint matches and it isn't expired.
+
+        :param key: cache key
+        :param fingerprint: expected fingerprint
+        :return: cached value or None
+        """
+        path = self._entry_path(key)
+        try:
+            with path.open() as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("fingerprint") != fingerprint:
+            return None
+        if self.ttl is not None and entry.get("created", 0) + self.ttl < time.time():
+            logger.debug(f"Cache entry {key} in {self.path} expired")
+            path.unlink(missing_ok=True)
+            return None
+        logger.debug(f"Cache hit for {key} in {self.path}")
+        # update access time for LRU eviction
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return entry.get("value")
+
+    def set(self, key: str, value: Any, fingerprint: str = ""):
+        """Atomically save value in cache.
+
+        :param key: cache key
+        :param value: JSON serializable value
+        :param fingerprint: fingerprint to validate the entry
+        """
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            with NamedTemporaryFile("w", dir=self.path, suffix=".tmp", delete=False) as f:
+                json.dump({"fingerprint": fingerprint, "created": time.time(), "value": value}, f)
+        except OSError as e:
+            logger.debug(f"Unable to write cache entry {key} in {self.path}: {e}")
+            return
+        tmp_path = Path(f.name)
+        try:
+            tmp_path.replace(self._entry_path(key))
+        except OSError as e:
+            logger.debug(f"Unable to write cache entry {key} in {self.path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+        self.evict()
+
+    def evict(self):
+        """Remove the least recently used entries exceeding the max number of entries."""
+        if self.max_entries is None:
+            return
+        entries = []
+        for path in self.path.glob("*.json"):
+            with contextlib.suppress(OSError):
+                entries.append((path.stat().st_mtime, path))
+        for _, path in sorted(entries, reverse=True)[self.max_entries :]:
+            logger.debug(f"Evicting cache entry {path}")
+            path.unlink(missing_ok=True)
+
+
+@dataclass(frozen=True)
+class StoredPackage:
+    digest: str
+    path: Path
+    size: int
+    last_used: float
+
+
+def _directory_size(path: Path) -> int:
+    size = 0
+    for root, _, files in os.walk(path):
+        for file in files:
+            with contextlib.suppress(OSError):
+                size += (Path(root) / file).lstat().st_size
+    return size
+
+
+class PackageStore:
+    """Content-addressed store of extracted Conda packages shared by all environments, each package is extracted once
+    into a directory named after its hash and hard-linked into the environments.
+
+    Environments keep their hard links when a package is evicted, so when a max size is given the least recently used
+    packages are evicted.
+    """
+
+    def __init__(self, path: Path, max_size: int | None = None) -> None:
+        self.path = path
+        self.max_size = max_size
+
+    def _entry_path(self, digest: str) -> Path:
+        return self.path / digest
+
+    def get(self, digest: str) -> Path | None:
+        """Get stored package and mark it as used.
+
+        :param digest: package hash
+        :return: extracted package directory or None if not stored
+        """
+        entry = self._entry_path(digest)
+        try:
+            (package,) = entry.iterdir()
+        except (OSError, ValueError):
+            return None
+        # update access time for LRU eviction
+        with contextlib.suppress(OSError):
+            os.utime(entry)
+        return package
+
+    def staging_dir(self) -> Path:
+        """Create directory to extract a package into before adding it to the store.
+
+        :return: staging directory in the store filesystem
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        return Path(mkdtemp(dir=self.path, prefix=".staging-"))
+
+    def add(self, digest: str, staging: Path) -> Path:
+        """Atomically move extracted package into the store, if it was stored meanwhile the staged one is discarded.
+
+        :param digest: package hash
+        :param staging: staging directory containing only the extracted package directory
+        :return: stored package directory
+        """
+        try:
+            staging.replace(self._entry_path(digest))
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            if (package := self.get(digest)) is None:
+                raise
+            return package
+        return self.get(digest)  # type: ignore[return-value]
+
+    def packages(self) -> list[StoredPackage]:
+        """Stored packages, most recently used first.
+
+        :return: stored packages
+        """
+        packages = []
+        if not self.path.is_dir():
+            return packages
+        for entry in self.path.iterdir():
+            if entry.name.startswith("."):
+                continue
+            with contextlib.suppress(OSError, ValueError):
+                (package,) = entry.iterdir()
+                packages.append(StoredPackage(entry.name, package, _directory_size(entry), entry.stat().st_mtime))
+        return sorted(packages, key=lambda p: p.last_used, reverse=True)
+
+    def remove(self, package: StoredPackage):
+        logger.debug(f"Removing {package.path.name} from package store {self.path}")
+        shutil.rmtree(package.path.parent, ignore_errors=True)
+
+    def evict(self, max_size: int | None = None, keep: Collection[str] = ()) -> list[StoredPackage]:
+        """Remove the least recently used packages exceeding the max size.
+
+        :param max_size: max size in bytes, the store max size if not given
+        :param keep: hashes of packages to never evict
+        :return: removed packages
+        """
+        if max_size is None and (max_size := self.max_size) is None:
+            return []
+        removed = []
+        size = 0
+        for package in self.packages():
+            size += package.size
+            if size > max_size and package.digest not in keep:
+                self.remove(package)
+                removed.append(package)
+                size -= package.size
+        return removed
+
+    def clear(self) -> list[StoredPackage]:
+        """Remove all stored packages and leftover staging directories.
+
+        :return: removed packages
+        """
+        removed = self.packages()
+        for package in removed:
+            self.remove(package)
+        for staging in self.path.glob(".staging-*"):
+            shutil.rmtree(staging, ignore_errors=True)
+        return removed
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from fnmatch import fnmatch
+from typing import TYPE_CHECKING, cast
+
+from pdm.cli.commands.base import BaseCommand
+from pdm.cli.commands.cache import format_size
+from pdm.cli.options import verbose_option
+from pdm.termui import Verbosity
+
+from pdm_conda.installers.linker import package_store
+from pdm_conda.project import CondaProject
+
+if TYPE_CHECKING:
+    import argparse
+
+    from pdm_conda.cache import StoredPackage
+    from pdm_conda.project import Project
+
+
+class Command(BaseCommand):
+    """Manage pdm-conda"""
+
+    name = "conda"
+    arguments = (verbose_option,)
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        subparsers = parser.add_subparsers(title="commands", metavar="")
+        CacheCommand.register_to(subparsers, "cache")
+        parser.set_defaults(search_parent=False)
+        self.parser = parser
+
+    def handle(self, project: Project, options: argparse.Namespace) -> None:
+        self.parser.print_help()
+
+
+class CacheCommand(BaseCommand):
+    """Control the package store shared by all environments"""
+
+    arguments = (verbose_option,)
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        subparsers = parser.add_subparsers(title="commands", metavar="")
+        InfoCommand.register_to(subparsers, "info")
+        ListCommand.register_to(subparsers, "list")
+        PruneCommand.register_to(subparsers, "prune")
+        ClearCommand.register_to(subparsers, "clear")
+        self.parser = parser
+
+    def handle(self, project: Project, options: argparse.Namespace) -> None:
+        self.parser.print_help()
+
+
+def _echo_removed(project: Project, removed: list[StoredPackage]):
+    for package in removed:
+        project.core.ui.echo(f"Removed {package.path.name}", verbosity=Verbosity.DETAIL)
+    size = format_size(sum(p.size for p in removed))
+    project.core.ui.echo(f"{len(removed)} package{'s' if len(removed) != 1 else ''} removed, {size} freed")
+
+
+class InfoCommand(BaseCommand):
+    """Show the location and current size of the package store"""
+
+    arguments = (verbose_option,)
+
+    def handle(self, project: Project, options: argparse.Namespace) -> None:
+        store = package_store(cast(CondaProject, project))
+        with project.core.ui.open_spinner("Calculating package store size"):
+            packages = store.packages()
+        project.core.ui.echo(
+            "\n".join(
+                [
+                    f"[primary]Package Store[/]: {store.path}",
+                    f"  Packages: {len(packages)}, Size: {format_size(sum(p.size for p in packages))}, "
+                    f"Max size: {format_size(store.max_size or 0)}",
+                ],
+            ),
+        )
+
+
+class ListCommand(BaseCommand):
+    """List the packages in the package store, most recently used first"""
+
+    arguments = (verbose_option,)
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument("pattern", nargs="?", default="*", help="The pattern to list")
+
+    def handle(self, project: Project, options: argparse.Namespace) -> None:
+        store = package_store(cast(CondaProject, project))
+        rows = [
+            (format_size(package.size), package.path.name, package.digest)
+            for package in store.packages()
+            if fnmatch(package.path.name, options.pattern)
+        ]
+        project.core.ui.display_columns(rows, [">Size", "Package", "Hash"])
+
+
+class PruneCommand(BaseCommand):
+    """Remove the least recently used packages exceeding the package store max size"""
+
+    arguments = (verbose_option,)
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument("--max-size", type=int, help="Max size in MB, defaults to `conda.package-store.max-size`")
+
+    def handle(self, project: Project, options: argparse.Namespace) -> None:
+        store = package_store(cast(CondaProject, project))
+        max_size = None if options.max_size is None else options.max_size * 1000 * 1000
+        with project.core.ui.open_spinner("Pruning package store"):
+            removed = store.evict(max_size)
+        _echo_removed(project, removed)
+
+
+class ClearCommand(BaseCommand):
+    """Remove all the packages in the package store"""
+
+    arguments = (verbose_option,)
+
+    def handle(self, project: Project, options: argparse.Namespace) -> None:
+        store = package_store(cast(CondaProject, project))
+        with project.core.ui.open_spinner("Clearing package store"):
+            removed = store.clear()
+        _echo_removed(project, removed)
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import hashlib
 import json
 import os
 import re
 import subprocess
-from functools import cache
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
 from pathlib import Path
 from shutil import which
-from tempfile import TemporaryDirectory, gettempdir
+from tempfile import NamedTemporaryFile, TemporaryDirectory, gettempdir
 from typing import TYPE_CHECKING
 
+import httpx
 from pdm.cli.commands.venv.backends import VirtualenvCreateError
 from pdm.exceptions import InstallationError, PdmException, RequirementError, UninstallError
 from pdm.models.finder import ReverseVersion
@@ -18,16 +23,20 @@ from pdm.models.setup import Setup
 from pdm.termui import Verbosity
 
 from pdm_conda import logger
+from pdm_conda.cache import FileCache, repodata_fingerprint
 from pdm_conda.models.candidates import CondaCandidate, parse_channel
 from pdm_conda.models.conda import ChannelSorter
 from pdm_conda.models.config import CondaRunner, PluginConfig
 from pdm_conda.models.requirements import CondaRequirement, parse_conda_version, parse_requirement
 from pdm_conda.models.setup import CondaSetupDistribution
-from pdm_conda.utils import fix_path, normalize_name
+from pdm_conda.repodata import repodata_search
+from pdm_conda.utils import fix_path, get_python_dir, normalize_name
+from pdm_conda.worker import CondaWorker, is_worker_command
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Awaitable, Iterable
 
+    from pdm_conda.models.candidates import CondaPackageRecord
     from pdm_conda.project import CondaProject
 
 _conda_response_packages_res = [
@@ -74,48 +83,48 @@ def _optional_temporary_file(environment: dict | list):
         yield
 
 
-def run_conda(
-    cmd,
-    exception_cls: type[PdmException] = CondaExecutionError,
-    exception_msg: str = "Error locking dependencies",
-    env: dict | None = None,
-    **environment,
+def _write_environment(f, environment: dict) -> list[str]:
+    """Write environment or lockfile data to file.
+
+    :param f: temporary file or None
+    :param environment: environment or lockfile data
+    :return: extra command args
+    """
+    if not environment:
+        return []
+    if lockfile := environment.get("lockfile", []):
+        f.write("\n".join(lockfile))
+    else:
+        for name, options in environment.items():
+            if options:
+                f.write(f"{name}:")
+                if isinstance(options, str):
+                    f.write(f" {options}\n")
+                    continue
+
+                f.write("\n")
+                for v in options:
+                    f.write(f"  - {v}\n")
+    f.seek(0)
+    return ["--file", f.name]
+
+
+def _parse_response(
+    cmd: list[str],
+    process: subprocess.CompletedProcess,
+    exception_cls: type[PdmException],
+    exception_msg: str,
+    environment: dict,
 ) -> dict:
-    """Optionally creates temporary environment file and run conda command.
+    """Parse conda command response raising exception on error.
 
     :param cmd: conda command
+    :param process: completed process
     :param exception_cls: exception to raise on error
     :param exception_msg: base message to show on error
-    :param env: environment variables to use for conda
     :param environment: environment or lockfile data
     :return: conda command response
     """
-    executable = which(cmd[0])
-    if executable is None:
-        raise CondaRunnerNotFoundError(f"Conda runner {cmd[0]} not found.")
-
-    lockfile = environment.get("lockfile", [])
-    with _optional_temporary_file(lockfile or environment) as f:
-        if lockfile or environment:
-            if lockfile:
-                f.write("\n".join(lockfile))
-            elif environment:
-                for name, options in environment.items():
-                    if options:
-                        f.write(f"{name}:")
-                        if isinstance(options, str):
-                            f.write(f" {options}\n")
-                            continue
-
-                        f.write("\n")
-                        for v in options:
-                            f.write(f"  - {v}\n")
-            f.seek(0)
-            cmd += ["--file", f.name]
-        logger.debug(f"cmd: {' '.join(cmd)}")
-        if environment:
-            logger.debug(f"env: {environment}")
-        process = subprocess.run(cmd, capture_output=True, encoding="utf-8", env=env)
     if "--json" in cmd:
         try:
             out = process.stdout.strip()
@@ -159,6 +168,130 @@ def run_conda(
     return response
 
 
+def _check_runner(cmd: list[str]):
+    if which(cmd[0]) is None:
+        raise CondaRunnerNotFoundError(f"Conda runner {cmd[0]} not found.")
+
+
+def run_conda(
+    cmd,
+    exception_cls: type[PdmException] = CondaExecutionError,
+    exception_msg: str = "Error locking dependencies",
+    env: dict | None = None,
+    worker: bool = False,
+    **environment,
+) -> dict:
+    """Optionally creates temporary environment file and run conda command.
+
+    :param cmd: conda command
+    :param exception_cls: exception to raise on error
+    :param exception_msg: base message to show on error
+    :param env: environment variables to use for conda
+    :param worker: if True try to run the command in a persistent Conda worker
+    :param environment: environment or lockfile data
+    :return: conda command response
+    """
+    _check_runner(cmd)
+    with _optional_temporary_file(environment.get("lockfile", []) or environment) as f:
+        cmd += _write_environment(f, environment)
+        logger.debug(f"cmd: {' '.join(cmd)}")
+        if environment:
+            logger.debug(f"env: {environment}")
+        process = None
+        if worker and is_worker_command(cmd, environment) and (conda_worker := CondaWorker.get(cmd[0])) is not None:
+            process = conda_worker.run(cmd, env)
+        if process is None:
+            process = subprocess.run(cmd, capture_output=True, encoding="utf-8", env=env)
+    return _parse_response(cmd, process, exception_cls, exception_msg, environment)
+
+
+class _AsyncRunner:
+    """Event loop running in a background thread, conda commands submitted from any thread run there concurrently up
+    to a max number of processes."""
+
+    def __init__(self, max_concurrency: int = 4) -> None:
+        self.max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="pdm-conda-runner", daemon=True).start()
+            return self._loop
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        with self._lock:
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            return self._semaphore
+
+    def set_max_concurrency(self, max_concurrency: int):
+        with self._lock:
+            if max_concurrency != self.max_concurrency:
+                self.max_concurrency = max_concurrency
+                self._semaphore = None
+
+    def run(self, calls: Iterable[Awaitable[dict]]) -> list[dict]:
+        async def gather():
+            return await asyncio.gather(*calls)
+
+        return asyncio.run_coroutine_threadsafe(gather(), self.loop).result()
+
+
+_async_runner = _AsyncRunner()
+
+
+async def run_conda_async(
+    cmd,
+    exception_cls: type[PdmException] = CondaExecutionError,
+    exception_msg: str = "Error locking dependencies",
+    env: dict | None = None,
+    **environment,
+) -> dict:
+    """Async version of `run_conda`, the number of concurrent conda processes is limited.
+
+    :param cmd: conda command
+    :param exception_cls: exception to raise on error
+    :param exception_msg: base message to show on error
+    :param env: environment variables to use for conda
+    :param environment: environment or lockfile data
+    :return: conda command response
+    """
+    _check_runner(cmd)
+    async with _async_runner.semaphore:
+        with _optional_temporary_file(environment.get("lockfile", []) or environment) as f:
+            cmd += _write_environment(f, environment)
+            logger.debug(f"cmd: {' '.join(cmd)}")
+            if environment:
+                logger.debug(f"env: {environment}")
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=env,
+            )
+            stdout, stderr = await proc.communicate()
+    process = subprocess.CompletedProcess(cmd, proc.returncode, stdout.decode(), stderr.decode())
+    return _parse_response(cmd, process, exception_cls, exception_msg, environment)
+
+
+def run_conda_concurrently(*calls: Awaitable[dict], max_concurrency: int | None = None) -> list[dict]:
+    """Run conda commands concurrently and wait for them, can be called from any thread.
+
+    :param calls: `run_conda_async` calls
+    :param max_concurrency: max number of concurrent conda processes
+    :return: conda commands responses in the same order
+    """
+    if max_concurrency is not None:
+        _async_runner.set_max_concurrency(max_concurrency)
+    return _async_runner.run(calls)
+
+
 @cache
 def _get_channel_sorter(platform: str, channels: tuple[str]) -> ChannelSorter:
     """Get channel sorter.
@@ -174,6 +307,7 @@ def sort_candidates(
     project: CondaProject,
     packages: list[CondaCandidate],
     minimal_version: bool,
+    sort_keys: dict[tuple[CondaPackageRecord, bool], tuple] | None = None,
 ) -> Iterable[CondaCandidate]:
     """
     Sort candidates following mamba specification
@@ -181,20 +315,26 @@ def sort_candidates(
 
     :param project: PDM project
     :param packages: list of conda candidates
+    :param minimal_version: if True prefer lower versions
+    :param sort_keys: sort keys cache by package record, reused between calls for the same packages
     :return: sorted conda candidates
     """
     if len(packages) <= 1:
         return packages
     channels_sorter = _get_channel_sorter(project.platform, tuple(project.conda_config.channels))
+    if sort_keys is None:
+        sort_keys = {}
 
     def get_preference(candidate: CondaCandidate):
-        return (
-            not candidate.track_feature,
-            ReverseVersion(candidate.version) if minimal_version else candidate.version,
-            candidate.build_number,
-            -channels_sorter.get_priority(candidate.channel or ""),
-            candidate.timestamp,
-        )
+        if (preference := sort_keys.get(key := (candidate.record, minimal_version))) is None:
+            preference = sort_keys[key] = (
+                not candidate.track_feature,
+                ReverseVersion(candidate.version) if minimal_version else candidate.version,
+                candidate.build_number,
+                -channels_sorter.get_priority(candidate.channel or ""),
+                candidate.timestamp,
+            )
+        return preference
 
     return sorted(packages, key=get_preference, reverse=True)
 
@@ -243,9 +383,8 @@ def _ensure_channels(
     return list(dict.fromkeys(channels))
 
 
-@cache
-def _conda_search(project: CondaProject, requirement: str, channels: tuple[str], use_cache: bool = False) -> list[dict]:
-    """Search conda candidates for a requirement.
+def _run_conda_search(project: CondaProject, requirement: str, channels: tuple[str], use_cache: bool) -> list[dict]:
+    """Search conda candidates for a requirement running conda.
 
     :param project: PDM project
     :param requirement: requirement
@@ -266,7 +405,7 @@ def _conda_search(project: CondaProject, requirement: str, channels: tuple[str],
         command.append("-C")
         command.append("--offline")
     try:
-        result = run_conda(command)
+        result = run_conda(command, worker=config.worker)
     except RequirementError as e:
         if "PackagesNotFoundError:" in str(e):
             result = {}
@@ -274,9 +413,44 @@ def _conda_search(project: CondaProject, requirement: str, channels: tuple[str],
             raise
 
     if config.runner == CondaRunner.CONDA:
-        packages = result.get(parse_requirement(f"conda:{requirement}").name, [])
-    else:
-        packages = result.get("result", {}).get("pkgs", [])
+        return result.get(parse_requirement(f"conda:{requirement}").name, [])
+    return result.get("result", {}).get("pkgs", [])
+
+
+@cache
+def _conda_search(project: CondaProject, requirement: str, channels: tuple[str], use_cache: bool = False) -> list[dict]:
+    """Search conda candidates for a requirement, first in the persistent search cache, then in the repodata cached
+    by Conda and as fallback running conda.
+
+    :param project: PDM project
+    :param requirement: requirement
+    :param channels: requirement channels
+    :param use_cache: whether to use cache flag
+    :return: list of conda candidates
+    """
+    config = project.conda_config
+    search_cache = None
+    if config.search_cache_active:
+        search_cache = FileCache(config.search_cache_path, config.search_cache_ttl)
+        key = search_cache.make_key(config.runner, requirement, channels, project.platform, use_cache)
+        if (packages := search_cache.get(key, repodata_fingerprint(project.pkgs_dirs))) is not None:
+            return packages
+
+    packages = None
+    if config.repodata_active:
+        packages = repodata_search(
+            project.pkgs_dirs,
+            config.repodata_index_path,
+            project.platform,
+            parse_requirement(f"conda:{requirement}"),
+            channels,
+            config.repodata_max_age,
+        )
+    if packages is None:
+        packages = _run_conda_search(project, requirement, channels, use_cache)
+    if search_cache is not None:
+        # conda may have refreshed the repodata while searching
+        search_cache.set(key, packages, repodata_fingerprint(project.pkgs_dirs))
     return packages
 
 
@@ -372,15 +546,40 @@ def conda_create(
             command.extend(["-c", c])
         command.append("--override-channels")
 
-    try:
-        result = run_conda(
-            command,
-            exception_cls=CondaResolutionError if dry_run else VirtualenvCreateError,
-            exception_msg=(
-                f"Error resolving requirements with {config.runner}" if dry_run else "Error creating environment"
-            ),
-            env=env,
+    solver_cache = key = None
+    if dry_run and config.solver_cache_active:
+        solver_cache = FileCache(config.solver_cache_path, config.solver_cache_ttl, config.solver_cache_max_entries)
+        key = solver_cache.make_key(
+            config.runner,
+            config.solver,
+            [c for c in command if prefix is None or c != str(fix_path(prefix))],
+            project.platform,
+            sorted(str(p) for p in project.virtual_packages),
         )
+    pkgs_dirs = [Path(env["CONDA_PKGS_DIRS"])] if dry_run else []
+
+    try:
+        if solver_cache is not None and (actions := solver_cache.get(key, repodata_fingerprint(pkgs_dirs))):
+            result = {"actions": actions}
+        else:
+            result = run_conda(
+                command,
+                exception_cls=CondaResolutionError if dry_run else VirtualenvCreateError,
+                exception_msg=(
+                    f"Error resolving requirements with {config.runner}" if dry_run else "Error creating environment"
+                ),
+                env=env,
+                worker=config.worker,
+            )
+            if solver_cache is not None:
+                actions = result.get("actions", {})
+                solver_cache.set(
+                    key,
+                    {k: actions.get(k, []) for k in ("FETCH", "LINK")},
+                    repodata_fingerprint(pkgs_dirs),
+                )
+            if not dry_run:
+                project._conda_probes.clear()
         if fetch_candidates:
             actions = result.get("actions", {})
             fetch_packages = {pkg["name"]: pkg for pkg in actions.get("FETCH", [])}
@@ -445,19 +644,33 @@ def conda_env_remove(project: CondaProject, prefix: Path | str | None = None, na
         command.append("--dry-run")
 
     run_conda(command, exception_cls=VirtualenvCreateError, exception_msg="Error removing environment")
+    if not dry_run:
+        project._conda_probes.clear()
+
+
+def _env_list_command(config: PluginConfig) -> list[str]:
+    return config.command("env list", use_project_env=False) + ["--json"]
 
 
 @PluginConfig.check_active
 def conda_env_list(project: CondaProject) -> list[Path]:
-    """List Conda environments.
+    """List Conda environments, if the base environment path is unknown it's obtained concurrently.
 
     :param project: PDM project
     :return: list of conda environments
     """
     config = project.conda_config
-    command = config.command("env list", use_project_env=False)
-    command.append("--json")
-    environments = run_conda(command, exception_cls=CondaExecutionError, exception_msg="Error listing environments")
+    list_kwargs: dict = {"exception_cls": CondaExecutionError, "exception_msg": "Error listing environments"}
+    if project._base_env is None and config.is_initialized:
+        env = {**os.environ}
+        environments, info = run_conda_concurrently(
+            run_conda_async(_env_list_command(config), env=env, **list_kwargs),
+            run_conda_async(_base_path_command(config), env=env),
+            max_concurrency=config.max_concurrency,
+        )
+        project._base_env = _parse_base_path(info)
+    else:
+        environments = run_conda(_env_list_command(config), **list_kwargs)
     return [fix_path(env) for env in environments.get("envs", [])]
 
 
@@ -512,6 +725,8 @@ def conda_install(
         command.append(f"--{_copy}")
 
     _conda_install(command, packages, dry_run=dry_run, explicit=True)
+    if not dry_run:
+        _invalidate_packages(project)
 
 
 @PluginConfig.check_active
@@ -537,6 +752,105 @@ def conda_uninstall(
         command.append("--force")
 
     _conda_install(command, packages, dry_run=dry_run, exception_cls=UninstallError)
+    if not dry_run:
+        _invalidate_packages(project)
+
+
+PREFETCH_WORKERS = 8
+PREFETCH_CHUNK_SIZE = 1 << 20
+_urls_lock = threading.Lock()
+
+
+def _file_md5(path: Path) -> str:
+    md5 = hashlib.md5(usedforsecurity=False)
+    with path.open("rb") as f:
+        while chunk := f.read(PREFETCH_CHUNK_SIZE):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def _add_cache_url(pkgs_dir: Path, url: str):
+    """Register package url in the packages cache `urls.txt`, so Conda knows where the package comes from.
+
+    :param pkgs_dir: Conda packages directory
+    :param url: package url
+    """
+    urls_file = pkgs_dir / "urls.txt"
+    with _urls_lock:
+        if urls_file.exists() and url in urls_file.read_text().splitlines():
+            return
+        with urls_file.open("a") as f:
+            f.write(f"{url}\n")
+
+
+def download_package(client: httpx.Client, pkgs_dir: Path, package: str) -> Path:
+    """Download package into the packages cache unless it's already there and verify its md5.
+
+    :param client: HTTP client
+    :param pkgs_dir: Conda packages directory
+    :param package: package url with its md5 as fragment
+    :return: package path
+    """
+    url, _, md5 = package.partition("#")
+    path = pkgs_dir / url.rsplit("/", maxsplit=1)[-1]
+    if path.is_file() and (not md5 or _file_md5(path) == md5):
+        return path
+
+    with NamedTemporaryFile("wb", dir=pkgs_dir, prefix=f".{path.name}.", delete=False) as f:
+        tmp_path = Path(f.name)
+        try:
+            with client.stream("GET", url) as response:
+                response.raise_for_status()
+                file_md5 = hashlib.md5(usedforsecurity=False)
+                for chunk in response.iter_bytes(PREFETCH_CHUNK_SIZE):
+                    file_md5.update(chunk)
+                    f.write(chunk)
+            if md5 and file_md5.hexdigest() != md5:
+                raise InstallationError(f"Downloaded {url} md5 {file_md5.hexdigest()} doesn't match {md5}")
+        except BaseException:
+            f.close()
+            tmp_path.unlink()
+            raise
+    tmp_path.replace(path)
+    _add_cache_url(pkgs_dir, url)
+    return path
+
+
+def _prefetch_package(client: httpx.Client, pkgs_dir: Path, package: str) -> Path | None:
+    try:
+        return download_package(client, pkgs_dir, package)
+    except httpx.HTTPError as e:
+        # Conda will try to download it again
+        logger.info(f"Unable to prefetch {package.partition('#')[0]}: {e}")
+        return None
+
+
+def writable_pkgs_dir(project: CondaProject) -> Path | None:
+    """First writable Conda packages directory.
+
+    :param project: PDM project
+    :return: packages directory or None if no one is writable
+    """
+    return next((p for p in project.pkgs_dirs if p.is_dir() and os.access(p, os.W_OK)), None)
+
+
+def conda_prefetch(project: CondaProject, packages: list[str]) -> list[Path]:
+    """Download packages concurrently into the first writable Conda packages cache and verify their md5, so they
+    are linked without downloading them when installed.
+
+    :param project: PDM project
+    :param packages: packages urls with their md5 as fragment
+    :return: downloaded packages paths
+    """
+    pkgs_dir = writable_pkgs_dir(project)
+    if pkgs_dir is None or not packages:
+        return []
+    with (
+        httpx.Client(follow_redirects=True) as client,
+        ThreadPoolExecutor(min(PREFETCH_WORKERS, len(packages))) as executor,
+    ):
+        paths = executor.map(lambda package: _prefetch_package(client, pkgs_dir, package), packages)
+        return [p for p in paths if p is not None]
 
 
 def not_initialized_warning(project):
@@ -545,45 +859,209 @@ def not_initialized_warning(project):
     )
 
 
+def _parse_info(config: PluginConfig, info: dict) -> dict:
+    """Parse conda info command response.
+
+    :param config: plugin config
+    :param info: conda info response
+    :return: dict with conda info
+    """
+    if config.runner != CondaRunner.MICROMAMBA:
+        virtual_packages = {"=".join(p) for p in info["virtual_pkgs"]}
+    else:
+        virtual_packages = set(info["virtual packages"])
+
+    base_env = info.get("base environment", info.get("root_prefix"))
+    return {
+        "virtual_packages": {parse_requirement(f"conda:{p.replace('=', '==', 1)}") for p in virtual_packages},
+        "platform": info["platform"],
+        "channels": [parse_channel(channel) for channel in (info["channels"] or [])],
+        "pkgs_dirs": [fix_path(p) for p in (info.get("pkgs_dirs", info.get("package cache")) or [])],
+        "base_env": fix_path(base_env) if base_env else None,
+    }
+
+
+def _parse_packages(config: PluginConfig, packages: list[dict]) -> dict[str, CondaSetupDistribution]:
+    """Parse conda list command response.
+
+    :param config: plugin config
+    :param packages: conda list response
+    :return: packages distribution
+    """
+    distributions = {}
+    for package in packages:
+        if config.runner != CondaRunner.MICROMAMBA and package.get("platform", "") == "pypi":
+            continue
+        name, version = package["name"], package["version"]
+        distributions[normalize_name(name)] = CondaSetupDistribution(
+            Setup(
+                name=name,
+                summary="",
+                version=parse_conda_version(version),
+            ),
+            package=package,
+        )
+    return distributions
+
+
+@lru_cache(maxsize=8)
+def _read_conda_meta(conda_meta: Path, mtime_ns: int) -> list[dict] | None:
+    """Read installed packages records from environment `conda-meta` directory, cached while the directory is not
+    modified.
+
+    :param conda_meta: environment `conda-meta` directory
+    :param mtime_ns: directory modification time, used to invalidate cache
+    :return: packages in the same format as conda list or None if some record can't be read
+    """
+    packages = []
+    for path in conda_meta.glob("*.json"):
+        try:
+            with path.open() as f:
+                record = json.load(f)
+            subdir = record.get("subdir", "")
+            channel = parse_channel(record.get("channel", ""))
+            if subdir and channel.endswith(f"/{subdir}"):
+                channel = channel[: -len(subdir) - 1]
+            packages.append(
+                {
+                    "name": record["name"],
+                    "version": record["version"],
+                    "build_number": record.get("build_number", 0),
+                    "build_string": record.get("build", ""),
+                    "channel": channel,
+                    "platform": subdir,
+                    "url": record.get("url", ""),
+                    "md5": record.get("md5", ""),
+                },
+            )
+        except (OSError, ValueError, KeyError) as e:
+            logger.debug(f"Unable to read {path}: {e}")
+            return None
+    return packages
+
+
+def _conda_meta_packages(project: CondaProject) -> list[dict] | None:
+    """Installed packages read from project environment `conda-meta` directory.
+
+    :param project: PDM project
+    :return: packages in the same format as conda list or None if they can't be read
+    """
+    conda_meta = get_python_dir(fix_path(project.environment.interpreter.path)) / "conda-meta"
+    try:
+        mtime_ns = conda_meta.stat().st_mtime_ns
+    except OSError:
+        return None
+    return _read_conda_meta(conda_meta, mtime_ns)
+
+
+def _list_command(config: PluginConfig) -> list[str]:
+    return config.command("list") + ["--json"]
+
+
+def _probe_env(project: CondaProject, with_packages: bool = True) -> dict:
+    """Probe Conda environment getting conda info and, if requested, installed packages in one round trip, the result
+    is shared between project copies and installed packages are kept until Conda modifies an environment.
+
+    Installed packages are read from the environment `conda-meta` directory when possible, else listed with conda.
+
+    :param project: PDM project
+    :param with_packages: if false only conda info is probed, installed packages are probed when first requested
+    :return: dict with conda info and installed packages if requested
+    """
+    config = project.conda_config
+    list_cmd = _list_command(config)
+    list_kwargs: dict = {"exception_msg": "Error listing installed packages"}
+    key = " ".join(list_cmd)
+    meta_packages = _conda_meta_packages(project) if with_packages else None
+    if (probe := project._conda_probes.get(key)) is None:
+        info_cmd = config.command("info") + ["--json"]
+        if not with_packages or meta_packages is not None:
+            info, packages = run_conda(info_cmd, worker=config.worker), None
+        elif config.worker:
+            # worker runs commands sequentially but without startup costs
+            info = run_conda(info_cmd, worker=True)
+            try:
+                packages = run_conda(list_cmd, worker=True, **list_kwargs)
+            except CondaExecutionError:
+                packages = None
+        else:
+
+            async def list_packages():
+                # environment may not exist yet, errors are raised when packages are requested
+                with contextlib.suppress(CondaExecutionError):
+                    return await run_conda_async(list_cmd, env=env, **list_kwargs)
+                return None
+
+            env = {**os.environ}
+            info, packages = run_conda_concurrently(
+                run_conda_async(info_cmd, env=env),
+                list_packages(),
+                max_concurrency=config.max_concurrency,
+            )
+        probe = project._conda_probes[key] = {"info": _parse_info(config, info)}
+        if packages is not None:
+            probe["packages"] = _parse_packages(config, packages)
+    if not with_packages:
+        return probe
+    if meta_packages is not None:
+        # records are cached by directory mtime so they are the same object while environment is not modified
+        if "packages" not in probe or probe.get("meta_packages") is not meta_packages:
+            probe["meta_packages"] = meta_packages
+            probe["packages"] = _parse_packages(config, meta_packages)
+    elif "packages" not in probe or probe.pop("meta_packages", None) is not None:
+        probe["packages"] = _parse_packages(config, run_conda(list_cmd, worker=config.worker, **list_kwargs))
+    return probe
+
+
+def _invalidate_packages(project: CondaProject):
+    """Forget installed packages of probed environments after Conda modifies an environment.
+
+    :param project: PDM project
+    """
+    for probe in project._conda_probes.values():
+        probe.pop("packages", None)
+
+
 @PluginConfig.check_active
 def conda_info(project: CondaProject) -> dict:
-    """Get conda info containing virtual packages, default channels and packages.
+    """Get conda info containing virtual packages, platform, default channels, packages directories and base env.
 
     :param project: PDM project
     :return: dict with conda info
     """
     config = project.conda_config
-    res: dict = {"virtual_packages": set(), "platform": "", "channels": []}
+    res: dict = {"virtual_packages": set(), "platform": "", "channels": [], "pkgs_dirs": [], "base_env": None}
     if config.is_initialized:
-        cmd = config.command("info") + ["--json"]
-        info = run_conda(cmd)
-        if config.runner != CondaRunner.MICROMAMBA:
-            virtual_packages = {"=".join(p) for p in info["virtual_pkgs"]}
-        else:
-            virtual_packages = set(info["virtual packages"])
-
-        res["virtual_packages"] = {parse_requirement(f"conda:{p.replace('=', '==', 1)}") for p in virtual_packages}
-        res["platform"] = info["platform"]
-        res["channels"] = [parse_channel(channel) for channel in (info["channels"] or [])]
+        res = _probe_env(project, with_packages=False)["info"]
     else:
         not_initialized_warning(project)
     return res
 
 
+def _base_path_command(config: PluginConfig) -> list[str]:
+    cmd = config.command("info")
+    if config.runner == CondaRunner.MICROMAMBA:
+        cmd += ["-n", "base"]
+    else:
+        cmd.append("--base")
+    return cmd + ["--json"]
+
+
+def _parse_base_path(info: dict) -> Path:
+    return fix_path(info.get("base environment", info.get("root_prefix", Path())))
+
+
 @PluginConfig.check_active
 def conda_base_path(project: CondaProject) -> Path:
     """Get conda base environment path :param project: PDM project :return: Conda base environment path."""
     config = project.conda_config
     res = Path()
     if config.is_initialized:
-        cmd = config.command("info")
-        if config.runner == CondaRunner.MICROMAMBA:
-            cmd += ["-n", "base"]
+        # base env is known if any environment was probed
+        if base_envs := [p["info"]["base_env"] for p in project._conda_probes.values() if p["info"]["base_env"]]:
+            res = base_envs[0]
         else:
-            cmd.append("--base")
-        cmd += ["--json"]
-        info = run_conda(cmd)
-        res = fix_path(info.get("base environment", info.get("root_prefix", res)))
+            res = _parse_base_path(run_conda(_base_path_command(config), worker=config.worker))
     else:
         not_initialized_warning(project)
     return res
@@ -599,19 +1077,7 @@ def conda_list(project: CondaProject) -> dict[str, CondaSetupDistribution]:
     config = project.conda_config
     distributions = {}
     if config.is_initialized:
-        packages = run_conda(config.command("list") + ["--json"], exception_msg="Error listing installed packages")
-        for package in packages:
-            if config.runner != CondaRunner.MICROMAMBA and package.get("platform", "") == "pypi":
-                continue
-            name, version = package["name"], package["version"]
-            distributions[normalize_name(name)] = CondaSetupDistribution(
-                Setup(
-                    name=name,
-                    summary="",
-                    version=parse_conda_version(version),
-                ),
-                package=package,
-            )
+        distributions = dict(_probe_env(project)["packages"])
     else:
         not_initialized_warning(project)
     return distributions
@@ -31,6 +31,7 @@ class CondaEnvironment(PythonEnvironment):
         self._virtual_packages: set[CondaRequirement] | None = None
         self._platform: str | None = None
         self._default_channels: list[str] | None = None
+        self._pkgs_dirs: list[Path] | None = None
         self._base_env: Path | None = None
         self._env_dependencies: dict[str, Requirement] | None = None
 
@@ -49,6 +50,11 @@ class CondaEnvironment(PythonEnvironment):
         self._check_update_info(self._default_channels)
         return self._default_channels  # type: ignore
 
+    @property
+    def pkgs_dirs(self) -> list[Path]:
+        self._check_update_info(self._pkgs_dirs)
+        return self._pkgs_dirs  # type: ignore
+
     def _check_update_info(self, prop):
         if prop is None:
             self._get_conda_info()
@@ -58,6 +64,7 @@ class CondaEnvironment(PythonEnvironment):
         self._virtual_packages = info["virtual_packages"]
         self._platform = info["platform"]
         self._default_channels = info["channels"]
+        self._pkgs_dirs = info["pkgs_dirs"]
 
     def get_paths(self, dist_name: str | None = None) -> dict[str, str]:
         if self.project.conda_config.is_initialized:
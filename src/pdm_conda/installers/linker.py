@@ -0,0 +1,464 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tarfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from importlib.util import find_spec
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING
+
+import httpx
+from pdm.exceptions import InstallationError
+
+from pdm_conda import logger
+from pdm_conda.cache import PackageStore
+from pdm_conda.conda import PREFETCH_WORKERS, _add_cache_url, _invalidate_packages, download_package, writable_pkgs_dir
+from pdm_conda.utils import fix_path, get_python_dir
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from pdm_conda.project import CondaProject
+
+_TARBALL_EXTENSIONS = (".conda", ".tar.bz2")
+_ENTRY_POINT_TEMPLATE = """#!{python}
+# -*- coding: utf-8 -*-
+import re
+import sys
+
+from {module} import {import_name}
+
+if __name__ == "__main__":
+    sys.argv[0] = re.sub(r"(-script\\.pyw?|\\.exe)?$", "", sys.argv[0])
+    sys.exit({func}())
+"""
+
+
+class NativeInstallUnsupported(InstallationError):
+    """Packages can't be installed without Conda."""
+
+
+def _package_name(url: str) -> str:
+    """Package file name without extension.
+
+    :param url: package url
+    :return: package distribution name
+    """
+    filename = url.rsplit("/", maxsplit=1)[-1]
+    for ext in _TARBALL_EXTENSIONS:
+        if filename.endswith(ext):
+            return filename[: -len(ext)]
+    raise NativeInstallUnsupported(f"Unknown package format {filename}")
+
+
+def _extract_tar(fileobj, dest: Path):
+    with tarfile.open(fileobj=fileobj, mode="r|*") as tar:
+        if hasattr(tarfile, "tar_filter"):
+            tar.extractall(dest, filter="tar")
+        else:  # pragma: no cover
+            tar.extractall(dest)  # noqa: S202
+
+
+def _extract(tarball: Path, dest: Path):
+    """Extract package streaming its content.
+
+    :param tarball: package file
+    :param dest: destination directory
+    """
+    if tarball.name.endswith(".tar.bz2"):
+        with tarball.open("rb") as f:
+            _extract_tar(f, dest)
+        return
+    try:
+        import zstandard
+    except ImportError as e:
+        raise NativeInstallUnsupported("zstandard is required to extract .conda packages") from e
+
+    name = _package_name(tarball.name)
+    with zipfile.ZipFile(tarball) as zf:
+        for component in ("info", "pkg"):
+            with zf.open(f"{component}-{name}.tar.zst") as f, zstandard.ZstdDecompressor().stream_reader(f) as reader:
+                _extract_tar(reader, dest)
+
+
+def _extracted_package(pkgs_dirs: list[Path], url: str, md5: str) -> Path | None:
+    """Find package already extracted in some packages directory.
+
+    :param pkgs_dirs: Conda packages directories
+    :param url: package url
+    :param md5: package md5
+    :return: extracted package directory or None if not found
+    """
+    name = _package_name(url)
+    for pkgs_dir in pkgs_dirs:
+        record = pkgs_dir / name / "info" / "repodata_record.json"
+        with suppress(OSError, ValueError):
+            if json.loads(record.read_text()).get("md5") == md5:
+                return record.parents[1]
+    return None
+
+
+def _extract_package(tarball: Path, dest: Path, url: str, md5: str):
+    """Extract package and write its `repodata_record.json`.
+
+    :param tarball: package file
+    :param dest: extracted package directory
+    :param url: package url
+    :param md5: package md5
+    """
+    _extract(tarball, dest)
+    index = json.loads((dest / "info" / "index.json").read_text())
+    channel, _, _ = url.rpartition("/")
+    record = index | {"url": url, "md5": md5, "fn": tarball.name, "channel": channel}
+    (dest / "info" / "repodata_record.json").write_text(json.dumps(record, indent=2))
+
+
+def fetch_package(
+    client: httpx.Client,
+    pkgs_dirs: list[Path],
+    pkgs_dir: Path,
+    package: str,
+    store: PackageStore | None = None,
+) -> Path:
+    """Get package extracted directory, downloading and extracting it into the packages cache if needed.
+
+    :param client: HTTP client
+    :param pkgs_dirs: Conda packages directories to look for the extracted package
+    :param pkgs_dir: writable Conda packages directory
+    :param package: package url with its md5 as fragment
+    :param store: package store to extract the package into instead of the packages cache
+    :return: extracted package directory
+    """
+    url, _, md5 = package.partition("#")
+    if store is not None and md5:
+        if (extracted := store.get(md5)) is not None:
+            return extracted
+        tarball = download_package(client, pkgs_dir, package)
+        staging = store.staging_dir()
+        try:
+            _extract_package(tarball, staging / _package_name(url), url, md5)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        return store.add(md5, staging)
+
+    if md5 and (extracted := _extracted_package(pkgs_dirs, url, md5)) is not None:
+        return extracted
+
+    tarball = download_package(client, pkgs_dir, package)
+    extracted = pkgs_dir / _package_name(url)
+    with TemporaryDirectory(dir=pkgs_dir, prefix=f".{extracted.name}.") as tmp:
+        tmp_dir = Path(tmp) / extracted.name
+        _extract_package(tarball, tmp_dir, url, md5)
+        shutil.rmtree(extracted, ignore_errors=True)
+        tmp_dir.replace(extracted)
+    _add_cache_url(pkgs_dir, url)
+    return extracted
+
+
+def binary_replace(data: bytes, placeholder: bytes, prefix: bytes) -> bytes:
+    """Replace placeholder in null terminated strings keeping the data length.
+
+    :param data: file content
+    :param placeholder: prefix placeholder
+    :param prefix: environment prefix
+    :return: replaced content
+    """
+
+    def replace(match: re.Match) -> bytes:
+        occurrences = match.group().count(placeholder)
+        padding = (len(placeholder) - len(prefix)) * occurrences
+        if padding < 0:
+            raise InstallationError(f"Environment prefix {prefix.decode()} is longer than the package placeholder")
+        return match.group().replace(placeholder, prefix) + b"\0" * padding
+
+    return re.sub(re.escape(placeholder) + rb"([^\0]*?)\0", replace, data)
+
+
+def _package_paths(extracted: Path) -> list[dict]:
+    """Package paths in `paths.json` format.
+
+    :param extracted: extracted package directory
+    :return: package paths
+    """
+    info = extracted / "info"
+    if (paths_json := info / "paths.json").exists():
+        return json.loads(paths_json.read_text())["paths"]
+
+    # legacy packages list their files and files with prefix separately
+    placeholders = {}
+    if (has_prefix := info / "has_prefix").exists():
+        for line in has_prefix.read_text().splitlines():
+            placeholder, file_mode, path = line.split(" ", maxsplit=2)
+            placeholders[path] = {"prefix_placeholder": placeholder, "file_mode": file_mode}
+    no_link = set((info / "no_link").read_text().splitlines()) if (info / "no_link").exists() else set()
+    return [
+        {"_path": path, "path_type": "hardlink", "no_link": path in no_link, **placeholders.get(path, {})}
+        for path in (info / "files").read_text().splitlines()
+        if path
+    ]
+
+
+class _Target:
+    """Map package paths into the environment."""
+
+    def __init__(self, prefix: Path, python_version: str, noarch_python: bool) -> None:
+        self.prefix = prefix
+        self.noarch_python = noarch_python
+        if sys.platform == "win32":
+            self.site_packages = "Lib/site-packages"
+            self.scripts = "Scripts"
+        else:
+            self.site_packages = f"lib/python{python_version}/site-packages"
+            self.scripts = "bin"
+
+    def path(self, path: str) -> str:
+        if self.noarch_python:
+            if path.startswith("site-packages/"):
+                return f"{self.site_packages}/{path[len('site-packages/') :]}"
+            if path.startswith("python-scripts/"):
+                return f"{self.scripts}/{path[len('python-scripts/') :]}"
+        return path
+
+
+def _link_file(source: Path, destination: Path, path_data: dict, prefix: str, copy: bool) -> dict:
+    """Link or copy file into the environment replacing its prefix placeholder.
+
+    :param source: extracted package file
+    :param destination: environment file
+    :param path_data: file data from `paths.json`
+    :param prefix: environment prefix
+    :param copy: if true copy instead of hard-linking
+    :return: linked file data
+    """
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    path_type = path_data.get("path_type", "hardlink")
+    if path_type == "directory":
+        destination.mkdir(exist_ok=True)
+        return {"_path": path_data["_path"], "path_type": path_type}
+    if destination.is_symlink() or destination.is_file():
+        destination.unlink()
+    elif destination.exists():
+        raise InstallationError(f"Can't link {path_data['_path']}, {destination} is a directory")
+    if path_type == "softlink":
+        destination.symlink_to(source.readlink())
+    elif placeholder := path_data.get("prefix_placeholder"):
+        data = source.read_bytes()
+        if path_data.get("file_mode", "text") == "binary":
+            data = binary_replace(data, placeholder.encode(), prefix.encode())
+        else:
+            data = data.replace(placeholder.encode(), prefix.encode())
+        destination.write_bytes(data)
+        shutil.copymode(source, destination)
+        if sys.platform == "darwin" and path_data.get("file_mode") == "binary":
+            # modified binaries must be signed again
+            subprocess.run(["codesign", "-s", "-", "-f", str(destination)], capture_output=True, check=False)
+    elif copy or path_data.get("no_link", False):
+        shutil.copy2(source, destination)
+    else:
+        try:
+            os.link(source, destination)
+        except OSError:
+            shutil.copy2(source, destination)
+    return {"_path": path_data["_path"], "path_type": path_type}
+
+
+def _write_entry_points(target: _Target, entry_points: list[str], python: str) -> list[str]:
+    """Create noarch python packages entry points scripts.
+
+    :param target: environment target
+    :param entry_points: entry points as `name = module:func`
+    :param python: environment python executable
+    :return: created scripts paths
+    """
+    files = []
+    for entry_point in entry_points:
+        name, _, func = (p.strip() for p in entry_point.partition("="))
+        module, _, func = func.partition(":")
+        path = target.prefix / target.scripts / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            _ENTRY_POINT_TEMPLATE.format(python=python, module=module, import_name=func.split(".")[0], func=func),
+        )
+        path.chmod(0o755)
+        files.append(f"{target.scripts}/{name}")
+    return files
+
+
+def _check_supported(extracted: Path):
+    """Check package can be linked without Conda.
+
+    :param extracted: extracted package directory
+    """
+    link = json.loads(link_json.read_text()) if (link_json := extracted / "info" / "link.json").exists() else {}
+    noarch = link.get("noarch", {})
+    if sys.platform == "win32" and noarch.get("entry_points"):
+        raise NativeInstallUnsupported(f"{extracted.name} entry points require Conda")
+    for scripts in ("bin", "Scripts"):
+        if any((extracted / scripts).glob(".*-pre-link.*")) or any((extracted / scripts).glob(".*-post-link.*")):
+            raise NativeInstallUnsupported(f"{extracted.name} has link scripts")
+
+
+def link_package(extracted: Path, prefix: Path, python_version: str, copy: bool = False) -> dict[str, Any]:
+    """Link extracted package into the environment and write its `conda-meta` record.
+
+    :param extracted: extracted package directory
+    :param prefix: environment prefix
+    :param python_version: environment python version as `major.minor`
+    :param copy: if true copy files instead of hard-linking them
+    :return: package record
+    """
+    info = extracted / "info"
+    record = json.loads((info / "repodata_record.json").read_text())
+    link = json.loads(link_json.read_text()) if (link_json := info / "link.json").exists() else {}
+    noarch = link.get("noarch", {})
+    noarch_python = noarch.get("type", record.get("noarch")) == "python"
+    target = _Target(prefix, python_version, noarch_python)
+
+    files = []
+    paths = []
+    try:
+        for path_data in _package_paths(extracted):
+            path = target.path(path_data["_path"])
+            linked = _link_file(extracted / path_data["_path"], prefix / path, path_data, str(prefix), copy)
+            files.append(path)
+            paths.append(linked | {"_path": path})
+        if noarch_python:
+            python = str(prefix / ("python.exe" if sys.platform == "win32" else "bin/python"))
+            for path in _write_entry_points(target, noarch.get("entry_points", []), python):
+                files.append(path)
+                paths.append({"_path": path, "path_type": "hardlink"})
+
+        meta = record | {
+            "files": files,
+            "paths_data": {"paths": paths, "paths_version": 1},
+            "extracted_package_dir": str(extracted),
+            "link": {"source": str(extracted), "type": 3 if copy else 1},
+            "requested_spec": "",
+        }
+        conda_meta = prefix / "conda-meta"
+        conda_meta.mkdir(exist_ok=True)
+        (conda_meta / f"{extracted.name}.json").write_text(json.dumps(meta, indent=2))
+    except BaseException:
+        # don't leave a half-linked package without its conda-meta record
+        _remove_files(prefix, files)
+        raise
+    return meta
+
+
+def _remove_files(prefix: Path, files: list[str]):
+    """Remove package files, their python caches and the directories left empty.
+
+    :param prefix: environment prefix
+    :param files: package files relative to the prefix
+    """
+    directories = set()
+    for file in files:
+        path = prefix / file
+        if path.is_symlink() or path.is_file():
+            path.unlink()
+        elif path.is_dir():
+            directories.add(path)
+        if path.suffix == ".py" and (cache := path.parent / "__pycache__").is_dir():
+            for pyc in cache.glob(f"{path.stem}.*.pyc"):
+                pyc.unlink()
+            directories.add(cache)
+        directories.update(p for p in path.parents if p != prefix and prefix in p.parents)
+    for directory in sorted(directories, key=lambda p: len(p.parts), reverse=True):
+        with suppress(OSError):
+            directory.rmdir()
+
+
+def unlink_package(prefix: Path, name: str) -> bool:
+    """Remove package files and its `conda-meta` record from the environment.
+
+    :param prefix: environment prefix
+    :param name: package name
+    :return: true if package was found
+    """
+    for meta_path in (prefix / "conda-meta").glob(f"{name}-*.json"):
+        with suppress(OSError, ValueError):
+            meta = json.loads(meta_path.read_text())
+            if meta.get("name") != name:
+                continue
+            _remove_files(prefix, meta.get("files", []))
+            meta_path.unlink()
+            return True
+    return False
+
+
+def _environment(project: CondaProject) -> tuple[Path, str]:
+    interpreter = project.environment.interpreter
+    return get_python_dir(fix_path(interpreter.path)), f"{interpreter.version.major}.{interpreter.version.minor}"
+
+
+def package_store(project: CondaProject) -> PackageStore:
+    """Package store shared by all environments.
+
+    :param project: PDM project
+    :return: package store
+    """
+    config = project.conda_config
+    return PackageStore(config.package_store_path, config.package_store_max_size * 1000 * 1000)
+
+
+def native_install(project: CondaProject, packages: list[str]):
+    """Install explicit packages linking them into the environment without running Conda, packages are downloaded
+    and extracted concurrently into the Conda packages cache or the package store if active.
+
+    :param project: PDM project
+    :param packages: packages urls with their md5 as fragment
+    """
+    if not packages:
+        return
+    if (pkgs_dir := writable_pkgs_dir(project)) is None:
+        raise NativeInstallUnsupported("No writable Conda packages directory found")
+    # fail before downloading anything if some package can't be extracted
+    for package in packages:
+        _package_name(url := package.partition("#")[0])
+        if url.endswith(".conda") and find_spec("zstandard") is None:
+            raise NativeInstallUnsupported("zstandard is required to extract .conda packages")
+    prefix, python_version = _environment(project)
+    config = project.conda_config
+    store = package_store(project) if config.package_store_active else None
+    with (
+        httpx.Client(follow_redirects=True) as client,
+        ThreadPoolExecutor(min(PREFETCH_WORKERS, len(packages))) as executor,
+    ):
+        extracted = list(
+            executor.map(lambda p: fetch_package(client, project.pkgs_dirs, pkgs_dir, p, store), packages),
+        )
+    for package_dir in extracted:
+        _check_supported(package_dir)
+
+    copy = config.installation_method == "copy"
+    try:
+        for package_dir in extracted:
+            logger.debug(f"Linking {package_dir.name} into {prefix}")
+            link_package(package_dir, prefix, python_version, copy)
+    finally:
+        _invalidate_packages(project)
+    if store is not None:
+        store.evict(keep={p.partition("#")[2] for p in packages})
+
+
+def native_uninstall(project: CondaProject, names: list[str]) -> list[str]:
+    """Uninstall packages removing their files from the environment without running Conda.
+
+    :param project: PDM project
+    :param names: packages names
+    :return: packages not found in the environment `conda-meta`
+    """
+    prefix, _ = _environment(project)
+    try:
+        return [name for name in names if not unlink_package(prefix, name)]
+    finally:
+        _invalidate_packages(project)
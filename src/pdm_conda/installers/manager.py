@@ -1,19 +1,151 @@
 from __future__ import annotations
 
-from threading import Lock
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from threading import Condition, Event, Lock
 from typing import TYPE_CHECKING
 
+from pdm.exceptions import InstallationError
 from pdm.installers import InstallManager
 
-from pdm_conda.conda import conda_install, conda_uninstall
+from pdm_conda import logger
+from pdm_conda.conda import _conda_meta_packages, conda_install, conda_prefetch, conda_uninstall
+from pdm_conda.installers.linker import NativeInstallUnsupported, native_install, native_uninstall
 from pdm_conda.models.candidates import CondaCandidate
 from pdm_conda.models.setup import CondaSetupDistribution
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
     from importlib.metadata import Distribution
 
     from pdm_conda.environments import BaseEnvironment
     from pdm_conda.models.candidates import Candidate
+    from pdm_conda.project import CondaProject
+
+
+def _conda_package(candidate: CondaCandidate) -> str:
+    return f"{candidate.link.url_without_fragment}#{candidate.link.hash}"
+
+
+def _install(project: CondaProject, packages: list[str]):
+    """Install explicit packages, linking them without Conda if native install is active and possible.
+
+    :param project: PDM project
+    :param packages: packages urls with their md5 as fragment
+    """
+    if project.conda_config.native_install:
+        try:
+            native_install(project, packages)
+            return
+        except NativeInstallUnsupported as e:
+            logger.info(f"Installing packages with Conda: {e}")
+    conda_install(project, packages, no_deps=True)
+
+
+def _uninstall(project: CondaProject, names: list[str]):
+    """Uninstall packages, removing them without Conda if native install is active.
+
+    :param project: PDM project
+    :param names: packages names
+    """
+    if project.conda_config.native_install:
+        names = native_uninstall(project, names)
+    if names:
+        conda_uninstall(project, names, no_deps=True)
+
+
+@dataclass
+class CondaTransaction:
+    """Conda packages to remove and install with one command each when committed, the jobs that queued them wait for
+    the commit to report its outcome.
+    """
+
+    to_remove: dict[str, CondaSetupDistribution] = field(default_factory=dict)
+    to_install: dict[str, CondaCandidate] = field(default_factory=dict)
+    lock: Lock = field(default_factory=Lock, repr=False)
+    waiting: int = field(default=0, repr=False)
+    condition: Condition = field(default_factory=Condition, repr=False)
+    committed: Event = field(default_factory=Event, repr=False)
+    error: Exception | None = field(default=None, repr=False)
+
+    def remove(self, dist: CondaSetupDistribution):
+        with self.lock:
+            self.to_remove[dist.name] = dist
+
+    def install(self, candidate: CondaCandidate):
+        with self.lock:
+            self.to_install[candidate.name] = candidate
+
+    def wait(self):
+        """Wait until the transaction is committed, raising an error if the commit failed."""
+        with self.condition:
+            self.waiting += 1
+            self.condition.notify_all()
+        self.committed.wait()
+        if self.error is not None:
+            raise InstallationError(f"Conda transaction failed: {self.error}") from self.error
+
+    def wait_for_jobs(self, jobs: Collection[Future]):
+        """Wait until every job is either waiting for the commit or done.
+
+        :param jobs: jobs queueing operations in the transaction
+        """
+        with self.condition:
+            self.condition.wait_for(lambda: self.waiting + sum(job.done() for job in jobs) >= len(jobs))
+
+    def commit(self, project: CondaProject, prefetch: Future | None = None):
+        """Remove and then install the collected packages, if the install fails removed packages are restored.
+
+        :param project: PDM project
+        :param prefetch: packages download to wait for before installing
+        """
+        with self.lock:
+            to_remove, self.to_remove = self.to_remove, {}
+            to_install, self.to_install = self.to_install, {}
+        removed = []
+        if to_remove:
+            removed = self._installed_packages(project, list(to_remove.values()))
+            _uninstall(project, list(to_remove))
+        if not to_install:
+            return
+        try:
+            if prefetch is not None:
+                prefetch.result()
+            _install(project, [_conda_package(c) for c in to_install.values()])
+        except Exception:
+            if removed:
+                self._rollback(project, removed)
+            raise
+
+    @staticmethod
+    def _installed_packages(project: CondaProject, dists: list[CondaSetupDistribution]) -> list[str]:
+        """Urls of installed packages taken from the environment `conda-meta` records, used to restore them.
+
+        :param project: PDM project
+        :param dists: installed distributions
+        :return: packages urls with their md5 as fragment
+        """
+        records = {record["name"]: record for record in _conda_meta_packages(project) or []}
+        packages = []
+        for dist in dists:
+            record = records.get(dist.package.get("name", dist.name), dist.package)
+            if url := record.get("url"):
+                packages.append(f"{url}#{record['md5']}" if record.get("md5") else url)
+            else:
+                logger.warning(f"Unable to restore {dist.name} {dist.version}, its url is unknown")
+        return packages
+
+    @staticmethod
+    def _rollback(project: CondaProject, packages: list[str]):
+        """Install again removed packages.
+
+        :param project: PDM project
+        :param packages: removed packages urls with their md5 as fragment
+        """
+        try:
+            _install(project, packages)
+        except Exception as e:
+            logger.warning(f"Unable to restore removed packages: {e}")
 
 
 class CondaInstallManager(InstallManager):
@@ -25,33 +157,49 @@ class CondaInstallManager(InstallManager):
         rename_pth: bool = False,
     ) -> None:
         super().__init__(environment, use_install_cache=use_install_cache, rename_pth=rename_pth)
-        self._batch_install_queue: dict[str, str] = {}
-        self._batch_install_expected: set[str] = set()
-        self._batch_uninstall_queue: dict[str, str] = {}
-        self._batch_uninstall_expected: set[str] = set()
+        self.transaction: CondaTransaction | None = None
+        self._prefetch: Future | None = None
         self.lock = Lock()
 
-    def prepare_batch_operations(self, to_install: set[str], to_uninstall: set[str]):
-        self._batch_install_expected = to_install
-        self._batch_uninstall_expected = to_uninstall
+    def begin_transaction(self):
+        """Collect Conda installs and removals until the transaction is committed, operations wait for the commit."""
+        if self.transaction is None:
+            self.transaction = CondaTransaction()
 
-    def _run_with_conda(
-        self,
-        conda_func,
-        new_requirement: str,
-        queue: dict[str, str],
-        expected: set[str],
-        op_name: str = "",
-    ):
-        if should_run := (new_requirement not in expected):
-            queue = {new_requirement: op_name or new_requirement}
-        else:
-            queue[new_requirement] = op_name or new_requirement
-            should_run = set(queue) == expected
+    def commit_transaction(self, jobs: Collection[Future]):
+        """Run collected Conda removals and installs once every job queued its operations, errors are reported to the
+        waiting jobs.
 
-        if should_run:
+        :param jobs: jobs queueing operations in the transaction
+        """
+        if (transaction := self.transaction) is None:
+            return
+        transaction.wait_for_jobs(jobs)
+        self.transaction = None
+        try:
             with self.lock:
-                conda_func(self.environment.project, list(queue.values()), no_deps=True)
+                transaction.commit(self.environment.project, self._prefetch)
+        except Exception as e:
+            transaction.error = e
+        finally:
+            transaction.committed.set()
+
+    def prefetch(self, candidates: list[CondaCandidate]):
+        """Start downloading candidates into the Conda packages cache, installs wait for them.
+
+        :param candidates: candidates to download
+        """
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._prefetch = executor.submit(
+            conda_prefetch,
+            self.environment.project,
+            [_conda_package(candidate) for candidate in candidates],
+        )
+        executor.shutdown(wait=False)
+
+    def _uninstall_now(self, dist: CondaSetupDistribution):
+        with self.lock:
+            _uninstall(self.environment.project, [dist.name])
 
     def install(self, candidate: Candidate) -> Distribution:
         """Install candidate, use conda if conda package else default installer.
@@ -59,13 +207,14 @@ class CondaInstallManager(InstallManager):
         :param candidate: candidate to install
         """
         if isinstance(candidate, CondaCandidate):
-            self._run_with_conda(
-                conda_install,
-                candidate.name,
-                self._batch_install_queue,
-                self._batch_install_expected,
-                f"{candidate.link.url_without_fragment}#{candidate.link.hash}",
-            )
+            if (transaction := self.transaction) is not None:
+                transaction.install(candidate)
+                transaction.wait()
+            else:
+                if self._prefetch is not None:
+                    self._prefetch.result()
+                with self.lock:
+                    _install(self.environment.project, [_conda_package(candidate)])
             return candidate.distribution
 
         return super().install(candidate)
@@ -76,12 +225,11 @@ class CondaInstallManager(InstallManager):
         :param dist: distribution to uninstall
         """
         if isinstance(dist, CondaSetupDistribution):
-            self._run_with_conda(
-                conda_uninstall,
-                dist.name,
-                self._batch_uninstall_queue,
-                self._batch_uninstall_expected,
-            )
+            if (transaction := self.transaction) is not None:
+                transaction.remove(dist)
+                transaction.wait()
+            else:
+                self._uninstall_now(dist)
         else:
             super().uninstall(dist)
 
@@ -92,8 +240,16 @@ class CondaInstallManager(InstallManager):
         :param dist: distribution to uninstall
         :param candidate: candidate to install
         """
-        if isinstance(candidate, CondaCandidate) or isinstance(dist, CondaSetupDistribution):
-            self.uninstall(dist)
-            self.install(candidate)
-        else:
+        if not isinstance(candidate, CondaCandidate) and not isinstance(dist, CondaSetupDistribution):
             super().overwrite(dist, candidate)
+            return
+        if isinstance(dist, CondaSetupDistribution):
+            if self.transaction is not None and isinstance(candidate, CondaCandidate):
+                # removed with the transaction, which waits for the install
+                self.transaction.remove(dist)
+            else:
+                # Conda package must be removed before installing a PyPI package with the same name
+                self._uninstall_now(dist)
+        else:
+            super().uninstall(dist)
+        self.install(candidate)
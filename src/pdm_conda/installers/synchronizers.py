@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from typing import TYPE_CHECKING
 
@@ -12,12 +13,60 @@ from pdm_conda.models.requirements import strip_extras
 from pdm_conda.models.setup import CondaSetupDistribution
 
 if TYPE_CHECKING:
-    from collections.abc import Collection
+    from collections.abc import Callable, Collection
+    from concurrent.futures import Future
+
+    from pdm.installers.synchronizers import DummyExecutor
 
     from pdm_conda.environments import BaseEnvironment
     from pdm_conda.models.candidates import Candidate
 
 
+class CondaTransactionExecutor:
+    """Executor running the jobs queueing Conda operations in their own threads, so they can wait for the Conda
+    transaction committed once all of them are queued while other jobs run in the wrapped executor.
+    """
+
+    def __init__(
+        self,
+        executor: ThreadPoolExecutor | DummyExecutor,
+        manager: CondaInstallManager,
+        conda_keys: Collection[str],
+    ) -> None:
+        self.executor = executor
+        self.manager = manager
+        self.conda_keys = conda_keys
+        # every job waits for the commit, so each one needs its own thread
+        self.conda_executor = ThreadPoolExecutor(max_workers=len(conda_keys))
+        self.conda_jobs: list[Future] = []
+
+    def __enter__(self) -> CondaTransactionExecutor:
+        self.executor.__enter__()
+        self.manager.begin_transaction()
+        return self
+
+    def submit(self, fn: Callable, key: str, *args, **kwargs) -> Future:
+        if key not in self.conda_keys:
+            return self.executor.submit(fn, key, *args, **kwargs)
+        future = self.conda_executor.submit(fn, key, *args, **kwargs)
+        self.conda_jobs.append(future)
+        if (transaction := self.manager.transaction) is not None:
+
+            def notify(_):
+                with transaction.condition:
+                    transaction.condition.notify_all()
+
+            future.add_done_callback(notify)
+        return future
+
+    def __exit__(self, *exc_info) -> None:
+        try:
+            self.manager.commit_transaction(self.conda_jobs)
+        finally:
+            self.conda_executor.shutdown()
+            self.executor.__exit__(*exc_info)
+
+
 class CondaSynchronizer(Synchronizer):
     def __init__(
         self,
@@ -47,6 +96,7 @@ class CondaSynchronizer(Synchronizer):
             use_install_cache,
         )
         self.parallel = bool(self.parallel)  # type: ignore
+        self._conda_keys: set[str] = set()
 
     @cached_property
     def candidates(self) -> dict[str, Candidate]:
@@ -67,28 +117,31 @@ class CondaSynchronizer(Synchronizer):
         if to_remove:
             to_remove = [p for p in to_remove if p not in self.environment.env_dependencies]
 
-        if (
-            not isinstance(self.manager, CondaInstallManager)
-            or not self.environment.project.conda_config.batched_commands
+        config = self.environment.project.conda_config
+        if not isinstance(self.manager, CondaInstallManager) or not (
+            config.batched_commands or config.prefetch_packages
         ):
             return to_add, to_update, to_remove
 
-        to_batch_install = set()
-        to_batch_remove = set()
-
-        def extract_conda(pkgs, candidates, cls):
-            conda_pkgs = []
-            for pkg in pkgs:
-                if isinstance(candidates[pkg], cls):
-                    conda_pkgs.append(pkg)
-            return conda_pkgs
-
-        for pkgs in (to_add, to_update):
-            to_batch_install.update(extract_conda(pkgs, self.candidates, CondaCandidate))
-
-        for pkgs in (to_remove, to_update):
-            to_batch_remove.update(extract_conda(pkgs, self.working_set, CondaSetupDistribution))
-
-        self.manager.prepare_batch_operations(to_batch_install, to_batch_remove)
+        if self.dry_run:
+            return to_add, to_update, to_remove
+        # jobs queueing operations in the Conda transaction
+        self._conda_keys = {key for key in {*to_add, *to_update} if isinstance(self.candidates[key], CondaCandidate)}
+        self._conda_keys.update(key for key in to_remove if isinstance(self.working_set[key], CondaSetupDistribution))
+        if config.prefetch_packages:
+            self.manager.prefetch(
+                [
+                    can
+                    for key in sorted({*to_add, *to_update})
+                    if isinstance(can := self.candidates[key], CondaCandidate)
+                ]
+            )
 
         return to_add, to_update, to_remove
+
+    def create_executor(self) -> ThreadPoolExecutor | DummyExecutor:
+        executor = super().create_executor()
+        if not self._conda_keys or not isinstance(self.manager, CondaInstallManager):
+            return executor
+        # Conda operations are run once every job queued them
+        return CondaTransactionExecutor(executor, self.manager, self._conda_keys)  # type: ignore[return-value]
@@ -1,16 +1,43 @@
 from __future__ import annotations
 
+import contextlib
 import json
 import os
+import pickle
+import threading
 from datetime import datetime, timedelta
 from functools import lru_cache
 from pathlib import Path
+from tempfile import NamedTemporaryFile
 
 import httpx
 
+from pdm_conda import logger
+
 MAPPING_URL = "https://github.com/regro/cf-graph-countyfair/raw/master/mappings/pypi/grayskull_pypi_mapping.yaml"
 MAPPING_DOWNLOAD_DIR_ENV_VAR = "PDM_CONDA_PYPI_MAPPING_DIR"
 MAPPING_URL_ENV_VAR = "PDM_CONDA_PYPI_MAPPING_URL"
+MAPPING_BACKGROUND_REFRESH_ENV_VAR = "PDM_CONDA_PYPI_MAPPING_BACKGROUND_REFRESH"
+MAPPING_FORMAT_VERSION = 1
+# staging files older than this were left by an interrupted refresh
+STALE_STAGING_AGE = timedelta(hours=1)
+
+_refresh_threads: dict[Path, threading.Thread] = {}
+_refresh_lock = threading.Lock()
+
+
+class NameMapping(dict):
+    """PyPI to Conda names mapping with its precomputed inverse."""
+
+    def __init__(self, mapping: dict[str, str]) -> None:
+        super().__init__(mapping)
+        self.inverse = {v: k for k, v in self.items()}
+
+
+def _write_atomic(path: Path, content: bytes):
+    with NamedTemporaryFile("wb", dir=path.parent, prefix=f".{path.name}.", delete=False) as f:
+        f.write(content)
+    Path(f.name).replace(path)
 
 
 def process_mapping(yaml_path: Path, dict_path: Path):
@@ -34,32 +61,181 @@ def process_mapping(yaml_path: Path, dict_path: Path):
             if pypi_name:
                 mappings[pypi_name] = conda_name
 
-    with dict_path.open("w") as f:
-        json.dump(mappings, f)
+    _write_atomic(dict_path, json.dumps(mappings).encode())
+
+
+def compile_mapping(dict_path: Path, compiled_path: Path, fixes: dict[str, str]) -> NameMapping:
+    """Create precompiled mapping from json mapping, so it can be loaded without parsing and inverting it.
+
+    :param dict_path: json path
+    :param compiled_path: precompiled mapping path
+    :param fixes: mapping fixes to apply
+    :return: Conda mapping
+    """
+    with dict_path.open() as f:
+        mapping = json.load(f)
+    mapping.update(fixes)
+    mapping = NameMapping(mapping)
 
+    data = {"version": MAPPING_FORMAT_VERSION, "fixes": fixes, "mapping": mapping}
+    _write_atomic(compiled_path, pickle.dumps(data, pickle.HIGHEST_PROTOCOL))
+    return mapping
+
+
+def load_mapping(dict_path: Path, compiled_path: Path, fixes: dict[str, str]) -> NameMapping:
+    """Load precompiled mapping, it's compiled again if it's outdated or can't be read.
+
+    :param dict_path: json path
+    :param compiled_path: precompiled mapping path
+    :param fixes: mapping fixes to apply
+    :return: Conda mapping
+    """
+    try:
+        if compiled_path.stat().st_mtime >= dict_path.stat().st_mtime:
+            with compiled_path.open("rb") as f:
+                data = pickle.load(f)
+            if (
+                data.get("version") == MAPPING_FORMAT_VERSION
+                and data.get("fixes") == fixes
+                and isinstance(data.get("mapping"), NameMapping)
+            ):
+                return data["mapping"]
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError, OSError) as e:
+        logger.debug(f"Unable to load precompiled mapping {compiled_path}: {e}")
+    return compile_mapping(dict_path, compiled_path, fixes)
+
+
+def fetch_mapping(yaml_path: Path, url: str, timeout: int = 15) -> tuple[bytes, dict[str, str]] | None:
+    """Download yaml mapping if it was modified, validators of the last download are stored beside the mapping.
+
+    :param yaml_path: yaml path
+    :param url: mapping url
+    :param timeout: request timeout
+    :return: mapping content and its validators, None if it wasn't modified
+    """
+    validators_path = yaml_path.with_suffix(".headers.json")
+    headers = {"Accept-Encoding": "gzip"}
+    validators = {}
+    if yaml_path.exists() and validators_path.exists():
+        try:
+            validators = json.loads(validators_path.read_text())
+        except (OSError, ValueError):
+            validators = {}
+        if validators.get("url") != url:
+            validators = {}
+    if etag := validators.get("etag"):
+        headers["If-None-Match"] = etag
+    if last_modified := validators.get("last-modified"):
+        headers["If-Modified-Since"] = last_modified
 
-def download_mapping(download_dir: Path, update_interval: timedelta | None = None, timeout: int = 15) -> dict[str, str]:
+    response = httpx.get(url, headers=headers, timeout=timeout, follow_redirects=True)
+    if response.status_code == httpx.codes.NOT_MODIFIED:
+        return None
+    response.raise_for_status()
+    validators = {k: response.headers[k] for k in ("etag", "last-modified") if k in response.headers}
+    return response.content, {"url": url, **validators}
+
+
+def _remove_stale_staging(download_dir: Path, stem: str):
+    """Remove staging files left by refreshes interrupted at exit, recent ones may belong to a running refresh.
+
+    :param download_dir: download dir
+    :param stem: mapping files stem
+    """
+    threshold = (datetime.now() - STALE_STAGING_AGE).timestamp()
+    for path in download_dir.glob(f".{stem}.*"):
+        with contextlib.suppress(OSError):
+            if path.stat().st_mtime < threshold:
+                path.unlink()
+
+
+def refresh_mapping(download_dir: Path, timeout: int = 15, fixes: dict[str, str] | None = None) -> NameMapping:
+    """Refresh Conda-PyPI mapping from GitHub, it's processed again only if it was modified.
+
+    The downloaded yaml and its validators are saved only after the mapping is processed, so an interrupted refresh is
+    downloaded again instead of leaving a refreshed yaml beside an outdated mapping.
+
+    :param download_dir: download dir
+    :param timeout: request timeout
+    :param fixes: mapping fixes to apply
+    :return: Conda mapping
+    """
+    if fixes is None:
+        fixes = {}
+    yaml_path = download_dir / "pypi_mapping.yaml"
+    dict_path = yaml_path.with_suffix(".json")
+    compiled_path = yaml_path.with_suffix(".pickle")
+    _remove_stale_staging(download_dir, yaml_path.stem)
+
+    if (fetched := fetch_mapping(yaml_path, os.getenv(MAPPING_URL_ENV_VAR, MAPPING_URL), timeout)) is None:
+        if not dict_path.exists():
+            process_mapping(yaml_path, dict_path)
+        mapping = load_mapping(dict_path, compiled_path, fixes)
+        yaml_path.touch()
+        return mapping
+
+    content, validators = fetched
+    with NamedTemporaryFile("wb", dir=download_dir, prefix=f".{yaml_path.name}.", delete=False) as f:
+        f.write(content)
+    staged_path = Path(f.name)
+    try:
+        process_mapping(staged_path, dict_path)
+        mapping = compile_mapping(dict_path, compiled_path, fixes)
+    except BaseException:
+        staged_path.unlink(missing_ok=True)
+        raise
+    staged_path.replace(yaml_path)
+    _write_atomic(yaml_path.with_suffix(".headers.json"), json.dumps(validators).encode())
+    return mapping
+
+
+def _refresh_in_background(download_dir: Path, timeout: int, fixes: dict[str, str]):
+    def refresh():
+        try:
+            refresh_mapping(download_dir, timeout, fixes)
+        except (httpx.HTTPError, OSError) as e:
+            logger.debug(f"Unable to refresh PyPI-Conda mapping: {e}")
+
+    with _refresh_lock:
+        if (thread := _refresh_threads.get(download_dir)) is None or not thread.is_alive():
+            # files are replaced atomically, so the refresh can be abandoned at exit
+            thread = threading.Thread(target=refresh, name="pdm-conda-mapping", daemon=True)
+            _refresh_threads[download_dir] = thread
+            thread.start()
+
+
+def download_mapping(
+    download_dir: Path,
+    update_interval: timedelta | None = None,
+    timeout: int = 15,
+    fixes: dict[str, str] | None = None,
+    background: bool = False,
+) -> NameMapping:
     """Download and process Conda-PyPI mapping from GitHub.
 
     :param download_dir: download dir
     :param update_interval: update interval, if mapping file modified date is greater than update interval the reload
     :param timeout: request timeout
+    :param fixes: mapping fixes to apply
+    :param background: if True and there is a previous mapping, it's used while it's refreshed in background
     :return: Conda mapping
     """
     if update_interval is None:
         update_interval = timedelta(days=15)
+    if fixes is None:
+        fixes = {}
     download_dir.mkdir(parents=True, exist_ok=True)
     yaml_path = download_dir / "pypi_mapping.yaml"
     dict_path = yaml_path.with_suffix(".json")
 
-    if not yaml_path.exists() or datetime.fromtimestamp(yaml_path.stat().st_mtime) + update_interval < datetime.now():
-        response = httpx.get(os.getenv(MAPPING_URL_ENV_VAR, MAPPING_URL), timeout=timeout, follow_redirects=True)
-        with yaml_path.open("wb") as f:
-            f.write(response.content)
-        process_mapping(yaml_path, dict_path)
+    if not yaml_path.exists() or not dict_path.exists():
+        return refresh_mapping(download_dir, timeout, fixes)
+    if datetime.fromtimestamp(yaml_path.stat().st_mtime) + update_interval < datetime.now():
+        if not background:
+            return refresh_mapping(download_dir, timeout, fixes)
+        _refresh_in_background(download_dir, timeout, fixes)
 
-    with dict_path.open() as f:
-        return json.load(f)
+    return load_mapping(dict_path, yaml_path.with_suffix(".pickle"), fixes)
 
 
 def get_mapping_fixes() -> dict:
@@ -76,14 +252,15 @@ def get_mapping_fixes() -> dict:
 def get_pypi_mapping() -> dict[str, str]:
     download_dir = os.getenv(MAPPING_DOWNLOAD_DIR_ENV_VAR)
     timeout = int(os.getenv("PDM_REQUEST_TIMEOUT", 15))
-    mapping = download_mapping(Path(str(download_dir)), timeout=timeout)
-    mapping.update(get_mapping_fixes())
-    return mapping
+    background = os.getenv(MAPPING_BACKGROUND_REFRESH_ENV_VAR, "true").lower() in ("true", "1")
+    return download_mapping(Path(str(download_dir)), timeout=timeout, fixes=get_mapping_fixes(), background=background)
 
 
 @lru_cache
 def get_conda_mapping() -> dict[str, str]:
-    return {v: k for k, v in get_pypi_mapping().items()}
+    if isinstance(mapping := get_pypi_mapping(), NameMapping):
+        return mapping.inverse
+    return {v: k for k, v in mapping.items()}
 
 
 def _requirement_map(requirement: str, mapping: dict):
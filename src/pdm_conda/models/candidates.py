@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, cast
 from urllib.parse import urlparse
 
+from packaging.version import InvalidVersion, Version
 from pdm.environments import BaseEnvironment
 from pdm.models.candidates import Candidate, PreparedCandidate
 from pdm.models.setup import Setup
@@ -53,7 +54,32 @@ class CondaPreparedCandidate(PreparedCandidate):
         return self.candidate.distribution
 
 
+@dataclasses.dataclass(slots=True, eq=False)
+class CondaPackageRecord:
+    """Conda package data, shared by reference between the candidates created from the same package."""
+
+    name: str | None
+    version: str | None
+    build: str | None = None
+    build_number: int = 0
+    channel: str | None = None
+    timestamp: int = 0
+    depends: tuple[str, ...] = ()
+    constrains: tuple[str, ...] = ()
+    track_feature: str = ""
+
+
 class CondaCandidate(Candidate):
+    __slots__ = (
+        "_record",
+        "_req",
+        "_extra_dependencies",
+        "_dependencies",
+        "_constrains",
+        "_hashes",
+        "_parsed_version",
+    )
+
     def __init__(
         self,
         req: Requirement,
@@ -68,40 +94,50 @@ class CondaCandidate(Candidate):
         channel: str | None = None,
         track_feature: str = "",
     ):
+        self._record = CondaPackageRecord(
+            name=name,
+            version=version,
+            build=build_string,
+            build_number=build_number,
+            channel=channel,
+            timestamp=timestamp,
+            depends=tuple(dependencies or ()),
+            constrains=tuple(constrains or ()),
+            track_feature=track_feature,
+        )
         super().__init__(req, name, version, link)
         self._req = cast(CondaRequirement, req)  # type: ignore
         self._preferred = None
         self._prepared: CondaPreparedCandidate | None = None
-        self.conda_version = version
         self.version = parse_conda_version(version)
-        dependencies = dependencies or []
+        self._parsed_version: tuple[str | None, Version | None] | None = None
+        self._extra_dependencies: tuple[str, ...] = ()
         if self.req.extras:
-            dependencies.append(
+            self._extra_dependencies = (
                 self.req.as_pinned_version(self.version).as_line(with_build_string=True, with_channel=True),
             )
-        self.dependencies: list[CondaRequirement] = [
-            cast(CondaRequirement, parse_requirement(f"conda:{r}")) for r in dependencies
-        ]
-        self.constrains: dict[str, CondaRequirement] = {}
-        self.hashes: list[FileHash] = (
-            [
-                {
-                    "url": self.link.url_without_fragment,
-                    "file": "",
-                    "hash": f"{self.link.hash_name}:{self.link.hash}",
-                },
-            ]
-            if self.link is not None
-            else []
-        )
-        for r in constrains or []:
-            c = cast(CondaRequirement, parse_requirement(f"conda:{r}"))
-            self.constrains[str(c.conda_name)] = c
-        self.build_string = build_string
-        self.build_number = build_number
-        self.timestamp = timestamp
-        self.channel = channel
-        self.track_feature = track_feature
+        # requirements are parsed on first access
+        self._dependencies: list[CondaRequirement] | None = None
+        self._constrains: dict[str, CondaRequirement] | None = None
+        self._hashes: list[FileHash] | None = None
+
+    def __copy__(self) -> CondaCandidate:
+        can = type(self).__new__(type(self))
+        can._record = self._record
+        can._req = self._req
+        can.name = self.name
+        can.version = self.version
+        can.link = self.link
+        can.summary = self.summary
+        can._requires_python = self._requires_python
+        can._prepared = self._prepared
+        can._preferred = self._preferred
+        can._parsed_version = self._parsed_version
+        can._extra_dependencies = self._extra_dependencies
+        can._dependencies = self._dependencies
+        can._constrains = self._constrains
+        can._hashes = self._hashes
+        return can
 
     def copy_with(self, requirement: Requirement, merge_requirements: bool = True) -> Candidate:
         can = copy(self)
@@ -121,6 +157,91 @@ class CondaCandidate(Candidate):
     def req(self, value):
         self._req = as_conda_requirement(value)
 
+    @property
+    def record(self) -> CondaPackageRecord:
+        return self._record
+
+    @property
+    def conda_version(self) -> str | None:
+        return self._record.version
+
+    @property
+    def build_string(self) -> str | None:
+        return self._record.build
+
+    @property
+    def build_number(self) -> int:
+        return self._record.build_number
+
+    @property
+    def timestamp(self) -> int:
+        return self._record.timestamp
+
+    @property
+    def channel(self) -> str | None:
+        return self._record.channel
+
+    @property
+    def track_feature(self) -> str:
+        return self._record.track_feature
+
+    @property
+    def dependencies(self) -> list[CondaRequirement]:
+        if self._dependencies is None:
+            self._dependencies = [
+                cast(CondaRequirement, parse_requirement(f"conda:{r}"))
+                for r in (*self._record.depends, *self._extra_dependencies)
+            ]
+        return self._dependencies
+
+    @dependencies.setter
+    def dependencies(self, value: list[CondaRequirement]):
+        self._dependencies = value
+
+    @property
+    def constrains(self) -> dict[str, CondaRequirement]:
+        if self._constrains is None:
+            self._constrains = {}
+            for r in self._record.constrains:
+                c = cast(CondaRequirement, parse_requirement(f"conda:{r}"))
+                self._constrains[str(c.conda_name)] = c
+        return self._constrains
+
+    @constrains.setter
+    def constrains(self, value: dict[str, CondaRequirement]):
+        self._constrains = value
+
+    @property
+    def hashes(self) -> list[FileHash]:
+        if self._hashes is None:
+            self._hashes = (
+                [
+                    {
+                        "url": self.link.url_without_fragment,
+                        "file": "",
+                        "hash": f"{self.link.hash_name}:{self.link.hash}",
+                    },
+                ]
+                if self.link is not None
+                else []
+            )
+        return self._hashes
+
+    @hashes.setter
+    def hashes(self, value: list[FileHash]):
+        self._hashes = value
+
+    @property
+    def parsed_version(self) -> Version | None:
+        """Candidate version parsed once, None if it isn't a valid version."""
+        if self._parsed_version is None or self._parsed_version[0] != self.version:
+            try:
+                parsed = Version(self.version) if self.version else None
+            except InvalidVersion:
+                parsed = None
+            self._parsed_version = (self.version, parsed)
+        return self._parsed_version[1]
+
     @property
     def distribution(self):
         return CondaSetupDistribution(
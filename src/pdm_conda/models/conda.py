@@ -8,6 +8,7 @@ class ChannelSorter:
     def __init__(self, platform: str, channels: Iterable[str] | None = None) -> None:
         self._priority: dict[str, int] = {}
         self._tree: dict[str, list[str]] = {}
+        self._patterns: dict[str, re.Pattern] = {}
         self.platform = platform
         if channels:
             for channel in channels:
@@ -34,7 +35,7 @@ class ChannelSorter:
         root = self.get_root(channel)
         if channel not in self._priority:
             for c in (variants := self.get_variants(root)):
-                if c == channel or (allow_fuzzy and re.match(c, channel)):
+                if c == channel or (allow_fuzzy and self._pattern(c).match(channel)):
                     self._priority[channel] = self._priority[c]
                     # then fuzzy match
                     if c != channel:
@@ -45,6 +46,13 @@ class ChannelSorter:
                 self._priority[channel] = self._priority[root] + len(variants) * 10
                 variants.append(channel)
 
+    def _pattern(self, channel: str) -> re.Pattern:
+        if (pattern := self._patterns.get(channel)) is None:
+            pattern = self._patterns[channel] = re.compile(channel)
+        return pattern
+
     def get_priority(self, channel: str) -> int:
-        self.add_channel(channel)
-        return self._priority[channel]
+        if (priority := self._priority.get(channel)) is None:
+            self.add_channel(channel)
+            priority = self._priority[channel]
+        return priority
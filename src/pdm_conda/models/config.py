@@ -14,7 +14,12 @@ from pdm.project import Config, ConfigItem
 from pdm.utils import normalize_name
 
 from pdm_conda import logger
-from pdm_conda.mapping import MAPPING_DOWNLOAD_DIR_ENV_VAR, MAPPING_URL, MAPPING_URL_ENV_VAR
+from pdm_conda.mapping import (
+    MAPPING_BACKGROUND_REFRESH_ENV_VAR,
+    MAPPING_DOWNLOAD_DIR_ENV_VAR,
+    MAPPING_URL,
+    MAPPING_URL_ENV_VAR,
+)
 from pdm_conda.models.requirements import parse_requirement
 from pdm_conda.utils import fix_path, get_python_dir
 
@@ -48,6 +53,26 @@ CONFIGS = [
         "batched-commands",
         ConfigItem("Execute batched install and remove commands", False, env_var="PDM_CONDA_BATCHED_COMMANDS"),
     ),
+    (
+        "prefetch-packages",
+        ConfigItem(
+            "Download Conda packages concurrently while other packages are installed and install them at once",
+            False,
+            env_var="PDM_CONDA_PREFETCH_PACKAGES",
+        ),
+    ),
+    (
+        "max-concurrency",
+        ConfigItem("Max number of Conda commands running concurrently", 4, env_var="PDM_CONDA_MAX_CONCURRENCY"),
+    ),
+    (
+        "worker",
+        ConfigItem(
+            "Run Conda search, info, list and dry run commands in a persistent Conda process",
+            False,
+            env_var="PDM_CONDA_WORKER",
+        ),
+    ),
     (
         "installation-method",
         ConfigItem(
@@ -56,6 +81,14 @@ CONFIGS = [
             env_var="PDM_CONDA_INSTALLATION_METHOD",
         ),
     ),
+    (
+        "native-install",
+        ConfigItem(
+            "Link locked Conda packages into the environment without running Conda",
+            False,
+            env_var="PDM_CONDA_NATIVE_INSTALL",
+        ),
+    ),
     ("dependencies", ConfigItem("Dependencies to install with Conda", [])),
     ("optional-dependencies", ConfigItem("Optional dependencies to install with Conda", {})),
     ("dev-dependencies", ConfigItem("Development dependencies to install with Conda", {})),
@@ -76,6 +109,94 @@ CONFIGS = [
             env_var=MAPPING_URL_ENV_VAR,
         ),
     ),
+    (
+        "pypi-mapping.background-refresh",
+        ConfigItem(
+            "Use outdated PyPI-Conda mapping while it's refreshed in background",
+            True,
+            env_var=MAPPING_BACKGROUND_REFRESH_ENV_VAR,
+        ),
+    ),
+    (
+        "search-cache.active",
+        ConfigItem("Persist Conda search results between runs", False, env_var="PDM_CONDA_SEARCH_CACHE_ACTIVE"),
+    ),
+    (
+        "search-cache.dir",
+        ConfigItem(
+            "Conda search cache directory, by default inside PyPI-Conda mapping download directory",
+            "",
+            env_var="PDM_CONDA_SEARCH_CACHE_DIR",
+        ),
+    ),
+    (
+        "search-cache.ttl",
+        ConfigItem("Seconds a Conda search result is cached", 86400, env_var="PDM_CONDA_SEARCH_CACHE_TTL"),
+    ),
+    (
+        "repodata.active",
+        ConfigItem(
+            "Search packages in the repodata cached by Conda instead of running Conda",
+            False,
+            env_var="PDM_CONDA_REPODATA_ACTIVE",
+        ),
+    ),
+    (
+        "repodata.index-dir",
+        ConfigItem(
+            "Repodata indexes directory, by default inside PyPI-Conda mapping download directory",
+            "",
+            env_var="PDM_CONDA_REPODATA_INDEX_DIR",
+        ),
+    ),
+    (
+        "repodata.max-age",
+        ConfigItem(
+            "Max seconds since Conda refreshed the cached repodata to search it, else Conda is used",
+            86400,
+            env_var="PDM_CONDA_REPODATA_MAX_AGE",
+        ),
+    ),
+    (
+        "solver-cache.active",
+        ConfigItem("Persist Conda solutions between runs", False, env_var="PDM_CONDA_SOLVER_CACHE_ACTIVE"),
+    ),
+    (
+        "solver-cache.dir",
+        ConfigItem(
+            "Conda solver cache directory, by default inside PyPI-Conda mapping download directory",
+            "",
+            env_var="PDM_CONDA_SOLVER_CACHE_DIR",
+        ),
+    ),
+    (
+        "solver-cache.ttl",
+        ConfigItem("Seconds a Conda solution is cached", 86400, env_var="PDM_CONDA_SOLVER_CACHE_TTL"),
+    ),
+    (
+        "solver-cache.max-entries",
+        ConfigItem("Max number of cached Conda solutions", 256, env_var="PDM_CONDA_SOLVER_CACHE_MAX_ENTRIES"),
+    ),
+    (
+        "package-store.active",
+        ConfigItem(
+            "Extract natively installed packages once into a store shared by all environments",
+            False,
+            env_var="PDM_CONDA_PACKAGE_STORE_ACTIVE",
+        ),
+    ),
+    (
+        "package-store.dir",
+        ConfigItem(
+            "Package store directory, by default inside PyPI-Conda mapping download directory",
+            "",
+            env_var="PDM_CONDA_PACKAGE_STORE_DIR",
+        ),
+    ),
+    (
+        "package-store.max-size",
+        ConfigItem("Max package store size in MB", 10240, env_var="PDM_CONDA_PACKAGE_STORE_MAX_SIZE"),
+    ),
     ("custom-behavior", ConfigItem("Use pdm-conda custom behavior", False, env_var="PDM_CONDA_CUSTOM_BEHAVIOR")),
     (
         "auto-excludes",
@@ -91,6 +212,20 @@ _CONFIG_MAP = {name: name.replace("-", "_") for (name, _) in CONFIGS}
 _CONFIG_MAP |= {
     "pypi-mapping.download-dir": "mapping_download_dir",
     "pypi-mapping.url": "mapping_url",
+    "pypi-mapping.background-refresh": "mapping_background_refresh",
+    "search-cache.active": "search_cache_active",
+    "search-cache.dir": "search_cache_dir",
+    "search-cache.ttl": "search_cache_ttl",
+    "repodata.active": "repodata_active",
+    "repodata.index-dir": "repodata_index_dir",
+    "repodata.max-age": "repodata_max_age",
+    "solver-cache.active": "solver_cache_active",
+    "solver-cache.dir": "solver_cache_dir",
+    "solver-cache.ttl": "solver_cache_ttl",
+    "solver-cache.max-entries": "solver_cache_max_entries",
+    "package-store.active": "package_store_active",
+    "package-store.dir": "package_store_dir",
+    "package-store.max-size": "package_store_max_size",
 }
 _CONFIG_MAP |= {v: k for k, v in _CONFIG_MAP.items()}
 _CONFIG_MAP["_excludes"] = "excludes"
@@ -126,12 +261,30 @@ class PluginConfig:
     custom_behavior: bool = False
     auto_excludes: bool = False
     batched_commands: bool = False
+    prefetch_packages: bool = False
     installation_method: str = "hard-link"
+    native_install: bool = False
+    max_concurrency: int = 4
+    worker: bool = False
     dependencies: list[str] = field(default_factory=list, repr=False)
     optional_dependencies: dict[str, list] = field(default_factory=dict)
     dev_dependencies: dict[str, list] = field(default_factory=dict)
     mapping_download_dir: Path = field(repr=False, default=Path())
     mapping_url: str = field(repr=False, default=MAPPING_URL)
+    mapping_background_refresh: bool = field(repr=False, default=True)
+    search_cache_active: bool = False
+    search_cache_dir: str = field(repr=False, default="")
+    search_cache_ttl: int = 86400
+    repodata_active: bool = False
+    repodata_index_dir: str = field(repr=False, default="")
+    repodata_max_age: int = 86400
+    solver_cache_active: bool = False
+    solver_cache_dir: str = field(repr=False, default="")
+    solver_cache_ttl: int = 86400
+    solver_cache_max_entries: int = 256
+    package_store_active: bool = False
+    package_store_dir: str = field(repr=False, default="")
+    package_store_max_size: int = 10240
 
     def __post_init__(self):
         if self.runner not in list(CondaRunner):
@@ -140,6 +293,17 @@ class PluginConfig:
             raise ProjectError(f"Invalid Conda solver: {self.solver}")
         if self.installation_method not in ["hard-link", "copy"]:
             raise ProjectError(f"Invalid Conda installation method: {self.installation_method}")
+        if self.max_concurrency < 1:
+            raise ProjectError(f"Invalid Conda max concurrency: {self.max_concurrency}, it must be at least 1")
+        for name in (
+            "search_cache_ttl",
+            "repodata_max_age",
+            "solver_cache_ttl",
+            "solver_cache_max_entries",
+            "package_store_max_size",
+        ):
+            if (value := getattr(self, name)) < 0:
+                raise ProjectError(f"Invalid Conda {name.replace('_', ' ')}: {value}, it can't be negative")
         to_suscribe = [
             (self._project.pyproject._data, "update"),
             (self._project.pyproject, "write"),
@@ -277,6 +441,34 @@ class PluginConfig:
             self._excludes = sorted(value)
             self._excluded_identifiers = None
 
+    @property
+    def search_cache_path(self) -> Path:
+        """Conda search cache directory, if not configured defaults to a folder inside the mapping download dir."""
+        if self.search_cache_dir:
+            return fix_path(self.search_cache_dir)
+        return self.mapping_download_dir / "search-cache"
+
+    @property
+    def repodata_index_path(self) -> Path:
+        """Repodata indexes directory, if not configured defaults to a folder inside the mapping download dir."""
+        if self.repodata_index_dir:
+            return fix_path(self.repodata_index_dir)
+        return self.mapping_download_dir / "repodata-index"
+
+    @property
+    def solver_cache_path(self) -> Path:
+        """Conda solver cache directory, if not configured defaults to a folder inside the mapping download dir."""
+        if self.solver_cache_dir:
+            return fix_path(self.solver_cache_dir)
+        return self.mapping_download_dir / "solver-cache"
+
+    @property
+    def package_store_path(self) -> Path:
+        """Package store directory, if not configured defaults to a folder inside the mapping download dir."""
+        if self.package_store_dir:
+            return fix_path(self.package_store_dir)
+        return self.mapping_download_dir / "package-store"
+
     @property
     def is_initialized(self):
         return self._initialized and self.active
@@ -367,14 +559,18 @@ class PluginConfig:
             for key, v in config.items():
                 key = ".".join(k for k in (parent_key, key) if k)
                 if isinstance(v, dict) and key in allowed_levels:
-                    return flatten_config(v, allowed_levels, key, result)
+                    flatten_config(v, allowed_levels, key, result)
+                    continue
 
                 if key not in _CONFIG_MAP:
                     raise NoConfigError(key)
                 result[_CONFIG_MAP[key]] = v
             return result
 
-        config = flatten_config(project.pyproject.settings.get("conda", {}), ["pypi-mapping"])
+        config = flatten_config(
+            project.pyproject.settings.get("conda", {}),
+            ["pypi-mapping", "search-cache", "repodata", "solver-cache", "package-store"],
+        )
         for n, c in CONFIGS:
             if (prop_name := _CONFIG_MAP[n[len("conda.") :]]) not in config and c.env_var:
                 value = project.config[n]
@@ -383,11 +579,31 @@ class PluginConfig:
                 elif prop_name in (
                     "as_default_manager",
                     "batched_commands",
+                    "prefetch_packages",
+                    "native_install",
                     "custom_behavior",
                     "auto_excludes",
                     "active",
+                    "worker",
+                    "mapping_background_refresh",
+                    "search_cache_active",
+                    "repodata_active",
+                    "solver_cache_active",
+                    "package_store_active",
                 ):
                     value = str(value).lower() in ("true", "1")
+                elif prop_name in (
+                    "max_concurrency",
+                    "search_cache_ttl",
+                    "repodata_max_age",
+                    "solver_cache_ttl",
+                    "solver_cache_max_entries",
+                    "package_store_max_size",
+                ):
+                    try:
+                        value = int(value)
+                    except ValueError as e:
+                        raise ProjectError(f"Invalid {n} ({c.env_var}): {value}, it must be an integer") from e
                 config[prop_name] = value
         config |= kwargs
         excludes = config.pop("excludes", None)
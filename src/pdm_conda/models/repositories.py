@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from typing import TYPE_CHECKING, cast
 
 from pdm.exceptions import CandidateNotFound
@@ -11,19 +14,24 @@ from pdm_conda import logger
 from pdm_conda.conda import CondaResolutionError, CondaSearchError, conda_create, conda_search, sort_candidates
 from pdm_conda.environments import CondaEnvironment
 from pdm_conda.models.candidates import CondaCandidate
-from pdm_conda.models.requirements import CondaRequirement, as_conda_requirement
+from pdm_conda.models.requirements import CondaRequirement, as_conda_requirement, parse_conda_version
+from pdm_conda.utils import normalize_name
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Callable, Collection, Iterable, Iterator, Mapping
     from typing import Any
 
     from pdm.models.repositories import CandidateKey, RepositoryConfig
 
     from pdm_conda.environments import BaseEnvironment
-    from pdm_conda.models.candidates import Candidate, FileHash
+    from pdm_conda.models.candidates import Candidate, CondaPackageRecord, FileHash
     from pdm_conda.models.requirements import Requirement
 
 
+HASH_FETCH_WORKERS = 8
+_PENDING = object()
+
+
 def _format_packages(packages: list[str], pretty_print=False) -> str:
     result = ""
     for i, package in enumerate(packages):
@@ -47,6 +55,9 @@ class CondaRepository(BaseRepository):
         self.environment = cast(CondaEnvironment, environment)
         self._conda_resolution: dict[str, list[CondaCandidate]] = {}
         self._excluded_identifiers: set[str] = set()
+        self._conda_solutions: dict[tuple[str, ...], dict[str, list[CondaCandidate]] | CondaResolutionError] = {}
+        # candidates sort keys, shared by the candidates of the same package
+        self._sort_keys: dict[tuple[CondaPackageRecord, bool], tuple] = {}
 
     def is_conda_managed(self, requirement: Requirement, excluded_identifiers: set[str] | None = None) -> bool:
         """True if requirement is conda requirement or (not excluded and named requirement and conda as default manager
@@ -85,8 +96,9 @@ class CondaRepository(BaseRepository):
             if (key := req.conda_name) not in resolution:
                 logger.info(f"Requirement {req} is not present in Conda resolution")
                 return False
+            is_compatible = req.compatibility_check()
             for can in resolution[key]:
-                if not req.is_compatible(can):
+                if not is_compatible(can):
                     logger.info(f"Requirement {req} is not compatible with {can}")
                     return False
         return True
@@ -112,6 +124,36 @@ class CondaRepository(BaseRepository):
             self._excluded_identifiers = excluded_identifiers
         return self._excluded_identifiers
 
+    def solve(self, requirements: list[CondaRequirement]) -> dict[str, list[CondaCandidate]]:
+        """Solve requirements with conda, outcomes are memoized by the requirements set so backtracking to a previously
+        seen set doesn't solve again.
+
+        :param requirements: conda requirements
+        :return: conda resolution
+        """
+        key = tuple(
+            sorted(
+                {req.as_line(with_build_string=True, conda_compatible=True, with_channel=True) for req in requirements}
+            ),
+        )
+        if (solution := self._conda_solutions.get(key)) is None:
+            try:
+                solution = conda_create(
+                    self.environment.project,
+                    requirements,
+                    prefix=f"/tmp/{uuid.uuid4()}",
+                    dry_run=True,
+                )
+            except CondaResolutionError as err:
+                solution = err
+            self._conda_solutions[key] = solution
+        else:
+            logger.debug(f"Reusing Conda resolution for {_format_packages(list(key))}")
+        if isinstance(solution, CondaResolutionError):
+            # drop the previous traceback, otherwise it grows every time the failure is reused
+            raise solution.with_traceback(None)
+        return solution
+
     def get_dependencies(self, candidate: Candidate) -> tuple[list[Requirement], PySpecSet, str]:
         if isinstance(candidate, CondaCandidate):
             dependencies = list(candidate.dependencies)
@@ -136,25 +178,52 @@ class CondaRepository(BaseRepository):
             candidate.hashes = _candidates[0].hashes
         return super().get_hashes(candidate)
 
+    def fetch_hashes(self, candidates: Iterable[CondaCandidate]):
+        """Fetch hashes for candidates searching them concurrently, candidates with the same channel and spec share
+        the search.
+
+        :param candidates: candidates without hashes
+        """
+        groups: dict[tuple[str, str], list[CondaCandidate]] = {}
+        for candidate in candidates:
+            if not candidate.hashes:
+                key = (candidate.req.channel or "", candidate.req.as_line(with_build_string=True))
+                groups.setdefault(key, []).append(candidate)
+        if not groups:
+            return
+
+        def fetch(group: list[CondaCandidate]):
+            self.get_hashes(group[0])
+            for candidate in group[1:]:
+                candidate.hashes = group[0].hashes
+
+        with ThreadPoolExecutor(max_workers=min(HASH_FETCH_WORKERS, len(groups))) as executor:
+            # consume results to propagate errors
+            for _ in executor.map(fetch, groups.values()):
+                pass
+
     def update_hashes(self, mapping: dict[str, Candidate]):
-        """Update hashes for candidates in mapping using conda create.
+        """Update hashes for candidates in mapping using conda create, candidates not found in the Conda resolution
+        are searched in parallel.
 
         :param mapping: mapping of candidates
         """
-        conda_requirements = [can.req for can in mapping.values() if isinstance(can, CondaCandidate) and not can.hashes]
-        if conda_requirements:
-            resolution = conda_create(
-                self.environment.project,
-                conda_requirements,
-                prefix=f"/tmp/{uuid.uuid4()}",
-                dry_run=True,
-            )
-            for candidate in mapping.values():
+        candidates = [can for can in mapping.values() if isinstance(can, CondaCandidate) and not can.hashes]
+        if not candidates:
+            return
+        try:
+            resolution = self.solve([can.req for can in candidates])
+        except CondaResolutionError as e:
+            logger.info(f"Unable to resolve candidates to fetch hashes, searching them instead: {e}")
+            resolution = {}
+        missing = []
+        for candidate in candidates:
+            if (cans := resolution.get(candidate.name, [])) and cans[0].req.is_compatible(candidate.req):
                 logger.info(f"Fetching hashes for {candidate}")
-                if (cans := resolution.get(candidate.name, [])) and cans[0].req.is_compatible(candidate.req):
-                    candidate.hashes = cans[0].hashes
-                else:
-                    raise CondaSearchError(f"Cannot find hashes for {candidate}")
+                candidate.hashes = cans[0].hashes
+            else:
+                missing.append(candidate)
+        self.fetch_hashes(missing)
 
 
 class PyPICondaRepository(PyPIRepository, CondaRepository):
@@ -184,12 +253,7 @@ class PyPICondaRepository(PyPIRepository, CondaRepository):
                     for req in requirements or []
                     if self.is_conda_managed(req, excluded_identifiers)
                 ]
-                new_resolution = conda_create(
-                    self.environment.project,
-                    _requirements,
-                    prefix=f"/tmp/{uuid.uuid4()}",
-                    dry_run=True,
-                )
+                new_resolution = self.solve(_requirements)
                 conda_requirements = {r.conda_name: r for r in _requirements}
                 for name, candidates in new_resolution.items():
                     req = conda_requirements.get(name, candidates[0].req)
@@ -219,11 +283,9 @@ class PyPICondaRepository(PyPIRepository, CondaRepository):
     def _find_candidates(self, requirement: Requirement, minimal_version: bool) -> Iterable[Candidate]:
         if self.is_conda_managed(requirement, excluded_identifiers=self._excluded_identifiers):
             requirement = as_conda_requirement(requirement)
-            candidates = self._conda_resolution.get(requirement.conda_name, [])
-            candidates = [
-                c.copy_with(requirement, merge_requirements=True) for c in candidates if requirement.is_compatible(c)
-            ]
-            candidates = list(sort_candidates(self.environment.project, candidates, minimal_version))
+            candidates = requirement.filter_compatible(self._conda_resolution.get(requirement.conda_name, []))
+            candidates = [c.copy_with(requirement, merge_requirements=True) for c in candidates]
+            candidates = list(sort_candidates(self.environment.project, candidates, minimal_version, self._sort_keys))
         else:
             if isinstance(requirement, CondaRequirement):
                 requirement = requirement.as_named_requirement()
@@ -231,14 +293,76 @@ class PyPICondaRepository(PyPIRepository, CondaRepository):
         return candidates
 
 
+class LazyMapping(MutableMapping):
+    """Mapping whose pending values are created by a loader the first time they are accessed."""
+
+    def __init__(self, data: Mapping, loader: Callable[[Any], None]) -> None:
+        """Create mapping.
+
+        :param data: initial values
+        :param loader: function receiving a pending key that must set its value
+        """
+        self._data: dict = dict(data)
+        self._loader = loader
+
+    def add_pending(self, key):
+        """Add key whose value will be created on first access.
+
+        :param key: key to add
+        """
+        self._data[key] = _PENDING
+
+    def __getitem__(self, key):
+        value = self._data[key]
+        if value is _PENDING:
+            self._loader(key)
+            value = self._data[key]
+        return value
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+
 class LockedCondaRepository(LockedRepository, CondaRepository):
-    def _matching_keys(self, requirement: Requirement) -> Iterable[CandidateKey]:
-        yield from super()._matching_keys(requirement)
-        if self.is_conda_managed(requirement):
-            req_id = as_conda_requirement(requirement).identify()
+    @property
+    def all_candidates(self) -> dict[str, Candidate]:
+        keys = {key[0]: key for key in self.packages}
+        candidates = LazyMapping(
+            {}, lambda identifier: candidates.__setitem__(identifier, self.packages[keys[identifier]])
+        )
+        for identifier in keys:
+            candidates.add_pending(identifier)
+        return candidates  # type: ignore[return-value]
+
+    def _index_key(self, key: CandidateKey):
+        keys = self._keys_by_name.setdefault(key[0], [])
+        if key not in keys:
+            keys.append(key)
 
-            for key, can in self.packages.items():
-                if isinstance(can, CondaCandidate) and req_id == key[0]:
+    def _matching_keys(self, requirement: Requirement) -> Iterable[CandidateKey]:
+        if not requirement.name:
+            yield from super()._matching_keys(requirement)
+            return
+        req_id = requirement.identify()
+        yield from self._keys_by_name.get(req_id, [])
+        if self.is_conda_managed(requirement) and (conda_id := as_conda_requirement(requirement).identify()) != req_id:
+            for key in self._keys_by_name.get(conda_id, []):
+                if key in self._conda_keys:
                     yield key
 
     def _read_lockfile(self, lockfile: Mapping[str, Any]) -> None:
@@ -250,6 +374,10 @@ class LockedCondaRepository(LockedRepository, CondaRepository):
                 conda_packages.append(package)
             else:
                 pypi_packages.append(package)
+        self._keys_by_name: dict[str, list[CandidateKey]] = {}
+        self._conda_keys: set[CandidateKey] = set()
+        self._conda_entries: dict[CandidateKey, dict] = {}
+        self._conda_entries_lock = Lock()
         super()._read_lockfile({"package": pypi_packages, **{k: v for k, v in lockfile.items() if k != "package"}})
 
         if conda_packages and (
@@ -260,16 +388,67 @@ class LockedCondaRepository(LockedRepository, CondaRepository):
                 "you should delete the lock file or initialize pdm-conda.",
             )
 
-        for package in conda_packages:
+        if conda_packages:
+            # conda candidates are created from their lock entry on first access
+            self.packages = LazyMapping(self.packages, self._load_conda_package)  # type: ignore[assignment]
+            self.candidate_info = LazyMapping(self.candidate_info, self._load_conda_package)  # type: ignore[assignment]
+            for package in conda_packages:
+                key = self._identify_lock_package(package)
+                self._conda_entries[key] = package
+                self._conda_keys.add(key)
+                self.packages.add_pending(key)
+                self.candidate_info.add_pending(key)
+        # packages are only added while reading the lock file, index them once all are added
+        for key in self.candidate_info:
+            self._index_key(key)
+
+    @staticmethod
+    def _identify_lock_package(package: dict) -> CandidateKey:
+        """Get the key of a Conda lockfile package without creating its candidate.
+
+        :param package: lockfile package
+        :return: candidate key
+        """
+        name = normalize_name(package["name"])
+        if extras := package.get("extras", []):
+            name += f"[{','.join(sorted(extras))}]"
+        return name, parse_conda_version(package["version"]), None, False
+
+    def _load_conda_package(self, key: CandidateKey):
+        """Create Conda candidate and its info from its lockfile package.
+
+        :param key: candidate key
+        """
+        # hashes are fetched concurrently, only the first access creates the candidate
+        with self._conda_entries_lock:
+            if (package := self._conda_entries.pop(key, None)) is None:
+                return
             can = CondaCandidate.from_lock_package(package)
-            can_id = self._identify_candidate(can)
-            self.packages[can_id] = can
-            self.candidate_info[can_id] = (
+            self.packages[key] = can
+            self.candidate_info[key] = (
                 can.dependencies_lines,
                 package.get("requires_python", ""),
                 package.get("summary", ""),
             )
 
+    def evaluate_candidates(self, groups: Collection[str]) -> Iterable[Candidate]:
+        for key in self.packages:
+            # skip Conda packages of other groups without creating their candidate
+            if (package := self._conda_entries.get(key)) is not None and not any(
+                g in package.get("groups", []) for g in groups
+            ):
+                continue
+            can = self.packages[key]
+            if not any(g in can.req.groups for g in groups):
+                continue
+            if (
+                not self.ignore_compatibility
+                and can.req.marker is not None
+                and not can.req.marker.evaluate(self.environment.marker_environment)
+            ):
+                continue
+            yield can
+
     def _identify_candidate(self, candidate: Candidate) -> tuple:
         if isinstance(candidate, CondaCandidate):
             return candidate.identify(), candidate.version, None, False
@@ -17,13 +17,16 @@ from pdm_conda.mapping import conda_to_pypi, pypi_to_conda
 from pdm_conda.utils import normalize_name
 
 if TYPE_CHECKING:
-    from typing import Any
+    from collections.abc import Callable, Iterable
+    from typing import Any, TypeVar
 
     from pdm.models.candidates import Candidate
     from pdm.models.requirements import T
 
     from pdm_conda.models.config import PluginConfig
 
+    C = TypeVar("C", bound="Requirement | Candidate")
+
 _conda_meta_req_re = re.compile(r"conda:([\w\-_/]+::)?(.+)$")
 _prev_spec = ",|<>!~="
 _specifier_re = re.compile(rf"(?<![{_prev_spec}])(=|==|~=|!=|<|>|<=|>=)([^{_prev_spec}\s]+)")
@@ -31,6 +34,16 @@ _conda_specifier_star_re = re.compile(r"([\w.]+)\*")
 _conda_version_letter_re = re.compile(r"(\d|\.)([a-z]+)(\d?)")
 
 
+@functools.lru_cache(maxsize=1024)
+def build_string_matcher(build_string: str) -> re.Pattern:
+    """Compile build string into a regex, `*` matches any characters.
+
+    :param build_string: build string
+    :return: compiled build string
+    """
+    return re.compile(build_string.replace("*", ".*"))
+
+
 @dataclasses.dataclass(eq=False)
 class CondaRequirement(NamedRequirement):
     channel: str | None = None
@@ -101,30 +114,57 @@ class CondaRequirement(NamedRequirement):
             groups=list(self.groups),
         )
 
-    def is_compatible(self, requirement_or_candidate: Requirement | Candidate):
-        _compatible = True
-        # test build string compatible
-        if (build_string := getattr(requirement_or_candidate, "build_string", "")) and self.build_string:
-            _compatible &= re.match(rf"{self.build_string.replace('*', r'.*')}", build_string) is not None
-
-        # test equal name
-        _compatible &= self.conda_name == getattr(
-            requirement_or_candidate,
-            "conda_name",
-            getattr(requirement_or_candidate, "name", ""),
-        )
+    def compatibility_check(self) -> Callable[[Requirement | Candidate], bool]:
+        """Get a function testing if requirements or candidates are compatible with this requirement, build string
+        matcher and specifier are prepared once so it can be used over many candidates.
 
-        # test version/specifier compatible
-        versions = []
-        if (version := getattr(requirement_or_candidate, "version", None)) is not None:
-            versions.append(version)
-        else:
-            versions += [s.version for s in requirement_or_candidate.specifier]
+        :return: compatibility check
+        """
+        matcher = build_string_matcher(self.build_string) if self.build_string else None
+        name = self.conda_name
+        contains = self.version_contains()
+
+        def check(requirement_or_candidate: Requirement | Candidate) -> bool:
+            # test build string compatible
+            if (
+                matcher is not None
+                and (build_string := getattr(requirement_or_candidate, "build_string", ""))
+                and matcher.match(build_string) is None
+            ):
+                return False
+
+            # test equal name
+            if name != getattr(requirement_or_candidate, "conda_name", getattr(requirement_or_candidate, "name", "")):
+                return False
+
+            # test version/specifier compatible
+            if (version := getattr(requirement_or_candidate, "parsed_version", None)) is not None:
+                return contains(version)
+            if (version := getattr(requirement_or_candidate, "version", None)) is not None:
+                return contains(version)
+            return all(contains(s.version) for s in requirement_or_candidate.specifier)
+
+        return check
+
+    def version_contains(self) -> Callable[[str | Version], bool]:
+        """Get the specifier `contains` bound with prereleases included, instead of copying the specifier to allow
+        them. Pass parsed versions to avoid parsing them again on every test.
+
+        :return: function testing if a version is contained in the specifier
+        """
+        return functools.partial(self.specifier.contains, prereleases=True)
+
+    def is_compatible(self, requirement_or_candidate: Requirement | Candidate) -> bool:
+        return self.compatibility_check()(requirement_or_candidate)
 
-        spec = copy(self.specifier)
-        spec.prereleases = True
-        _compatible &= all(spec.contains(v) for v in versions)
-        return _compatible
+    def filter_compatible(self, requirements_or_candidates: Iterable[C]) -> list[C]:
+        """Filter requirements or candidates compatible with this requirement.
+
+        :param requirements_or_candidates: requirements or candidates to filter
+        :return: compatible requirements or candidates
+        """
+        check = self.compatibility_check()
+        return [r for r in requirements_or_candidates if check(r)]
 
     def merge(self, requirement: Requirement) -> CondaRequirement:
         """Merge with other requirement to get more specific.
@@ -149,8 +189,7 @@ class CondaRequirement(NamedRequirement):
                 for build_string in build_strings:
                     if build_string not in _compatible:
                         _compatible[build_string] = all(
-                            re.match(build_string.replace("*", r".*"), bs)
-                            or re.match(bs.replace("*", r".*"), build_string)
+                            build_string_matcher(build_string).match(bs) or build_string_matcher(bs).match(build_string)
                             for bs in build_strings
                             if bs != build_string
                         )
@@ -239,73 +278,85 @@ def comparable_version(version: str) -> Version:
     return Version(version)
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_conda_requirement(line: str) -> CondaRequirement:
+    """Parse Conda requirement, parsed requirements are cached so they must not be modified.
+
+    :param line: Conda requirement line
+    :return: Conda requirement
+    """
+    version_mapping = {}
+    channel, line = _conda_meta_req_re.match(line).groups()  # type: ignore[union-attr]
+    if channel:
+        channel = channel[:-2]
+    marker = None
+    if ";" in line:
+        line, marker = line.split(";", maxsplit=1)
+
+    build_string = None
+    if len(_line := re.split(r"\s+", line)) == 3 or (len(_line) == 2 and _specifier_re.search(_line[0])):
+        build_string = _line[-1]
+        line = " ".join(_line[:-1])
+    elif len(_line := list(_specifier_re.finditer(line))) == 2:
+        match = _line[-1]  # type: ignore
+        build_string, line = line[match.end(1) :], line[: match.start()]
+
+    name = line
+    version = ""
+    if match := _specifier_re.search(line):
+        name, version = line[: match.start(1)], line[match.start(1) :]
+    elif " " in line:
+        name, version = line.split(" ", maxsplit=1)
+    version_and = version.split(",")
+    for i, conda_version in enumerate(version_and):
+        version_or = conda_version.split("|")
+        for j, conda_version_or in enumerate(version_or):
+            if conda_version_or:
+                if conda_version_or == "*":
+                    _version = ""
+                else:
+                    if not (spec := _specifier_re.match(conda_version_or)) or spec.group(1) == "=":
+                        spec_eq = spec and spec.group(1) == "="
+                        if spec:
+                            conda_version_or = conda_version_or[spec.end(1) :]
+                        star_version = _conda_specifier_star_re.match(conda_version_or)
+                        if spec_eq and not star_version:
+                            conda_version_or += ".*"
+                        conda_version_or = f"{'~' if star_version else '='}={conda_version_or}"
+                    _version = conda_version_or
+                    if not _version.startswith("=="):
+                        _version = _conda_specifier_star_re.sub(correct_specifier_star, _version)
+                        if _version.startswith("~") and "." not in _version:
+                            _version += ".0"
+                    _version = parse_conda_version(_version)
+                    version_mapping[remove_operator(_version)] = remove_operator(conda_version_or)
+                version_or[j] = _version
+        version_and[i] = max((v for v in version_or if v), key=comparable_version, default="")
+    version = ",".join(version_and)
+    if marker:
+        name += f";{marker}"
+    prefix = ""
+    if underscore_prefix := re.match(r"^(_+)(.*)", name):
+        prefix = underscore_prefix.group(1)
+        name = underscore_prefix.group(2)
+    _req = _parse_requirement(line=name)
+    _req.name = f"{prefix}{_req.name}"
+    return CondaRequirement.create(
+        name=_req.name,
+        version=version,
+        channel=channel,
+        version_mapping=version_mapping,
+        build_string=build_string,
+        marker=_req.marker,
+        extras=_req.extras,
+    )
+
+
 def parse_requirement(line: str, editable: bool = False) -> Requirement:
-    if (match := _conda_meta_req_re.match(line)) is not None:
-        version_mapping = {}
-        channel, line = match.groups()
-        if channel:
-            channel = channel[:-2]
-        marker = None
-        if ";" in line:
-            line, marker = line.split(";", maxsplit=1)
-
-        build_string = None
-        if len(_line := re.split(r"\s+", line)) == 3 or (len(_line) == 2 and _specifier_re.search(_line[0])):
-            build_string = _line[-1]
-            line = " ".join(_line[:-1])
-        elif len(_line := list(_specifier_re.finditer(line))) == 2:
-            match = _line[-1]  # type: ignore
-            build_string, line = line[match.end(1) :], line[: match.start()]
-
-        name = line
-        version = ""
-        if match := _specifier_re.search(line):
-            name, version = line[: match.start(1)], line[match.start(1) :]
-        elif " " in line:
-            name, version = line.split(" ", maxsplit=1)
-        version_and = version.split(",")
-        for i, conda_version in enumerate(version_and):
-            version_or = conda_version.split("|")
-            for j, conda_version_or in enumerate(version_or):
-                if conda_version_or:
-                    if conda_version_or == "*":
-                        _version = ""
-                    else:
-                        if not (spec := _specifier_re.match(conda_version_or)) or spec.group(1) == "=":
-                            spec_eq = spec and spec.group(1) == "="
-                            if spec:
-                                conda_version_or = conda_version_or[spec.end(1) :]
-                            star_version = _conda_specifier_star_re.match(conda_version_or)
-                            if spec_eq and not star_version:
-                                conda_version_or += ".*"
-                            conda_version_or = f"{'~' if star_version else '='}={conda_version_or}"
-                        _version = conda_version_or
-                        if not _version.startswith("=="):
-                            _version = _conda_specifier_star_re.sub(correct_specifier_star, _version)
-                            if _version.startswith("~") and "." not in _version:
-                                _version += ".0"
-                        _version = parse_conda_version(_version)
-                        version_mapping[remove_operator(_version)] = remove_operator(conda_version_or)
-                    version_or[j] = _version
-            version_and[i] = max((v for v in version_or if v), key=comparable_version, default="")
-        version = ",".join(version_and)
-        if marker:
-            name += f";{marker}"
-        prefix = ""
-        if underscore_prefix := re.match(r"^(_+)(.*)", name):
-            prefix = underscore_prefix.group(1)
-            name = underscore_prefix.group(2)
-        _req = _parse_requirement(line=name)
-        _req.name = f"{prefix}{_req.name}"
-        req = CondaRequirement.create(
-            name=_req.name,
-            version=version,
-            channel=channel,
-            version_mapping=version_mapping,
-            build_string=build_string,
-            marker=_req.marker,
-            extras=_req.extras,
-        )
+    if _conda_meta_req_re.match(line) is not None:
+        req = copy(_parse_conda_requirement(line))
+        req.version_mapping = dict(req.version_mapping)
+        req.groups = list(req.groups)
     else:
         req = _parse_requirement(line=line, editable=editable)
     return req
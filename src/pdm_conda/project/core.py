@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from functools import cached_property
 from typing import TYPE_CHECKING, cast
 
@@ -18,6 +20,7 @@ from pdm_conda.project.project_file import PyProject
 if TYPE_CHECKING:
     from collections.abc import Iterable
     from pathlib import Path
+    from typing import Any
 
     from pdm.core import Core
     from pdm.environments import BaseEnvironment
@@ -50,6 +53,8 @@ class CondaProject(Project):
         self.conda_config = PluginConfig.load_config(self)
         self._is_distribution: bool | None = None
         self._base_env: Path | None = None
+        # environments probes, shared between project copies
+        self._conda_probes: dict[str, dict] = {}
 
     @property
     def virtual_packages(self) -> set[CondaRequirement]:
@@ -75,6 +80,23 @@ class CondaProject(Project):
             return self.environment.default_channels
         return []
 
+    @property
+    def pkgs_dirs(self) -> list[Path]:
+        from pdm_conda.environments import CondaEnvironment
+
+        if isinstance(self.environment, CondaEnvironment):
+            return self.environment.pkgs_dirs
+        return []
+
+    @property
+    def conda_fingerprint(self) -> str:
+        """Fingerprint of the Conda environment a lock file is valid for, it changes with the platform or the default
+        channels. Virtual packages aren't included as their versions (kernel, glibc, Conda...) differ between machines
+        sharing a lock file.
+        """
+        data = {"platform": self.platform, "channels": self.default_channels}
+        return "sha256:" + hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
     @property
     def base_env(self) -> Path:
         if self._base_env is None:
@@ -92,6 +114,26 @@ class CondaProject(Project):
 
         return self.locked_repository_class(lockfile=lockfile, sources=self.sources, environment=self.environment)  # type: ignore
 
+    def get_lock_metadata(self) -> dict[str, Any]:
+        metadata = super().get_lock_metadata()
+        if self.conda_config.is_initialized:
+            metadata["conda_fingerprint"] = self.conda_fingerprint
+        return metadata
+
+    def is_lockfile_hash_match(self) -> bool:
+        """True if the lock file hash matches pyproject.toml and, if the lock file was generated for a Conda
+        environment, the environment fingerprint didn't change, so locked packages can be installed without resolving.
+        """
+        if not super().is_lockfile_hash_match():
+            return False
+        if not self.conda_config.is_initialized:
+            return True
+        fingerprint = self.lockfile["metadata"].get("conda_fingerprint")
+        if fingerprint is not None and fingerprint != self.conda_fingerprint:
+            self.core.ui.warn("Lockfile was generated for other Conda platform or channels")
+            return False
+        return True
+
     @Project.python.setter
     @PluginConfig.check_active
     def python(self, value: PythonInfo) -> None:
@@ -126,6 +168,7 @@ class CondaProject(Project):
         self._virtual_packages = info["virtual_packages"]
         self._platform = info["platform"]
         self._default_channels = info["channels"]
+        self._pkgs_dirs = info["pkgs_dirs"]
 
     def get_conda_pyproject_dependencies(self, group: str, dev: bool = False, set_defaults=False) -> list[str]:
         """Get the conda dependencies array in the pyproject.toml."""
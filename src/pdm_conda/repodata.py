@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import atexit
+import contextlib
+import hashlib
+import json
+import mmap
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+from packaging.version import InvalidVersion
+
+from pdm_conda import logger
+from pdm_conda.models.candidates import parse_channel
+from pdm_conda.models.requirements import parse_conda_version
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pdm_conda.models.requirements import CondaRequirement
+
+REPODATA_SUFFIXES = ("/repodata.json.zst", "/repodata.json")
+MAX_OPEN_INDEXES = 32
+STATE_SUFFIXES = (".info.json", ".state.json")
+
+
+def _read_json(path: Path) -> dict:
+    """Read JSON file, decompressing it if zstd compressed.
+
+    :param path: JSON file path
+    :return: JSON content
+    """
+    if path.suffix == ".zst":
+        import zstandard
+
+        with path.open("rb") as f:
+            return json.loads(zstandard.ZstdDecompressor().stream_reader(f).read())
+    with path.open("rb") as f:
+        return json.load(f)
+
+
+def _channel_url(url: str) -> str | None:
+    """Get channel subdir url from repodata url, None if it isn't a full repodata.
+
+    :param url: repodata url
+    :return: channel subdir url
+    """
+    url = url.rstrip("/")
+    for suffix in REPODATA_SUFFIXES:
+        if url.endswith(suffix):
+            return url[: -len(suffix)]
+    if url.endswith(".json"):
+        return None
+    return url
+
+
+def _cached_state(path: Path) -> tuple[str, float] | None:
+    """Get the url and last refresh time of a repodata cached by Conda using its state file.
+
+    :param path: cached repodata path
+    :return: repodata url and refresh timestamp
+    """
+    stem = path.name.split(".")[0]
+    for suffix in STATE_SUFFIXES:
+        state_path = path.with_name(f"{stem}{suffix}")
+        with contextlib.suppress(OSError, ValueError):
+            if url := (state := _read_json(state_path)).get("url"):
+                refresh_ns = state.get("refresh_ns")
+                return url, refresh_ns / 1e9 if isinstance(refresh_ns, int) else state_path.stat().st_mtime
+    return None
+
+
+def find_repodata(pkgs_dirs: Iterable[Path]) -> dict[str, tuple[str, Path, float]]:
+    """Find channels repodata cached by Conda in packages directories.
+
+    :param pkgs_dirs: Conda packages directories
+    :return: mapping of channel subdir to its url, cached repodata path and last refresh time
+    """
+    repodata: dict[str, tuple[str, Path, float]] = {}
+    for pkgs_dir in pkgs_dirs:
+        cache_dir = Path(pkgs_dir) / "cache"
+        if not cache_dir.is_dir():
+            continue
+        for path in sorted(cache_dir.iterdir()):
+            if not path.name.endswith((".json", ".json.zst")) or path.name.endswith(STATE_SUFFIXES):
+                continue
+            if (state := _cached_state(path)) is None or (channel_url := _channel_url(state[0])) is None:
+                continue
+            repodata.setdefault(parse_channel(channel_url), (channel_url, path, state[1]))
+    return repodata
+
+
+class RepodataIndex:
+    """Index over a cached repodata, records are stored sorted by name in a memory mapped file so only the records of
+    the searched package are read."""
+
+    VERSION = 1
+    RECORD_FIELDS = (
+        "name",
+        "version",
+        "build",
+        "build_number",
+        "depends",
+        "constrains",
+        "md5",
+        "sha256",
+        "timestamp",
+        "track_features",
+        "subdir",
+        "fn",
+    )
+
+    def __init__(self, repodata_path: Path, index_dir: Path) -> None:
+        self.repodata_path = repodata_path
+        self._key = hashlib.sha256(str(repodata_path.resolve()).encode()).hexdigest()[:16]
+        self.index_path = index_dir / f"{self._key}.index.json"
+        stat = repodata_path.stat()
+        self._source = {"version": self.VERSION, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        # records are named after the repodata they come from, so an outdated index never addresses rebuilt records
+        stamp = hashlib.sha256(json.dumps(self._source, sort_keys=True).encode()).hexdigest()[:16]
+        self.records_path = index_dir / f"{self._key}-{stamp}.records"
+        self._names: dict[str, list[int]] | None = None
+        self._mmap: mmap.mmap | None = None
+
+    def _load_index(self) -> dict[str, list[int]] | None:
+        with contextlib.suppress(OSError, ValueError):
+            with self.index_path.open() as f:
+                index = json.load(f)
+            if index.get("source") == self._source and self.records_path.exists():
+                return index["names"]
+        return None
+
+    def build(self) -> dict[str, list[int]]:
+        """Build index from repodata, records are grouped by name and `.conda` packages are preferred over `.tar.bz2`.
+
+        :return: mapping of package name to records byte range
+        """
+        logger.debug(f"Indexing repodata {self.repodata_path}")
+        records: dict[str, dict[str, dict]] = {}
+        data = _read_json(self.repodata_path)
+        for key in ("packages", "packages.conda"):
+            for fn, record in (data.pop(key, None) or {}).items():
+                basename = fn.rsplit(".", 2 if fn.endswith(".tar.bz2") else 1)[0]
+                record["fn"] = fn
+                records.setdefault(record["name"], {})[basename] = {
+                    k: record[k] for k in self.RECORD_FIELDS if k in record
+                }
+        del data
+
+        names: dict[str, list[int]] = {}
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile("wb", dir=self.index_path.parent, suffix=".tmp", delete=False) as f:
+            offset = 0
+            for name in sorted(records):
+                start = offset
+                for record in records[name].values():
+                    line = json.dumps(record, separators=(",", ":")).encode() + b"\n"
+                    f.write(line)
+                    offset += len(line)
+                names[name] = [start, offset]
+        Path(f.name).replace(self.records_path)
+        with NamedTemporaryFile("w", dir=self.index_path.parent, suffix=".tmp", delete=False) as f:
+            json.dump({"source": self._source, "names": names}, f)
+        Path(f.name).replace(self.index_path)
+        for path in self.index_path.parent.glob(f"{self._key}-*.records"):
+            if path != self.records_path:
+                with contextlib.suppress(OSError):
+                    path.unlink()
+        return names
+
+    @property
+    def names(self) -> dict[str, list[int]]:
+        if self._names is None:
+            self._names = self._load_index()
+            if self._names is None:
+                self._names = self.build()
+        return self._names
+
+    def get(self, name: str) -> list[dict]:
+        """Get package records.
+
+        :param name: package name
+        :return: package records
+        """
+        if (byte_range := self.names.get(name)) is None:
+            return []
+        if self._mmap is None:
+            with self.records_path.open("rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        start, end = byte_range
+        return [json.loads(line) for line in self._mmap[start:end].splitlines()]
+
+    def close(self):
+        """Release the memory mapped records, they are mapped again if needed."""
+        if (records := self._mmap) is not None:
+            self._mmap = None
+            records.close()
+
+
+_indexes: OrderedDict[tuple[Path, Path], tuple[int, RepodataIndex]] = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def _get_index(repodata_path: Path, index_dir: Path, mtime_ns: int) -> RepodataIndex:
+    """Get repodata index, cached while the repodata is not modified. Outdated and least recently used indexes are
+    closed so at most `MAX_OPEN_INDEXES` are kept open.
+
+    :param repodata_path: repodata path
+    :param index_dir: directory where indexes are stored
+    :param mtime_ns: repodata modification time, used to invalidate cache
+    :return: repodata index
+    """
+    key = (repodata_path, index_dir)
+    with _indexes_lock:
+        if (cached := _indexes.pop(key, None)) is not None and cached[0] != mtime_ns:
+            cached[1].close()
+            cached = None
+        if cached is None:
+            cached = (mtime_ns, RepodataIndex(repodata_path, index_dir))
+        _indexes[key] = cached
+        while len(_indexes) > MAX_OPEN_INDEXES:
+            _, (_, index) = _indexes.popitem(last=False)
+            index.close()
+        return cached[1]
+
+
+def close_indexes():
+    """Close all cached repodata indexes."""
+    with _indexes_lock:
+        for _, index in _indexes.values():
+            index.close()
+        _indexes.clear()
+
+
+atexit.register(close_indexes)
+
+
+def _channel_subdirs(channel: str, platform: str) -> list[str]:
+    """Channel subdirs to search.
+
+    :param channel: channel name or url
+    :param platform: env platform
+    :return: channel subdirs
+    """
+    channel = parse_channel(channel).rstrip("/") if "://" in channel else channel.rstrip("/")
+    if channel.endswith((f"/{platform}", "/noarch")):
+        return [channel]
+    return [f"{channel}/{platform}", f"{channel}/noarch"]
+
+
+def repodata_search(
+    pkgs_dirs: Iterable[Path],
+    index_dir: Path,
+    platform: str,
+    requirement: CondaRequirement,
+    channels: Iterable[str],
+    max_age: int | None = None,
+) -> list[dict] | None:
+    """Search packages matching requirement in the repodata cached by Conda.
+
+    :param pkgs_dirs: Conda packages directories
+    :param index_dir: directory where repodata indexes are stored
+    :param platform: env platform
+    :param requirement: requirement to search
+    :param channels: channels to search
+    :param max_age: max seconds since Conda refreshed the repodata, older repodata is considered not cached
+    :return: list of conda packages or None if some channel repodata is not cached
+    """
+    repodata = find_repodata(pkgs_dirs)
+    now = time.time()
+    is_compatible = requirement.compatibility_check()
+    packages = []
+    for channel in channels:
+        if channel == "defaults":
+            return None
+        for subdir in _channel_subdirs(channel, platform):
+            if subdir not in repodata:
+                logger.debug(f"No cached repodata found for {subdir}")
+                return None
+            channel_url, path, refreshed = repodata[subdir]
+            if max_age is not None and refreshed + max_age < now:
+                logger.debug(f"Cached repodata for {subdir} is outdated")
+                return None
+            try:
+                records = _get_index(path, index_dir, path.stat().st_mtime_ns).get(str(requirement.conda_name))
+            except (OSError, ValueError, ImportError) as e:
+                logger.debug(f"Unable to read repodata {path}: {e}")
+                return None
+            for record in records:
+                version = record["version"]
+                matcher = SimpleNamespace(
+                    name=record["name"],
+                    version=parse_conda_version(version),
+                    build_string=record.get("build", ""),
+                )
+                try:
+                    compatible = is_compatible(matcher)
+                except InvalidVersion:
+                    compatible = False
+                if compatible:
+                    packages.append(
+                        {
+                            **record,
+                            "channel": channel_url,
+                            "url": f"{channel_url}/{record['fn']}",
+                            "depends": list(record.get("depends") or []),
+                            "constrains": list(record.get("constrains") or []),
+                        },
+                    )
+    return packages
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from copy import copy
+from functools import cached_property
 from typing import TYPE_CHECKING, cast
 
 from pdm.models.repositories import BaseRepository
@@ -51,8 +52,12 @@ class CondaBaseProvider(BaseProvider):
                 parse_requirement(name).identify()
                 for name in environment.project.pyproject.resolution.get("excludes", [])
             }
-        python_version = str(environment.interpreter.version)
-        self.python_candidate = CondaCandidate(
+
+    @cached_property
+    def python_candidate(self) -> CondaCandidate:
+        """Environment python as Conda candidate, only needed to start a Conda resolution."""
+        python_version = str(self.repository.environment.interpreter.version)
+        return CondaCandidate(
             parse_requirement(f"conda:python=={python_version}"),
             "python",
             python_version,
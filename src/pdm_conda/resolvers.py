@@ -148,15 +148,18 @@ class CondaResolution(Resolution):
                     excluded_identifiers=excluded_identifiers,
                 )
 
-    def _add_to_criteria(self, criteria, requirement, parent):
+    def _merge_constrain(self, criteria, requirement):
+        # merge with constrain if exists
+        if (constrain := criteria[CONSTRAINS_KEY].get(requirement.conda_name, None)) is not None:
+            return constrain.merge(requirement)
+        return requirement
+
+    def _add_to_criteria(self, criteria, requirement, parent, update_resolution: bool = True):
         if self._is_conda_initialized:
-            # merge with constrain if exists
             self._ensure_criteria(criteria)
-            constrains = criteria[CONSTRAINS_KEY]
-            if (constrain := constrains.get(requirement.conda_name, None)) is not None:
-                requirement = constrain.merge(requirement)
-
-            self._update_conda_resolution(criteria, [requirement])
+            requirement = self._merge_constrain(criteria, requirement)
+            if update_resolution:
+                self._update_conda_resolution(criteria, [requirement])
             if criterion := criteria.get(self._p.identify(requirement)):
                 # if excluded then delete conda related information else if other conda requirement transform to conda
                 if not self._p.repository.is_conda_managed(requirement, criteria[CONDA_EXCLUDED_IDENTIFIERS_KEY]):
@@ -181,15 +184,20 @@ class CondaResolution(Resolution):
         criteria = self.state.criteria.copy()
         self._ensure_criteria(criteria)
         dependencies = self._p.get_dependencies(candidate=candidate)
-        # update conda resolution with dependencies if parent excluded
-        if self._is_conda_initialized and not self._p.repository.is_conda_managed(
-            candidate.req,
-            criteria[CONDA_EXCLUDED_IDENTIFIERS_KEY],
-        ):
-            self._update_conda_resolution(criteria, dependencies)
+        if self._is_conda_initialized:
+            # solve once with the dependencies not compatible with conda resolution instead of solving for each one
+            resolution = criteria[CONDA_RESOLUTION_KEY]
+            excluded_identifiers = criteria[CONDA_EXCLUDED_IDENTIFIERS_KEY]
+            new_requirements = [
+                requirement
+                for requirement in (self._merge_constrain(criteria, dependency) for dependency in dependencies)
+                if not self._p.compatible_with_resolution([requirement], resolution, excluded_identifiers)
+            ]
+            if new_requirements:
+                self._update_conda_resolution(criteria, new_requirements)
 
         for requirement in dependencies:
-            self._add_to_criteria(criteria, requirement, parent=candidate)
+            self._add_to_criteria(criteria, requirement, parent=candidate, update_resolution=False)
 
         # merge with previous constrain if exists
         if self._is_conda_initialized and isinstance(candidate, CondaCandidate):
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import atexit
+import contextlib
+import json
+import os
+import shlex
+import subprocess
+import threading
+from pathlib import Path
+from shutil import which
+
+from pdm_conda import logger
+
+WORKER_SERVER = Path(__file__).with_name("worker_server.py")
+WORKER_RUNNERS = ("conda", "mamba")
+WORKER_COMMANDS = ("search", "repoquery", "info", "list")
+
+
+def runner_python(executable: str) -> str | None:
+    """Get the interpreter of a runner executable if it's a Python script.
+
+    :param executable: runner executable path
+    :return: interpreter path or None if the runner isn't a Python script
+    """
+    try:
+        with Path(executable).open("rb") as f:
+            line = f.readline(512).decode(errors="ignore").strip()
+    except OSError:
+        return None
+    if not line.startswith("#!") or "python" not in line:
+        return None
+    args = shlex.split(line[2:])
+    if Path(args[0]).name == "env":
+        args = [a for a in args[1:] if not a.startswith("-")]
+        return which(args[0]) if args else None
+    return args[0]
+
+
+def is_worker_command(cmd: list[str], environment: dict) -> bool:
+    """True if command can be executed by a worker.
+
+    :param cmd: conda command
+    :param environment: environment or lockfile data
+    :return: True if command can be executed by a worker
+    """
+    if environment or len(cmd) < 2 or Path(cmd[0]).name not in WORKER_RUNNERS:
+        return False
+    return cmd[1] in WORKER_COMMANDS or (cmd[1] == "create" and "--dry-run" in cmd)
+
+
+class CondaWorker:
+    """Long-lived runner process executing Conda commands sent through stdin as JSON lines."""
+
+    _workers: dict[str, CondaWorker | None] = {}
+    _workers_lock = threading.Lock()
+
+    def __init__(self, runner: str, python: str) -> None:
+        self.runner = runner
+        self.python = python
+        self._process: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get(cls, runner: str) -> CondaWorker | None:
+        """Get the worker for a runner, starting it if needed.
+
+        :param runner: runner name
+        :return: worker or None if the runner can't use a worker
+        """
+        with cls._workers_lock:
+            if runner not in cls._workers:
+                worker = None
+                if (executable := which(runner)) is not None and (python := runner_python(executable)) is not None:
+                    worker = cls(Path(runner).name, python)
+                    if not worker.start():
+                        worker = None
+                cls._workers[runner] = worker
+            return cls._workers[runner]
+
+    @classmethod
+    def close_all(cls):
+        with cls._workers_lock:
+            for worker in cls._workers.values():
+                if worker is not None:
+                    worker.close()
+            cls._workers.clear()
+
+    def start(self) -> bool:
+        """Start worker process.
+
+        :return: True if worker is ready
+        """
+        logger.debug(f"Starting {self.runner} worker with {self.python}")
+        try:
+            self._process = subprocess.Popen(
+                [self.python, "-u", str(WORKER_SERVER), self.runner],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                encoding="utf-8",
+            )
+            status = json.loads(self._process.stdout.readline() or "{}")  # type: ignore[union-attr]
+        except (OSError, ValueError) as e:
+            status = {"error": str(e)}
+        if not status.get("ready", False):
+            logger.debug(f"Unable to start {self.runner} worker: {status.get('error', 'unknown error')}")
+            self.close()
+            return False
+        return True
+
+    def run(self, cmd: list[str], env: dict | None = None) -> subprocess.CompletedProcess | None:
+        """Run conda command in the worker.
+
+        :param cmd: conda command
+        :param env: environment variables to use for conda
+        :return: completed process or None if the worker is not available
+        """
+        request = json.dumps({"args": cmd[1:], "env": {**os.environ} if env is None else env})
+        with self._lock:
+            if self._process is None:
+                return None
+            try:
+                self._process.stdin.write(f"{request}\n")  # type: ignore[union-attr]
+                self._process.stdin.flush()  # type: ignore[union-attr]
+                response = json.loads(self._process.stdout.readline())  # type: ignore[union-attr]
+            except (OSError, ValueError) as e:
+                logger.debug(f"{self.runner} worker failed, falling back to subprocess: {e}")
+                self.close()
+                return None
+        return subprocess.CompletedProcess(cmd, response["returncode"], response["stdout"], response["stderr"])
+
+    def close(self):
+        if (process := self._process) is None:
+            return
+        self._process = None
+        with contextlib.suppress(OSError):
+            process.stdin.close()  # type: ignore[union-attr]
+        try:
+            process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+atexit.register(CondaWorker.close_all)
@@ -0,0 +1,90 @@
+"""Conda worker server, it runs inside the runner interpreter and executes the Conda commands received as JSON lines
+through stdin, so the runner is imported once and its loaded channel indexes are reused between commands.
+
+This module is executed by path with the runner interpreter, so it must only import the standard library and the
+runner packages.
+"""
+
+import contextlib
+import importlib
+import io
+import json
+import os
+import sys
+from pathlib import Path
+
+ENTRY_POINTS = {
+    "conda": "conda.cli.main",
+    "mamba": "mamba.mamba",
+}
+
+
+def _reset_context():
+    with contextlib.suppress(ImportError):
+        from conda.base.context import reset_context
+
+        reset_context()
+
+
+def run(main, runner: str, args: list[str], env: dict[str, str]) -> dict:
+    """Run Conda command in process capturing its output.
+
+    :param main: runner entry point
+    :param runner: runner name
+    :param args: command args without runner
+    :param env: environment variables to use
+    :return: command return code and output
+    """
+    environ, argv = dict(os.environ), sys.argv
+    stdout, stderr = io.StringIO(), io.StringIO()
+    os.environ.clear()
+    os.environ.update(env)
+    sys.argv = [runner, *args]
+    try:
+        _reset_context()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                returncode = main()
+            except SystemExit as e:
+                returncode = e.code
+            except Exception as e:  # noqa: BLE001
+                print(f"{type(e).__name__}: {e}", file=sys.stderr)
+                returncode = 1
+    finally:
+        os.environ.clear()
+        os.environ.update(environ)
+        sys.argv = argv
+    if not isinstance(returncode, int):
+        if returncode:
+            print(returncode, file=stderr)
+        returncode = 1 if returncode else 0
+    return {"returncode": returncode, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+def serve(runner: str):
+    """Serve Conda commands until stdin is closed.
+
+    :param runner: runner name
+    """
+    out = sys.stdout
+    try:
+        main = importlib.import_module(ENTRY_POINTS[runner]).main
+    except (KeyError, ImportError, AttributeError) as e:
+        out.write(json.dumps({"ready": False, "error": f"{type(e).__name__}: {e}"}) + "\n")
+        out.flush()
+        return
+    out.write(json.dumps({"ready": True}) + "\n")
+    out.flush()
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        out.write(json.dumps(run(main, runner, request["args"], request["env"])) + "\n")
+        out.flush()
+
+
+if __name__ == "__main__":
+    # don't shadow runner packages with pdm-conda modules
+    script_dir = Path(__file__).resolve().parent
+    sys.path = [p for p in sys.path if Path(p or os.curdir).resolve() != script_dir]
+    serve(sys.argv[1])
@@ -282,7 +282,13 @@ def mock_conda(
         return {"message": "ok"}
 
     mocker.patch("pdm_conda.conda.which")
-    return mocker.patch("pdm_conda.conda.run_conda", side_effect=_mock)
+    run_conda = mocker.patch("pdm_conda.conda.run_conda", side_effect=_mock)
+
+    async def _mock_async(cmd, *args, **kwargs):
+        return run_conda(cmd, *args, **kwargs)
+
+    mocker.patch("pdm_conda.conda.run_conda_async", side_effect=_mock_async)
+    return run_conda
 
 
 @pytest.fixture(name="pypi")
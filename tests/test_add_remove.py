@@ -131,8 +131,8 @@ class TestAddRemove:
             packages_to_remove.add(p)
         cmd_order = []
         if packages_to_remove:
-            # get working set + get python packages
-            cmd_order = ["list", "list", "create"] + ["remove"] * (1 if batch_commands else len(packages_to_remove))
+            # working set is listed once and shared to get python packages
+            cmd_order = ["list", "create"] + ["remove"] * (1 if batch_commands else len(packages_to_remove))
         assert conda.call_count == len(cmd_order)
 
         dependencies = project.get_dependencies(group)
@@ -13,6 +13,39 @@ class TestCondaUtils:
         with pytest.raises(CondaRunnerNotFoundError, match=rf"Conda runner {runner} not found"):
             run_conda([runner, "cmd"])
 
+    @pytest.mark.parametrize("max_concurrency", [1, 4])
+    def test_run_conda_concurrently(self, max_concurrency):
+        """Test async conda commands run concurrently up to the max concurrency and from any thread."""
+        import sys
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        from pdm_conda.conda import CondaExecutionError, run_conda_async, run_conda_concurrently
+
+        def command(i):
+            return [sys.executable, "-c", f"import time; time.sleep(0.5); print('{{\"i\": {i}}}')", "--json"]
+
+        start = time.monotonic()
+        responses = run_conda_concurrently(
+            *(run_conda_async(command(i)) for i in range(4)),
+            max_concurrency=max_concurrency,
+        )
+        elapsed = time.monotonic() - start
+        assert responses == [{"i": i} for i in range(4)]
+        if max_concurrency == 1:
+            assert elapsed >= 2
+        else:
+            assert elapsed < 2
+
+        with ThreadPoolExecutor(2) as executor:
+            results = executor.map(lambda i: run_conda_concurrently(run_conda_async(command(i))), range(2))
+            assert list(results) == [[{"i": 0}], [{"i": 1}]]
+
+        with pytest.raises(CondaExecutionError, match="failed"):
+            run_conda_concurrently(
+                run_conda_async([sys.executable, "-c", "raise SystemExit('failed')"], exception_msg="failed"),
+            )
+
     @pytest.mark.parametrize(
         "path,expected_path",
         [
@@ -27,3 +60,503 @@ class TestCondaUtils:
         from pdm_conda.utils import fix_path
 
         assert fix_path(path) == Path(expected_path)
+
+
+@pytest.mark.usefixtures("mock_conda_mapping")
+class TestSortCandidates:
+    @pytest.mark.parametrize("minimal_version", [True, False])
+    def test_sort_candidates(self, project, conda, mocker: MockFixture, minimal_version):
+        """Test candidates are sorted by preference and sort keys are reused by candidates copies."""
+        from pdm_conda.conda import sort_candidates
+        from pdm_conda.models.candidates import CondaCandidate
+        from pdm_conda.models.conda import ChannelSorter
+        from pdm_conda.models.requirements import parse_requirement
+
+        project.conda_config.channels = ["conda-forge", "defaults"]
+        req = parse_requirement("conda:dep")
+        candidates = [
+            CondaCandidate(req, "dep", "1.0", build_number=0, channel="conda-forge/noarch"),
+            CondaCandidate(req, "dep", "2.0", build_number=0, channel="defaults/noarch"),
+            CondaCandidate(req, "dep", "2.0", build_number=1, channel="defaults/noarch"),
+            CondaCandidate(req, "dep", "2.0", build_number=1, channel="conda-forge/noarch"),
+            CondaCandidate(req, "dep", "2.0", build_number=1, channel="conda-forge/noarch", track_feature="feat"),
+        ]
+        expected = [candidates[i] for i in ([0, 3, 2, 1, 4] if minimal_version else [3, 2, 1, 0, 4])]
+        sort_keys: dict = {}
+        assert list(sort_candidates(project, candidates[::-1], minimal_version, sort_keys)) == expected
+        assert len(sort_keys) == len(candidates)
+
+        get_priority = mocker.spy(ChannelSorter, "get_priority")
+        copies = [c.copy_with(req) for c in candidates]
+        assert [c.record for c in sort_candidates(project, copies, minimal_version, sort_keys)] == [
+            c.record for c in expected
+        ]
+        assert get_priority.call_count == 0
+
+
+class TestCondaWorker:
+    @pytest.fixture
+    def runner(self, tmp_path, monkeypatch):
+        """Fake Conda runner, a Python script and its importable package."""
+        import os
+        import sys
+
+        from pdm_conda.worker import CondaWorker
+
+        script = """import json, os, sys
+CALLS = []
+
+
+def main():
+    CALLS.append(sys.argv[1:])
+    if "fail" in sys.argv:
+        print("boom", file=sys.stderr)
+        return 1
+    print(json.dumps({"calls": len(CALLS), "pid": os.getpid(), "env": os.environ.get("PDM_CONDA_TEST", "")}))
+    return 0
+"""
+        package = tmp_path / "pkgs" / "conda" / "cli"
+        package.mkdir(parents=True)
+        for path in (package.parent / "__init__.py", package / "__init__.py"):
+            path.touch()
+        (package / "main.py").write_text(script)
+        executable = tmp_path / "bin" / "conda"
+        executable.parent.mkdir()
+        executable.write_text(f"#!{sys.executable}\n{script}\nsys.exit(main())\n")
+        executable.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{executable.parent}{os.pathsep}{os.environ['PATH']}")
+        CondaWorker.close_all()
+        yield tmp_path / "pkgs"
+        CondaWorker.close_all()
+
+    @pytest.mark.parametrize("importable", [True, False])
+    def test_worker(self, runner, importable, monkeypatch):
+        """Test commands run in a persistent worker falling back to subprocess."""
+        import os
+
+        from pdm_conda.conda import CondaExecutionError, run_conda
+        from pdm_conda.worker import runner_python
+
+        if importable:
+            monkeypatch.setenv("PYTHONPATH", str(runner))
+        assert runner_python(str(runner.parent / "bin" / "conda"))
+
+        responses = [run_conda(["conda", cmd, "--json"], worker=True) for cmd in ("info", "list", "search")]
+        if importable:
+            assert [r["calls"] for r in responses] == [1, 2, 3]
+            assert len({r["pid"] for r in responses}) == 1
+        else:
+            assert [r["calls"] for r in responses] == [1] * 3
+            assert len({r["pid"] for r in responses}) == 3
+        response = run_conda(["conda", "info", "--json"], env={**os.environ, "PDM_CONDA_TEST": "value"}, worker=True)
+        assert response["env"] == "value"
+        assert run_conda(["conda", "info", "--json"], worker=True)["env"] == ""
+        # not dry run create is never sent to the worker
+        assert run_conda(["conda", "create", "--json"], worker=True)["calls"] == 1
+
+        with pytest.raises(CondaExecutionError, match="boom"):
+            run_conda(["conda", "info", "fail"], worker=True)
+
+
+@pytest.mark.usefixtures("mock_conda_mapping")
+class TestEnvProbe:
+    @pytest.mark.parametrize("runner", ["conda", "micromamba"])
+    def test_env_probe(self, project, conda, runner):
+        """Test environment is probed once, shared between project copies and updated after installs."""
+        from copy import copy
+
+        from pdm_conda.conda import conda_install, conda_list
+
+        from tests.conftest import PREFERRED_VERSIONS
+
+        project.conda_config.runner = runner
+
+        def commands():
+            return sorted(cmd[1] for (cmd,), _ in conda.call_args_list)
+
+        assert project.platform
+        assert "dep" not in conda_list(project)
+        copied = copy(project)
+        assert copied.virtual_packages == project.virtual_packages
+        assert copied.base_env == Path("/opt/conda/base")
+        conda_list(copied)
+        assert commands() == ["info", "list"]
+
+        conda_install(copied, [PREFERRED_VERSIONS["dep"]["url"]])
+        assert "dep" in conda_list(project)
+        assert commands() == ["info", "install", "list", "list"]
+
+
+@pytest.mark.usefixtures("mock_conda_mapping")
+class TestCondaMeta:
+    @pytest.mark.parametrize("runner", ["conda", "micromamba"])
+    def test_conda_meta(self, project, conda, runner, installed_packages, mocker: MockFixture, tmp_path):
+        """Test installed packages are read from conda-meta while it exists, else listed with conda."""
+        import json
+        import os
+
+        from pdm_conda.conda import _read_conda_meta, conda_list
+
+        from tests.conftest import PREFERRED_VERSIONS
+
+        project.conda_config.runner = runner
+        mocker.patch("pdm_conda.conda.get_python_dir", return_value=tmp_path)
+        conda_meta = tmp_path / "conda-meta"
+        conda_meta.mkdir()
+        (conda_meta / "history").touch()
+
+        def install(package):
+            record = {k: v for k, v in package.items() if k not in ("build_string", "python_only")}
+            record |= {"subdir": "platform", "fn": f"{package['name']}.conda"}
+            (conda_meta / f"{package['name']}.json").write_text(json.dumps(record))
+            os.utime(conda_meta, ns=(conda_meta.stat().st_atime_ns, conda_meta.stat().st_mtime_ns + 1_000_000))
+
+        def list_calls():
+            return sum(1 for (cmd,), _ in conda.call_args_list if cmd[1] == "list")
+
+        for package in installed_packages:
+            install(package)
+        _read_conda_meta.cache_clear()
+        packages = conda_list(project)
+        assert set(packages) == {p["name"] for p in installed_packages}
+        for name, dist in packages.items():
+            package = PREFERRED_VERSIONS[name]
+            assert dist.as_line() == f"channel::{name}=={package['version']} {package['build']}"
+        assert conda_list(project).keys() == packages.keys()
+        assert _read_conda_meta.cache_info().hits == 1
+
+        install(PREFERRED_VERSIONS["dep"])
+        assert "dep" in conda_list(project)
+        assert list_calls() == 0
+
+        (conda_meta / "history").unlink()
+        for path in conda_meta.iterdir():
+            path.unlink()
+        conda_meta.rmdir()
+        assert "dep" not in conda_list(project)
+        assert list_calls() == 1
+
+
+@pytest.mark.usefixtures("mock_conda_mapping")
+class TestSearchCache:
+    @pytest.mark.parametrize("runner", ["conda", "micromamba"])
+    def test_search_cache(self, project, conda, runner, mocker: MockFixture, tmp_path):
+        """Test search results are persisted between runs until repodata changes or expired."""
+        import time
+
+        from pdm_conda.conda import _conda_search, conda_search
+        from pdm_conda.project import CondaProject
+
+        repodata = tmp_path / "pkgs" / "cache" / "channel.json"
+        repodata.parent.mkdir(parents=True)
+        repodata.write_text("{}")
+        mocker.patch.object(
+            CondaProject, "pkgs_dirs", new_callable=mocker.PropertyMock, return_value=[repodata.parents[1]]
+        )
+        config = project.conda_config
+        config.runner = runner
+        config.search_cache_active = True
+        config.search_cache_dir = str(tmp_path / "search-cache")
+
+        def num_searches():
+            return sum(1 for (cmd,), _ in conda.call_args_list if cmd[1] in ("search", "repoquery"))
+
+        expected = conda_search(project, "dep")
+        assert expected
+        for _ in range(3):
+            _conda_search.cache_clear()
+            assert [str(c) for c in conda_search(project, "dep")] == [str(c) for c in expected]
+        assert num_searches() == 1
+        assert any((tmp_path / "search-cache").iterdir())
+
+        repodata.write_text('{"packages": {}}')
+        _conda_search.cache_clear()
+        assert conda_search(project, "dep")
+        assert num_searches() == 2
+
+        mocker.patch("pdm_conda.cache.time.time", return_value=time.time() + config.search_cache_ttl + 1)
+        _conda_search.cache_clear()
+        assert conda_search(project, "dep")
+        assert num_searches() == 3
+
+
+@pytest.mark.usefixtures("mock_conda_mapping")
+class TestSolverCache:
+    @pytest.mark.parametrize("runner", ["conda", "micromamba"])
+    def test_solver_cache(self, project, conda, runner, mocker: MockFixture, tmp_path):
+        """Test dry run solutions are persisted between runs until expired or evicted."""
+        import time
+
+        from pdm_conda.conda import conda_create
+        from pdm_conda.models.requirements import parse_requirement
+
+        config = project.conda_config
+        config.runner = runner
+        config.solver_cache_active = True
+        config.solver_cache_dir = str(tmp_path / "solver-cache")
+        config.solver_cache_max_entries = 2
+
+        def num_creates():
+            return sum(1 for (cmd,), _ in conda.call_args_list if cmd[1] == "create")
+
+        def solve(*reqs):
+            requirements = [parse_requirement(f"conda:{r}") for r in reqs]
+            return conda_create(project, requirements, prefix=tmp_path / str(time.monotonic_ns()), dry_run=True)
+
+        expected = solve("dep")
+        assert expected
+        for _ in range(2):
+            assert {k: [str(c) for c in v] for k, v in solve("dep").items()} == {
+                k: [str(c) for c in v] for k, v in expected.items()
+            }
+        assert num_creates() == 1
+
+        solve("lib")
+        solve("another-dep")
+        assert len(list((tmp_path / "solver-cache").glob("*.json"))) == 2
+        solve("dep")
+        assert num_creates() == 4
+
+        mocker.patch("pdm_conda.cache.time.time", return_value=time.time() + config.solver_cache_ttl + 1)
+        solve("dep")
+        assert num_creates() == 5
+
+
+@pytest.mark.usefixtures("mock_conda_mapping")
+class TestRepodata:
+    @staticmethod
+    def _write_repodata(pkgs_dir: Path, channel: str, packages: list[dict], state_suffix: str = ".info.json"):
+        import json
+        from hashlib import md5
+
+        from tests.utils import channel_url
+
+        url = f"{channel_url(channel)}/repodata.json"
+        cache_dir = pkgs_dir / "cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        stem = md5(url.encode()).hexdigest()[:8]
+        repodata: dict = {"packages": {}, "packages.conda": {}}
+        for pkg in packages:
+            record = {k: v for k, v in pkg.items() if k not in ("url", "channel", "python_only", "build_string")}
+            repodata["packages"][f"{pkg['name']}-{pkg['version']}-{pkg['build']}.tar.bz2"] = record
+            repodata["packages.conda"][f"{pkg['name']}-{pkg['version']}-{pkg['build']}.conda"] = record
+        (cache_dir / f"{stem}.json").write_text(json.dumps(repodata))
+        (cache_dir / f"{stem}{state_suffix}").write_text(json.dumps({"url": url}))
+
+    @pytest.mark.parametrize("runner", ["conda", "micromamba"])
+    @pytest.mark.parametrize("state_suffix", [".info.json", ".state.json"])
+    @pytest.mark.parametrize(
+        "requirement,expected",
+        [
+            ["dep", ["dep@1.0.0"]],
+            ["openssl>=1.1.1b", ["openssl@1.1.1b", "openssl@1.1.1c"]],
+            ["openssl<1.1.1c", ["openssl@1.1.1a", "openssl@1.1.1b"]],
+            ["lib2=1.0.0g", ["lib2@1.0.0g"]],
+            ["missing", []],
+        ],
+    )
+    def test_repodata_search(
+        self,
+        project,
+        conda,
+        conda_info,
+        runner,
+        state_suffix,
+        requirement,
+        expected,
+        mocker: MockFixture,
+        tmp_path,
+    ):
+        """Test searching in cached repodata gives the expected candidates without running conda."""
+        from pdm_conda.conda import conda_search
+        from pdm_conda.project import CondaProject
+
+        from tests.utils import DEFAULT_CHANNEL, PLATFORM
+
+        pkgs_dir = tmp_path / "pkgs"
+        for subdir in (PLATFORM, "noarch"):
+            channel = f"{DEFAULT_CHANNEL}/{subdir}"
+            self._write_repodata(
+                pkgs_dir,
+                channel,
+                [p for p in conda_info if p["channel"].endswith(channel)],
+                state_suffix,
+            )
+        mocker.patch.object(CondaProject, "pkgs_dirs", new_callable=mocker.PropertyMock, return_value=[pkgs_dir])
+        config = project.conda_config
+        config.runner = runner
+        config.channels = [DEFAULT_CHANNEL]
+        config.repodata_active = True
+        config.repodata_index_dir = str(tmp_path / "index")
+
+        candidates = conda_search(project, requirement)
+        assert sorted(str(c) for c in candidates) == expected
+        for can in candidates:
+            assert can.link.url.endswith(".conda#md5=" + can.link.hash)
+            assert can.channel == f"{DEFAULT_CHANNEL}/{PLATFORM}"
+        assert not any(cmd[1] in ("search", "repoquery") for (cmd,), _ in conda.call_args_list)
+
+    def test_repodata_index(self, project, conda, conda_info, mocker: MockFixture, tmp_path):
+        """Test repodata is indexed once and reindexed only when it changes."""
+        from pdm_conda.conda import _conda_search, conda_search
+        from pdm_conda.project import CondaProject
+        from pdm_conda.repodata import RepodataIndex, close_indexes
+
+        from tests.utils import DEFAULT_CHANNEL, PLATFORM
+
+        pkgs_dir = tmp_path / "pkgs"
+        packages = {subdir: [p for p in conda_info if p["channel"].endswith(subdir)] for subdir in (PLATFORM, "noarch")}
+        for subdir, pkgs in packages.items():
+            self._write_repodata(pkgs_dir, f"{DEFAULT_CHANNEL}/{subdir}", pkgs)
+        mocker.patch.object(CondaProject, "pkgs_dirs", new_callable=mocker.PropertyMock, return_value=[pkgs_dir])
+        config = project.conda_config
+        config.channels = [DEFAULT_CHANNEL]
+        config.repodata_active = True
+        config.repodata_index_dir = str(tmp_path / "index")
+        build = mocker.spy(RepodataIndex, "build")
+
+        def search(requirement):
+            _conda_search.cache_clear()
+            close_indexes()
+            return sorted(str(c) for c in conda_search(project, requirement))
+
+        for _ in range(3):
+            assert search("openssl") == ["openssl@1.1.1a", "openssl@1.1.1b", "openssl@1.1.1c"]
+            assert search("lib") == ["lib@1.0"]
+        assert build.call_count == 2
+        assert len(list((tmp_path / "index").glob("*.records"))) == 2
+
+        self._write_repodata(
+            pkgs_dir,
+            f"{DEFAULT_CHANNEL}/{PLATFORM}",
+            [p for p in packages[PLATFORM] if p["version"] != "1.1.1a"],
+        )
+        assert search("openssl") == ["openssl@1.1.1b", "openssl@1.1.1c"]
+        assert build.call_count == 3
+        assert len(list((tmp_path / "index").glob("*.records"))) == 2
+        assert not any(cmd[1] == "search" for (cmd,), _ in conda.call_args_list)
+
+    def test_repodata_index_rebuilt(self, conda_info, tmp_path):
+        """Test an outdated index never reads the records rebuilt for the updated repodata."""
+        from pdm_conda.repodata import RepodataIndex, find_repodata
+
+        from tests.utils import DEFAULT_CHANNEL, PLATFORM
+
+        pkgs_dir = tmp_path / "pkgs"
+        channel = f"{DEFAULT_CHANNEL}/{PLATFORM}"
+        self._write_repodata(pkgs_dir, channel, conda_info)
+        ((_, path, _),) = find_repodata([pkgs_dir]).values()
+        index_dir = tmp_path / "index"
+
+        outdated = RepodataIndex(path, index_dir)
+        assert outdated.names
+        self._write_repodata(pkgs_dir, channel, [p for p in conda_info if p["name"] != "dep"])
+        updated = RepodataIndex(path, index_dir)
+        assert updated.records_path != outdated.records_path
+        assert updated.get("dep") == []
+        assert [r["version"] for r in updated.get("openssl")]
+        with pytest.raises(FileNotFoundError):
+            outdated.get("openssl")
+        updated.close()
+
+    def test_repodata_index_close(self, conda_info, mocker: MockFixture, tmp_path):
+        """Test outdated and least recently used indexes release their memory mapped records."""
+        from pdm_conda.repodata import _get_index, close_indexes, find_repodata
+
+        from tests.utils import DEFAULT_CHANNEL, PLATFORM
+
+        mocker.patch("pdm_conda.repodata.MAX_OPEN_INDEXES", 1)
+        pkgs_dir = tmp_path / "pkgs"
+        for subdir in (PLATFORM, "noarch"):
+            self._write_repodata(pkgs_dir, f"{DEFAULT_CHANNEL}/{subdir}", conda_info)
+        paths = sorted(path for _, path, _ in find_repodata([pkgs_dir]).values())
+        index_dir = tmp_path / "index"
+
+        index = _get_index(paths[0], index_dir, 0)
+        assert index.get("openssl")
+        assert index._mmap is not None
+        assert _get_index(paths[0], index_dir, 0) is index
+        updated = _get_index(paths[0], index_dir, 1)
+        assert updated is not index
+        assert index._mmap is None
+
+        assert updated.get("openssl")
+        other = _get_index(paths[1], index_dir, 0)
+        assert other.get("openssl")
+        assert updated._mmap is None
+        close_indexes()
+        assert other._mmap is None
+        # closed indexes map their records again
+        assert other.get("openssl")
+        other.close()
+
+    def test_repodata_search_fallback(self, project, conda, mocker: MockFixture, tmp_path):
+        """Test conda is used when channel repodata isn't cached."""
+        from pdm_conda.conda import conda_search
+        from pdm_conda.project import CondaProject
+
+        mocker.patch.object(CondaProject, "pkgs_dirs", new_callable=mocker.PropertyMock, return_value=[tmp_path])
+        project.conda_config.repodata_active = True
+        assert conda_search(project, "dep")
+        assert any(cmd[1] == "search" for (cmd,), _ in conda.call_args_list)
+
+    def test_repodata_max_age(self, project, conda, conda_info, mocker: MockFixture, tmp_path):
+        """Test conda is used when Conda didn't refresh the cached repodata within the max age."""
+        import time
+
+        from pdm_conda.conda import _conda_search, conda_search
+        from pdm_conda.project import CondaProject
+
+        from tests.utils import DEFAULT_CHANNEL, PLATFORM
+
+        pkgs_dir = tmp_path / "pkgs"
+        for subdir in (PLATFORM, "noarch"):
+            self._write_repodata(pkgs_dir, f"{DEFAULT_CHANNEL}/{subdir}", conda_info)
+        mocker.patch.object(CondaProject, "pkgs_dirs", new_callable=mocker.PropertyMock, return_value=[pkgs_dir])
+        config = project.conda_config
+        config.channels = [DEFAULT_CHANNEL]
+        config.repodata_active = True
+        config.repodata_index_dir = str(tmp_path / "index")
+
+        def num_searches():
+            _conda_search.cache_clear()
+            conda_search(project, "dep")
+            return sum(1 for (cmd,), _ in conda.call_args_list if cmd[1] == "search")
+
+        assert num_searches() == 0
+        mocker.patch("pdm_conda.repodata.time.time", return_value=time.time() + config.repodata_max_age + 1)
+        assert num_searches() == 1
+
+
+class TestPrefetch:
+    def test_prefetch(self, project, conda, httpx_mock, mocker: MockFixture, tmp_path):
+        """Test packages are downloaded once into the packages cache and their md5 is verified."""
+        import hashlib
+
+        from pdm.exceptions import InstallationError
+        from pdm_conda.conda import conda_prefetch
+        from pdm_conda.project import CondaProject
+
+        pkgs_dir = tmp_path / "pkgs"
+        pkgs_dir.mkdir()
+        mocker.patch.object(CondaProject, "pkgs_dirs", new_callable=mocker.PropertyMock, return_value=[pkgs_dir])
+        url = "https://conda.anaconda.org/conda-forge/noarch"
+        contents = {f"dep-{i}.conda": f"package {i}".encode() for i in range(3)}
+        packages = [f"{url}/{name}#{hashlib.md5(content).hexdigest()}" for name, content in contents.items()]
+        for name, content in contents.items():
+            httpx_mock.add_response(url=f"{url}/{name}", content=content)
+
+        assert conda_prefetch(project, packages) == [pkgs_dir / name for name in contents]
+        assert {p.name: p.read_bytes() for p in pkgs_dir.glob("*.conda")} == contents
+        assert sorted((pkgs_dir / "urls.txt").read_text().splitlines()) == [f"{url}/{name}" for name in contents]
+        assert conda_prefetch(project, packages) == [pkgs_dir / name for name in contents]
+        assert len(httpx_mock.get_requests()) == len(contents)
+
+        httpx_mock.add_response(url=f"{url}/corrupted.conda", content=b"corrupted")
+        with pytest.raises(InstallationError, match="md5"):
+            conda_prefetch(project, [f"{url}/corrupted.conda#{hashlib.md5(b'package').hexdigest()}"])
+        assert sorted(p.name for p in pkgs_dir.iterdir()) == sorted([*contents, "urls.txt"])
+
+        httpx_mock.add_response(url=f"{url}/missing.conda", status_code=404)
+        assert conda_prefetch(project, [f"{url}/missing.conda#hash"]) == []
+        assert not (pkgs_dir / "missing.conda").exists()
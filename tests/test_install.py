@@ -2,7 +2,7 @@ import re
 
 import pytest
 
-from tests.conftest import PYTHON_REQUIREMENTS
+from tests.conftest import PREFERRED_VERSIONS, PYTHON_REQUIREMENTS
 from tests.utils import format_url
 
 
@@ -78,3 +78,159 @@ class TestInstall:
         if not dry_run:
             assert not urls
         assert not cmd_order
+
+    @pytest.mark.parametrize("runner", ["conda", "micromamba"])
+    def test_install_prefetch(self, pdm, project, conda, conda_info, runner, mock_conda_mapping, mocker):
+        """Test `install` downloads Conda packages before installing them with one command."""
+        conda_info = [r for r in conda_info if r not in PYTHON_REQUIREMENTS]
+        conf = project.conda_config
+        conf.runner = runner
+        conf.dependencies = [conda_info[-1]["name"]]
+        conf.prefetch_packages = True
+        installs_on_prefetch = []
+
+        def _prefetch(project, packages):
+            installs_on_prefetch.append(sum(1 for (cmd,), _ in conda.call_args_list if cmd[1] == "install"))
+
+        prefetch = mocker.patch("pdm_conda.installers.manager.conda_prefetch", side_effect=_prefetch)
+        pdm(["install", "-vv", "--no-self"], obj=project, strict=True)
+
+        urls = sorted({p["name"]: format_url(p) for p in conda_info}.values())
+        prefetch.assert_called_once()
+        assert sorted(prefetch.call_args.args[1]) == urls
+        # packages are installed once after being downloaded
+        assert installs_on_prefetch == [0]
+        installs = [kwargs["lockfile"] for (cmd,), kwargs in conda.call_args_list if cmd[1] == "install"]
+        assert len(installs) == 1
+        assert sorted(c for c in installs[0] if c.startswith("https://")) == urls
+
+    def test_install_from_lock(self, pdm, project, conda, conda_info, mock_conda_mapping, mocker):
+        """Test installing from a lock generated for the same Conda environment doesn't run Conda to resolve."""
+        from pdm_conda.models.requirements import parse_requirement
+        from pdm_conda.project import CondaProject
+
+        conda_info = [r for r in conda_info if r not in PYTHON_REQUIREMENTS]
+        project.conda_config.dependencies = [conda_info[-1]["name"]]
+        project.conda_config.batched_commands = True
+        pdm(["lock", "-vv"], obj=project, strict=True)
+        assert project.lockfile._data["metadata"]["conda_fingerprint"] == project.conda_fingerprint
+
+        conda.reset_mock()
+        resolve = mocker.spy(project.core.resolver_class, "resolve")
+        pdm(["install", "-vv", "--no-self", "--frozen-lockfile"], obj=project, strict=True)
+        # installed packages are only listed when the working set is needed
+        assert [cmd[1] for (cmd,), _ in conda.call_args_list] == ["list", "install"]
+        assert resolve.call_count == 0
+
+        # virtual packages versions differ between machines sharing the lock
+        virtual_packages = {parse_requirement("conda:__linux==6.1")}
+        mocker.patch.object(
+            CondaProject, "virtual_packages", new_callable=mocker.PropertyMock, return_value=virtual_packages
+        )
+        assert project.is_lockfile_hash_match()
+        mocker.patch.object(CondaProject, "platform", new_callable=mocker.PropertyMock, return_value="other-64")
+        assert not project.is_lockfile_hash_match()
+
+
+class TestCondaTransaction:
+    @staticmethod
+    def _transaction(name_to_remove: str, name_to_install: str):
+        from copy import deepcopy
+
+        from pdm.models.setup import Setup
+        from pdm_conda.installers.manager import CondaTransaction
+        from pdm_conda.models.candidates import CondaCandidate
+        from pdm_conda.models.setup import CondaSetupDistribution
+
+        removed = PREFERRED_VERSIONS[name_to_remove]
+        transaction = CondaTransaction()
+        transaction.remove(
+            CondaSetupDistribution(Setup(name=removed["name"], summary="", version=removed["version"]), removed)
+        )
+        transaction.install(CondaCandidate.from_conda_package(deepcopy(PREFERRED_VERSIONS[name_to_install])))
+        return transaction
+
+    def test_commit(self, project, conda, mock_conda_mapping):
+        """Test collected operations run with one remove and one install command."""
+        transaction = self._transaction("openssl", "lib2")
+        transaction.commit(project)
+        assert [cmd[1] for (cmd,), _ in conda.call_args_list] == ["remove", "install"]
+        assert not transaction.to_remove
+        assert not transaction.to_install
+
+        conda.reset_mock()
+        transaction.commit(project)
+        assert conda.call_count == 0
+
+    def test_rollback(self, project, conda, mock_conda_mapping, mocker):
+        """Test removed packages are installed again from their `conda-meta` record when the install fails."""
+        from pdm.exceptions import InstallationError
+
+        openssl = PREFERRED_VERSIONS["openssl"]
+        mocker.patch(
+            "pdm_conda.installers.manager._conda_meta_packages",
+            return_value=[{"name": "openssl", "url": openssl["url"], "md5": openssl["md5"]}],
+        )
+        transaction = self._transaction("openssl", "lib2")
+        # `conda list` records don't have the package url
+        transaction.to_remove["openssl"].package = {k: v for k, v in openssl.items() if k not in ("url", "md5")}
+        side_effect = conda.side_effect
+        failing_url = format_url(PREFERRED_VERSIONS["lib2"])
+
+        def _mock(cmd, **kwargs):
+            if cmd[1] == "install" and failing_url in kwargs["lockfile"]:
+                raise InstallationError("install failed")
+            return side_effect(cmd, **kwargs)
+
+        conda.side_effect = _mock
+        with pytest.raises(InstallationError, match="install failed"):
+            transaction.commit(project)
+        assert [cmd[1] for (cmd,), _ in conda.call_args_list] == ["remove", "install", "install"]
+        restored = [p for p in conda.call_args_list[-1].kwargs["lockfile"] if p.startswith("https://")]
+        assert restored == [format_url(PREFERRED_VERSIONS["openssl"])]
+
+    def test_overwrite_with_pypi(self, project, conda, mock_conda_mapping, mocker):
+        """Test Conda package is removed before installing a PyPI package with the same name."""
+        from pdm.installers import InstallManager
+        from pdm.models.candidates import Candidate
+        from pdm.models.requirements import parse_requirement
+        from pdm.models.setup import Setup
+        from pdm_conda.installers.manager import CondaInstallManager
+        from pdm_conda.models.setup import CondaSetupDistribution
+
+        removed = PREFERRED_VERSIONS["openssl"]
+        dist = CondaSetupDistribution(Setup(name=removed["name"], summary="", version=removed["version"]), removed)
+        calls_before_install = []
+        mocker.patch.object(
+            InstallManager,
+            "install",
+            side_effect=lambda _: calls_before_install.extend(cmd[1] for (cmd,), _ in conda.call_args_list),
+        )
+        manager = CondaInstallManager(project.environment)
+        manager.begin_transaction()
+        manager.overwrite(dist, Candidate(parse_requirement("openssl"), "openssl", "1.0"))
+        assert calls_before_install == ["remove"]
+        assert not manager.transaction.to_remove
+
+    def test_failed_commit(self, pdm, project, conda, conda_info, mock_conda_mapping):
+        """Test a failed commit is reported as failure of the jobs that queued Conda operations."""
+        from pdm.exceptions import InstallationError
+
+        conda_info = [r for r in conda_info if r not in PYTHON_REQUIREMENTS]
+        project.conda_config.dependencies = [conda_info[-1]["name"]]
+        project.conda_config.batched_commands = True
+        side_effect = conda.side_effect
+
+        def _mock(cmd, **kwargs):
+            if cmd[1] == "install":
+                raise InstallationError("install failed")
+            return side_effect(cmd, **kwargs)
+
+        conda.side_effect = _mock
+        result = pdm(["install", "--no-self"], obj=project)
+        assert result.exit_code != 0
+        assert "Some package operations are not complete yet" in result.stderr
+        assert "Conda transaction failed: install failed" in result.output
+        installs = [line for line in result.output.splitlines() if f"Install {conda_info[-1]['name']} " in line]
+        assert installs
+        assert all("failed" in line for line in installs)
@@ -0,0 +1,274 @@
+import hashlib
+import io
+import json
+import sys
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+PLACEHOLDER = "/opt/" + "placehold_" * 24
+CHANNEL = "https://conda.anaconda.org/conda-forge"
+
+
+def make_package(name: str, noarch: bool = False) -> tuple[str, bytes]:
+    """Create a `.tar.bz2` Conda package.
+
+    :param name: package name
+    :param noarch: if true create a noarch python package with an entry point
+    :return: package file name and content
+    """
+    files: dict[str, bytes] = {}
+    paths = []
+    index: dict = {"name": name, "version": "1.0", "build": "0", "build_number": 0, "depends": []}
+    if noarch:
+        index |= {"noarch": "python", "subdir": "noarch"}
+        files[f"site-packages/{name}/__init__.py"] = b"def main():\n    return 0\n"
+        paths.append({"_path": f"site-packages/{name}/__init__.py", "path_type": "hardlink"})
+        files["info/link.json"] = json.dumps(
+            {"noarch": {"type": "python", "entry_points": [f"{name} = {name}:main"]}},
+        ).encode()
+    else:
+        index["subdir"] = "linux-64"
+        files[f"lib/lib{name}.so"] = b"library"
+        files[f"etc/{name}.conf"] = f"prefix={PLACEHOLDER}\n".encode()
+        files[f"bin/{name}"] = f"binary\0{PLACEHOLDER}/lib\0end".encode()
+        paths += [
+            {"_path": f"lib/lib{name}.so", "path_type": "hardlink"},
+            {"_path": f"etc/{name}.conf", "path_type": "hardlink", "prefix_placeholder": PLACEHOLDER},
+            {
+                "_path": f"bin/{name}",
+                "path_type": "hardlink",
+                "prefix_placeholder": PLACEHOLDER,
+                "file_mode": "binary",
+            },
+            {"_path": f"lib/lib{name}.so.1", "path_type": "softlink"},
+        ]
+    files["info/index.json"] = json.dumps(index).encode()
+    files["info/paths.json"] = json.dumps({"paths": paths, "paths_version": 1}).encode()
+
+    content = io.BytesIO()
+    with tarfile.open(fileobj=content, mode="w:bz2") as tar:
+        for path, data in files.items():
+            info = tarfile.TarInfo(path)
+            info.size = len(data)
+            info.mode = 0o755 if path.startswith("bin/") else 0o644
+            tar.addfile(info, io.BytesIO(data))
+        if not noarch:
+            info = tarfile.TarInfo(f"lib/lib{name}.so.1")
+            info.type = tarfile.SYMTYPE
+            info.linkname = f"lib{name}.so"
+            tar.addfile(info)
+    return f"{name}-1.0-0.tar.bz2", content.getvalue()
+
+
+def to_conda_format(filename: str, content: bytes) -> tuple[str, bytes]:
+    """Convert a `.tar.bz2` Conda package into the `.conda` format.
+
+    :param filename: package file name
+    :param content: package content
+    :return: `.conda` package file name and content
+    """
+    import zstandard
+
+    name = filename.removesuffix(".tar.bz2")
+    components = {"info": io.BytesIO(), "pkg": io.BytesIO()}
+    with tarfile.open(fileobj=io.BytesIO(content), mode="r:bz2") as source:
+        tars = {component: tarfile.open(fileobj=f, mode="w") for component, f in components.items()}
+        for member in source.getmembers():
+            data = source.extractfile(member) if member.isfile() else None
+            tars["info" if member.name.startswith("info/") else "pkg"].addfile(member, data)
+        for tar in tars.values():
+            tar.close()
+    result = io.BytesIO()
+    with zipfile.ZipFile(result, "w") as zf:
+        zf.writestr("metadata.json", json.dumps({"conda_pkg_format_version": 2}))
+        for component, f in components.items():
+            zf.writestr(f"{component}-{name}.tar.zst", zstandard.ZstdCompressor().compress(f.getvalue()))
+    return f"{name}.conda", result.getvalue()
+
+
+@pytest.fixture
+def pkgs_dir(project, mocker, tmp_path) -> Path:
+    from pdm_conda.project import CondaProject
+
+    path = tmp_path / "pkgs"
+    path.mkdir()
+    mocker.patch.object(CondaProject, "pkgs_dirs", new_callable=mocker.PropertyMock, return_value=[path])
+    return path
+
+
+@pytest.fixture
+def prefix(mocker, tmp_path) -> Path:
+    path = tmp_path / "env"
+    mocker.patch("pdm_conda.installers.linker._environment", return_value=(path, "3.11"))
+    return path
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Conda packages paths are POSIX")
+class TestLinker:
+    def test_binary_replace(self):
+        """Test binary placeholders are replaced keeping the file length."""
+        from pdm.exceptions import InstallationError
+        from pdm_conda.installers.linker import binary_replace
+
+        data = b"start\0/placeholder/lib:/placeholder/bin\0/placeholder\0"
+        replaced = binary_replace(data, b"/placeholder", b"/env")
+        assert len(replaced) == len(data)
+        assert replaced == b"start\0/env/lib:/env/bin\0" + b"\0" * 16 + b"/env\0" + b"\0" * 8
+        with pytest.raises(InstallationError):
+            binary_replace(data, b"/placeholder", b"/a/very/long/prefix")
+
+    def test_native_install(self, project, httpx_mock, pkgs_dir, prefix):
+        """Test packages are downloaded, extracted and linked without Conda and then removed."""
+        from pdm_conda.installers.linker import native_install, native_uninstall
+
+        packages = []
+        for name, noarch in (("lib", False), ("tool", True)):
+            filename, content = make_package(name, noarch)
+            url = f"{CHANNEL}/{'noarch' if noarch else 'linux-64'}/{filename}"
+            httpx_mock.add_response(url=url, content=content)
+            packages.append(f"{url}#{hashlib.md5(content).hexdigest()}")
+        native_install(project, packages)
+
+        assert (prefix / "lib/liblib.so").read_bytes() == b"library"
+        assert (prefix / "lib/liblib.so").stat().st_ino == (pkgs_dir / "lib-1.0-0/lib/liblib.so").stat().st_ino
+        assert (prefix / "lib/liblib.so.1").readlink() == Path("liblib.so")
+        assert (prefix / "etc/lib.conf").read_text() == f"prefix={prefix}\n"
+        binary = (prefix / "bin/lib").read_bytes()
+        assert len(binary) == len(f"binary\0{PLACEHOLDER}/lib\0end")
+        assert binary.startswith(f"binary\0{prefix}/lib\0".encode())
+        assert (prefix / "lib/python3.11/site-packages/tool/__init__.py").exists()
+        assert "from tool import main" in (prefix / "bin/tool").read_text()
+
+        meta = json.loads((prefix / "conda-meta/lib-1.0-0.json").read_text())
+        assert meta["url"] == packages[0].partition("#")[0]
+        assert meta["md5"] == packages[0].partition("#")[2]
+        assert sorted(meta["files"]) == ["bin/lib", "etc/lib.conf", "lib/liblib.so", "lib/liblib.so.1"]
+
+        # extracted packages are reused
+        native_install(project, packages)
+        assert len(httpx_mock.get_requests()) == 2
+
+        assert native_uninstall(project, ["lib", "tool", "missing"]) == ["missing"]
+        assert [p.name for p in prefix.rglob("*")] == ["conda-meta"]
+
+    def test_link_directories(self, tmp_path, prefix):
+        """Test directories are created when linking over existing paths and removed with the package."""
+        from pdm.exceptions import InstallationError
+        from pdm_conda.installers.linker import link_package, unlink_package
+
+        extracted = tmp_path / "pkgs" / "dirs-1.0-0"
+        (extracted / "info").mkdir(parents=True)
+        (extracted / "share").mkdir()
+        (extracted / "share/dirs.txt").write_text("data")
+        (extracted / "info/repodata_record.json").write_text(json.dumps({"name": "dirs", "version": "1.0"}))
+        paths = [
+            {"_path": "share/dirs", "path_type": "directory"},
+            {"_path": "share/dirs.txt", "path_type": "hardlink"},
+        ]
+        (extracted / "info/paths.json").write_text(json.dumps({"paths": paths, "paths_version": 1}))
+
+        for _ in range(2):
+            link_package(extracted, prefix, "3.11")
+            assert (prefix / "share/dirs").is_dir()
+            assert (prefix / "share/dirs.txt").read_text() == "data"
+
+        assert unlink_package(prefix, "dirs")
+        assert [p.name for p in prefix.rglob("*")] == ["conda-meta"]
+
+        (prefix / "share/dirs.txt").mkdir(parents=True)
+        with pytest.raises(InstallationError, match="is a directory"):
+            link_package(extracted, prefix, "3.11")
+
+    def test_failed_link(self, tmp_path, prefix):
+        """Test files linked before a failure are removed and no record is written."""
+        from pdm_conda.installers.linker import link_package
+
+        extracted = tmp_path / "pkgs" / "broken-1.0-0"
+        (extracted / "info").mkdir(parents=True)
+        (extracted / "lib").mkdir()
+        (extracted / "lib/libbroken.so").write_text("library")
+        (extracted / "info/repodata_record.json").write_text(json.dumps({"name": "broken", "version": "1.0"}))
+        paths = [
+            {"_path": "lib/libbroken.so", "path_type": "hardlink"},
+            {"_path": "lib/missing.so", "path_type": "hardlink"},
+        ]
+        (extracted / "info/paths.json").write_text(json.dumps({"paths": paths, "paths_version": 1}))
+
+        with pytest.raises(FileNotFoundError):
+            link_package(extracted, prefix, "3.11")
+        assert not list(prefix.rglob("*"))
+
+    def test_conda_format(self, project, httpx_mock, pkgs_dir, prefix):
+        """Test `.conda` packages are extracted and linked."""
+        pytest.importorskip("zstandard")
+        from pdm_conda.installers.linker import native_install
+
+        filename, content = to_conda_format(*make_package("lib"))
+        url = f"{CHANNEL}/linux-64/{filename}"
+        httpx_mock.add_response(url=url, content=content)
+        native_install(project, [f"{url}#{hashlib.md5(content).hexdigest()}"])
+
+        assert (pkgs_dir / "lib-1.0-0/info/repodata_record.json").exists()
+        assert (prefix / "lib/liblib.so").read_bytes() == b"library"
+        assert (prefix / "etc/lib.conf").read_text() == f"prefix={prefix}\n"
+        assert json.loads((prefix / "conda-meta/lib-1.0-0.json").read_text())["fn"] == filename
+
+    def test_unsupported(self, project, conda, pkgs_dir, prefix, mocker, mock_conda_mapping):
+        """Test packages that can't be linked natively are installed with Conda."""
+        from pdm_conda.installers.manager import _install
+
+        # zstandard isn't available to extract .conda packages
+        mocker.patch("pdm_conda.installers.linker.find_spec", return_value=None)
+        project.conda_config.native_install = True
+        url = f"{CHANNEL}/linux-64/dep-1.0-0.conda"
+        _install(project, [f"{url}#hash"])
+        assert not prefix.exists()
+        ((cmd,), kwargs) = conda.call_args
+        assert cmd[1] == "install"
+        assert f"{url}#hash" in kwargs["lockfile"]
+
+    def test_package_store(self, project, httpx_mock, pkgs_dir, prefix, mocker, tmp_path, pdm):
+        """Test packages are extracted once into the store, shared between environments and evicted."""
+        from pdm_conda.installers.linker import native_install, package_store
+
+        project.conda_config.package_store_active = True
+        project.conda_config.package_store_dir = str(tmp_path / "store")
+        packages = []
+        for name in ("lib", "other"):
+            filename, content = make_package(name)
+            url = f"{CHANNEL}/linux-64/{filename}"
+            httpx_mock.add_response(url=url, content=content)
+            packages.append(f"{url}#{hashlib.md5(content).hexdigest()}")
+        md5 = packages[0].partition("#")[2]
+        native_install(project, packages[:1])
+        other_prefix = tmp_path / "other_env"
+        mocker.patch("pdm_conda.installers.linker._environment", return_value=(other_prefix, "3.11"))
+        native_install(project, packages[:1])
+
+        stored = tmp_path / "store" / md5 / "lib-1.0-0"
+        assert len(httpx_mock.get_requests()) == 1
+        assert not (pkgs_dir / "lib-1.0-0").exists()
+        inodes = {p.stat().st_ino for p in (stored / "lib/liblib.so", prefix / "lib/liblib.so")}
+        assert inodes == {(other_prefix / "lib/liblib.so").stat().st_ino}
+        assert json.loads((other_prefix / "conda-meta/lib-1.0-0.json").read_text())["extracted_package_dir"] == str(
+            stored,
+        )
+
+        result = pdm(["conda", "cache", "list"], obj=project, strict=True)
+        assert "lib-1.0-0" in result.stdout
+        assert md5 in result.stdout
+
+        # the least recently used package is evicted, installed environments keep their files
+        project.conda_config.package_store_max_size = 0
+        native_install(project, packages[1:])
+        assert [p.path.name for p in package_store(project).packages()] == ["other-1.0-0"]
+        assert (prefix / "lib/liblib.so").read_bytes() == b"library"
+
+        result = pdm(["conda", "cache", "info"], obj=project, strict=True)
+        assert "Packages: 1" in result.stdout
+        result = pdm(["conda", "cache", "prune", "--max-size", "0"], obj=project, strict=True)
+        assert "1 package removed" in result.stdout
+        assert not package_store(project).packages()
@@ -413,3 +413,180 @@ class TestLockOverrides:
         strategy = handle.call_args[1]["options"].strategy_change
         assert ("cross_platform" in strategy) == (cross_platform and not initialized)
         assert ("no_cross_platform" in strategy) == (initialized or not cross_platform)
+
+
+class TestIncrementalResolution:
+    def test_solutions_reused(self, project, conda, mock_conda_mapping):
+        """Test Conda solutions are memoized by requirements set."""
+        from pdm_conda.conda import CondaResolutionError
+        from pdm_conda.models.requirements import parse_requirement
+
+        project.conda_config.runner = "micromamba"
+        repository = project.get_repository()
+        requirements = [parse_requirement("conda:dep"), parse_requirement("conda:lib>=1.0")]
+        resolution = repository.solve(requirements)
+        assert {"dep", "lib", "another-dep", "openssl"}.issubset(resolution)
+        for reqs in (requirements[::-1], requirements * 2):
+            assert repository.solve(reqs) == resolution
+
+        failing = [*requirements, parse_requirement("conda:python-only-dep")]
+        tracebacks = []
+        for _ in range(3):
+            with pytest.raises(CondaResolutionError) as excinfo:
+                repository.solve(failing)
+            assert excinfo.value.packages == ["python-only-dep"]
+            tracebacks.append(len(excinfo.traceback))
+        # reused failures don't accumulate the previous tracebacks
+        assert tracebacks[1] == tracebacks[2]
+
+        assert [cmd[1] for (cmd,), _ in conda.call_args_list if cmd[1] == "create"] == ["create"] * 2
+
+    def test_dependencies_solved_once(self, project, conda, mock_conda_mapping, mocker):
+        """Test new Conda dependencies of a pinned Conda candidate are solved with a single Conda call."""
+        from pdm_conda.models.candidates import CondaCandidate
+        from pdm_conda.models.requirements import parse_requirement
+        from pdm_conda.resolvers import CONDA_RESOLUTION_KEY, CondaResolution, State
+        from resolvelib import BaseReporter
+
+        project.conda_config.runner = "micromamba"
+        provider = project.get_provider()
+        dependencies = [parse_requirement(f"conda:{name}") for name in ("lib2", "openssl", "another-python-dep")]
+        mocker.patch.object(provider, "get_dependencies", return_value=dependencies)
+        resolution = CondaResolution(provider, BaseReporter())
+        resolution._states = [State(mapping={}, criteria={}, backtrack_causes=[])]
+
+        parent = CondaCandidate(parse_requirement("conda:parent"), "parent", "1.0")
+        criteria = resolution._get_updated_criteria(parent)
+        assert [cmd[1] for (cmd,), _ in conda.call_args_list if cmd[1] == "create"] == ["create"]
+        assert {"lib2", "openssl", "another-python-dep"}.issubset(criteria[CONDA_RESOLUTION_KEY])
+        assert {"lib2", "openssl", "another-python-dep"}.issubset(criteria)
+
+        # dependencies compatible with conda resolution are not solved again
+        resolved = criteria[CONDA_RESOLUTION_KEY]
+        resolution._states = [State(mapping={}, criteria={}, backtrack_causes=[], conda_resolution=resolved)]
+        resolution._get_updated_criteria(parent)
+        assert [cmd[1] for (cmd,), _ in conda.call_args_list if cmd[1] == "create"] == ["create"]
+
+
+class TestFetchHashes:
+    @pytest.mark.parametrize("solvable", [True, False])
+    def test_update_hashes(self, project, conda, mock_conda_mapping, solvable, mocker: MockerFixture):
+        """Test hashes are taken from Conda resolution and missing ones searched in parallel."""
+        from pdm_conda.conda import CondaResolutionError, conda_search
+
+        project.conda_config.runner = "micromamba"
+        repository = project.get_repository()
+        candidates = {}
+        for name in ("dep", "lib"):
+            can = conda_search(project, name)[0]
+            can.hashes = []
+            candidates[name] = can
+        duplicated = copy(candidates["dep"])
+        duplicated.hashes = []
+        if not solvable:
+            mocker.patch.object(repository, "solve", side_effect=CondaResolutionError("unsolvable"))
+        get_hashes = mocker.spy(repository, "get_hashes")
+
+        repository.update_hashes({**candidates, "dep-copy": duplicated})
+        assert all(can.hashes for can in (*candidates.values(), duplicated))
+        assert duplicated.hashes == candidates["dep"].hashes
+        assert get_hashes.call_count == (0 if solvable else len(candidates))
+
+
+class TestLockedRepository:
+    def test_matching_keys(self, project, conda, mock_conda_mapping):
+        """Test locked candidates are found through the name index."""
+        from pdm_conda.models.repositories import LockedCondaRepository
+        from pdm_conda.models.requirements import parse_requirement
+
+        files = [
+            {
+                "url": "https://conda.anaconda.org/conda-forge/noarch/dep-1.0-py_0.conda",
+                "hash": "md5:d41d8cd98f00b204e9800998ecf8427e",
+            },
+        ]
+        lockfile = {
+            "package": [
+                {"name": "dep", "version": "1.0", "conda_managed": True, "channel": "conda-forge", "files": files},
+                {"name": "other", "version": "2.0", "files": []},
+            ],
+        }
+        repository = LockedCondaRepository(lockfile, project.sources, project.environment)
+        conda_key = ("dep", "1.0", None, False)
+        assert repository._keys_by_name == {"dep": [conda_key], "other": [("other", "2.0", None, False)]}
+        assert list(repository._matching_keys(parse_requirement("conda:dep"))) == [conda_key]
+        assert [c.version for c in repository.find_candidates(parse_requirement("other"))] == ["2.0"]
+        assert list(repository._matching_keys(parse_requirement("conda:missing"))) == []
+
+    @pytest.mark.parametrize(
+        "package",
+        [
+            {"name": "dep", "version": "1.0"},
+            {"name": "Dep.With_Caps", "version": "1.0a"},
+            {"name": "_underscore_dep", "version": "2023.1"},
+            {"name": "dep", "version": "1.0", "extras": ["test", "doc"]},
+        ],
+    )
+    def test_lazy_candidates(self, project, conda, mock_conda_mapping, mocker, package):
+        """Test locked Conda candidates are created on first access with the same key."""
+        from pdm_conda.models.candidates import CondaCandidate
+        from pdm_conda.models.repositories import LockedCondaRepository
+
+        files = [
+            {
+                "url": f"https://conda.anaconda.org/conda-forge/noarch/{package['name']}-py_0.conda",
+                "hash": "md5:d41d8cd98f00b204e9800998ecf8427e",
+            },
+        ]
+        package = {**package, "conda_managed": True, "channel": "conda-forge", "dependencies": ["other"]}
+        lockfile = {"package": [package | {"files": files}, {"name": "other", "version": "2.0", "files": []}]}
+        from_lock_package = mocker.spy(CondaCandidate, "from_lock_package")
+        repository = LockedCondaRepository(lockfile, project.sources, project.environment)
+        assert from_lock_package.call_count == 0
+        (key,) = repository._conda_keys
+        assert len(repository.packages) == len(repository.candidate_info) == 2
+        assert set(repository.all_candidates) == {key[0], "other"}
+        assert from_lock_package.call_count == 0
+
+        dependencies, _, _ = repository.candidate_info[key]
+        assert dependencies[0] == "conda:other"
+        can = repository.packages[key]
+        assert from_lock_package.call_count == 1
+        assert repository._identify_candidate(can) == key
+        assert repository.all_candidates[key[0]] is can
+        assert list(repository.find_candidates(can.req)) == [can]
+        assert from_lock_package.call_count == 1
+
+    def test_lazy_candidates_install(self, project, conda, mock_conda_mapping, mocker):
+        """Test installing only creates the candidates of the selected groups, once even if accessed concurrently."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from pdm_conda.models.candidates import CondaCandidate
+        from pdm_conda.models.repositories import LockedCondaRepository
+
+        packages = [
+            {
+                "name": name,
+                "version": "1.0",
+                "groups": [group],
+                "conda_managed": True,
+                "channel": "conda-forge",
+                "files": [
+                    {
+                        "url": f"https://conda.anaconda.org/conda-forge/noarch/{name}-1.0-py_0.conda",
+                        "hash": "md5:d41d8cd98f00b204e9800998ecf8427e",
+                    },
+                ],
+            }
+            for name, group in (("dep", "default"), ("test-dep", "test"))
+        ]
+        from_lock_package = mocker.spy(CondaCandidate, "from_lock_package")
+        repository = LockedCondaRepository({"package": packages}, project.sources, project.environment)
+        assert [c.name for c in repository.evaluate_candidates(["default"])] == ["dep"]
+        assert from_lock_package.call_count == 1
+
+        (key,) = (k for k in repository._conda_keys if k[0] == "test-dep")
+        with ThreadPoolExecutor(8) as executor:
+            candidates = list(executor.map(lambda _: repository.packages[key], range(32)))
+        assert all(can is candidates[0] for can in candidates)
+        assert from_lock_package.call_count == 2
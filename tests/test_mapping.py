@@ -1,3 +1,5 @@
+import json
+import pickle
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -68,7 +70,7 @@ class TestMapping:
         requests = httpx_mock.get_requests()
         assert len(requests) == 1
         assert patch_conda_mapping_fixes.call_count == 1
-        for ext in ["yaml", "json"]:
+        for ext in ["yaml", "json", "pickle"]:
             assert (Path(patch_download_dir) / f"pypi_mapping.{ext}").exists()
 
     @pytest.mark.parametrize("conda_mapping", [{"pytest": "pytest-conda", "other": "other-conda"}])
@@ -98,3 +100,206 @@ class TestMapping:
         from pdm_conda.mapping import pypi_to_conda
 
         assert pypi_to_conda(package) == conda_mapping.get(package, package.lower())
+
+    @pytest.mark.parametrize("conda_mapping", [{"pytest": "pytest-conda", "other": "other-conda"}])
+    @pytest.mark.parametrize("conda_mapping_fixes", [{"corrected-mapping": "corrected"}])
+    def test_compiled_mapping(
+        self,
+        patch_download_dir,
+        project,
+        conda_mapping,
+        patch_conda_mapping_fixes,
+        conda_mapping_fixes,
+        httpx_mock: HTTPXMock,
+        mocker,
+        monkeypatch,
+    ):
+        """Test precompiled mapping is loaded without parsing the json mapping and compiled again if outdated."""
+        from pdm_conda.mapping import get_conda_mapping, get_pypi_mapping
+
+        self.test_download_mapping(
+            patch_download_dir,
+            project,
+            conda_mapping,
+            patch_conda_mapping_fixes,
+            conda_mapping_fixes,
+            httpx_mock,
+            None,
+            monkeypatch,
+        )
+        compiled_path = Path(patch_download_dir) / "pypi_mapping.pickle"
+        expected = {**conda_mapping, **conda_mapping_fixes}
+
+        json_load = mocker.patch("pdm_conda.mapping.json.load", side_effect=AssertionError)
+        get_pypi_mapping.cache_clear()
+        get_conda_mapping.cache_clear()
+        assert get_pypi_mapping() == expected
+        assert get_conda_mapping() == {v: k for k, v in expected.items()}
+        mocker.stop(json_load)
+
+        for fixes, outdated in (({"pytest": "pytest-fixed"}, False), ({}, True)):
+            if outdated:
+                compiled_path.write_bytes(b"outdated")
+            patch_conda_mapping_fixes = mocker.patch("pdm_conda.mapping.get_mapping_fixes", return_value=fixes)
+            get_pypi_mapping.cache_clear()
+            get_conda_mapping.cache_clear()
+            expected = {**conda_mapping, **fixes}
+            assert get_pypi_mapping() == expected
+            assert get_conda_mapping() == {v: k for k, v in expected.items()}
+
+        # precompiled mapping in an unexpected format
+        compiled_path.write_bytes(pickle.dumps(["mapping"]))
+        get_pypi_mapping.cache_clear()
+        assert get_pypi_mapping() == expected
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.parametrize("background", [True, False])
+    @pytest.mark.parametrize("modified", [True, False])
+    def test_refresh_mapping(
+        self, patch_download_dir, httpx_mock: HTTPXMock, mocker, monkeypatch, background, modified
+    ):
+        """Test outdated mapping is refreshed with conditional requests, in background if enabled."""
+        import gzip
+        import os
+
+        import httpx
+        from pdm_conda import mapping
+
+        mocker.patch("pdm_conda.mapping.get_mapping_fixes", return_value={})
+        mapping_url = "http://localhost:8000/mapping.yaml"
+        monkeypatch.setenv(mapping.MAPPING_URL_ENV_VAR, mapping_url)
+        monkeypatch.setenv(mapping.MAPPING_BACKGROUND_REFRESH_ENV_VAR, str(background))
+        download_dir = Path(patch_download_dir)
+        yaml_path = download_dir / "pypi_mapping.yaml"
+
+        def response(pypi_name, conda_name):
+            content = f"{pypi_name}:\n  conda_name: {conda_name}\n  pypi_name: {pypi_name}\n"
+            return httpx.ByteStream(gzip.compress(content.encode()))
+
+        httpx_mock.add_response(
+            url=mapping_url,
+            stream=response("pytest", "pytest-conda"),
+            headers={"Content-Encoding": "gzip", "ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+        )
+        assert mapping.download_mapping(download_dir) == {"pytest": "pytest-conda"}
+        assert httpx_mock.get_requests()[0].headers["Accept-Encoding"] == "gzip"
+        assert json.loads((download_dir / "pypi_mapping.headers.json").read_text()) == {
+            "url": mapping_url,
+            "etag": '"v1"',
+            "last-modified": "Wed, 21 Oct 2015 07:28:00 GMT",
+        }
+
+        if modified:
+            httpx_mock.add_response(
+                url=mapping_url,
+                stream=response("pytest", "pytest-new"),
+                headers={"Content-Encoding": "gzip", "ETag": '"v2"'},
+            )
+        else:
+            httpx_mock.add_response(url=mapping_url, status_code=304)
+        os.utime(yaml_path, (0, 0))
+        mapping.get_pypi_mapping.cache_clear()
+        expected = {"pytest": "pytest-new" if modified else "pytest-conda"}
+        # outdated mapping is used while it's refreshed in background
+        assert mapping.get_pypi_mapping() == ({"pytest": "pytest-conda"} if background else expected)
+        if background:
+            mapping._refresh_threads[download_dir].join()
+        request = httpx_mock.get_requests()[-1]
+        assert request.headers["If-None-Match"] == '"v1"'
+        assert request.headers["If-Modified-Since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+        assert yaml_path.stat().st_mtime > 0
+        assert mapping.download_mapping(download_dir) == expected
+        assert len(httpx_mock.get_requests()) == 2
+        assert not list(download_dir.glob(".*"))
+
+    def test_interrupted_refresh(self, patch_download_dir, httpx_mock: HTTPXMock, mocker, monkeypatch):
+        """Test mapping downloaded by an interrupted refresh isn't kept, so it's downloaded and processed again."""
+        from pdm_conda import mapping
+
+        mapping_url = "http://localhost:8000/mapping.yaml"
+        monkeypatch.setenv(mapping.MAPPING_URL_ENV_VAR, mapping_url)
+        download_dir = Path(patch_download_dir)
+        content = b"pytest:\n  conda_name: pytest-conda\n  pypi_name: pytest\n"
+        httpx_mock.add_response(url=mapping_url, content=content, headers={"ETag": '"v1"'})
+        httpx_mock.add_response(url=mapping_url, content=content, headers={"ETag": '"v1"'})
+
+        compile_mapping = mocker.patch("pdm_conda.mapping.compile_mapping", side_effect=KeyboardInterrupt)
+        with pytest.raises(KeyboardInterrupt):
+            mapping.refresh_mapping(download_dir)
+        assert not (download_dir / "pypi_mapping.yaml").exists()
+        assert not (download_dir / "pypi_mapping.headers.json").exists()
+        assert not list(download_dir.glob(".*"))
+
+        mocker.stop(compile_mapping)
+        assert mapping.download_mapping(download_dir) == {"pytest": "pytest-conda"}
+        assert "If-None-Match" not in httpx_mock.get_requests()[-1].headers
+
+    def test_background_refresh_exit(self, patch_download_dir, tmp_path):
+        """Test the process exits without waiting for a slow background refresh, staging files left are removed."""
+        import os
+        import subprocess
+        import sys
+        import threading
+        import time
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        from pdm_conda import mapping
+
+        download_dir = Path(patch_download_dir)
+        yaml_path = download_dir / "pypi_mapping.yaml"
+        yaml_path.write_text("pytest:\n  conda_name: pytest-conda\n  pypi_name: pytest\n")
+        mapping.process_mapping(yaml_path, yaml_path.with_suffix(".json"))
+        os.utime(yaml_path, (0, 0))
+        stale = download_dir / ".pypi_mapping.yaml.interrupted"
+        stale.write_text("")
+        os.utime(stale, (0, 0))
+
+        requested = threading.Event()
+        release = threading.Event()
+        marker = tmp_path / "requested"
+
+        class SlowHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                requested.set()
+                marker.touch()
+                release.wait(30)
+                self.send_response(304)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        env = {
+            **os.environ,
+            mapping.MAPPING_URL_ENV_VAR: f"http://127.0.0.1:{server.server_port}/mapping.yaml",
+            mapping.MAPPING_BACKGROUND_REFRESH_ENV_VAR: "true",
+            "PDM_REQUEST_TIMEOUT": "30",
+            "NO_PROXY": "127.0.0.1",
+        }
+        # the process exits once the refresh request is being served
+        code = (
+            "import time\n"
+            "from pathlib import Path\n"
+            "from pdm_conda.mapping import get_pypi_mapping\n"
+            "print(get_pypi_mapping()['pytest'])\n"
+            f"while not Path({str(marker)!r}).exists():\n"
+            "    time.sleep(0.01)\n"
+        )
+        try:
+            start = time.monotonic()
+            result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, timeout=20)
+            elapsed = time.monotonic() - start
+            # the request is still being served
+            assert requested.is_set()
+            assert not release.is_set()
+        finally:
+            release.set()
+            server.shutdown()
+            server.server_close()
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "pytest-conda"
+        assert elapsed < 15
+        assert not stale.exists()
@@ -19,11 +19,28 @@ class TestPluginConfig:
             ["active", True],
             ["custom-behavior", True],
             ["batched-commands", False],
+            ["prefetch-packages", True],
+            ["native-install", True],
+            ["max-concurrency", 8],
+            ["worker", True],
             ["dependencies", ["package"]],
             ["dev-dependencies", {"dev": ["package"]}],
             ["optional-dependencies", {"other": ["package"]}],
             ["pypi-mapping.url", "https://example.com/mapping.yaml"],
             ["pypi-mapping", {"url": "https://example.com/mapping.yaml"}],
+            ["pypi-mapping.background-refresh", False],
+            ["search-cache.active", True],
+            ["search-cache.dir", "/tmp/search-cache"],
+            ["search-cache.ttl", 3600],
+            ["repodata.active", True],
+            ["repodata.index-dir", "/tmp/repodata-index"],
+            ["repodata.max-age", 3600],
+            ["solver-cache.active", True],
+            ["solver-cache.ttl", 3600],
+            ["solver-cache.max-entries", 10],
+            ["package-store.active", True],
+            ["package-store.dir", "/tmp/package-store"],
+            ["package-store.max-size", 100],
         ],
     )
     @pytest.mark.parametrize("set_before", [True, False])
@@ -163,6 +180,38 @@ class TestPluginConfig:
                 },
             )
 
+    @pytest.mark.parametrize("from_env", [True, False])
+    def test_invalid_max_concurrency(self, project, monkeypatch, from_env):
+        """Test max concurrency lower than 1 is rejected instead of blocking Conda commands."""
+        from pdm_conda.models.config import PluginConfig
+
+        if from_env:
+            monkeypatch.setenv("PDM_CONDA_MAX_CONCURRENCY", "0")
+            with pytest.raises(ProjectError, match="Invalid Conda max concurrency: 0"):
+                PluginConfig.load_config(project)
+        else:
+            with pytest.raises(ProjectError, match="Invalid Conda max concurrency: 0"):
+                project.pyproject._data.update({"tool": {"pdm": {"conda": {"max-concurrency": 0}}}})
+
+    @pytest.mark.parametrize(
+        "env_var,value,message",
+        [
+            ["PDM_CONDA_SOLVER_CACHE_TTL", "1h", r"Invalid conda.solver-cache.ttl \(PDM_CONDA_SOLVER_CACHE_TTL\): 1h"],
+            ["PDM_CONDA_MAX_CONCURRENCY", "two", r"Invalid conda.max-concurrency \(PDM_CONDA_MAX_CONCURRENCY\): two"],
+            ["PDM_CONDA_SEARCH_CACHE_TTL", "-1", "Invalid Conda search cache ttl: -1"],
+            ["PDM_CONDA_REPODATA_MAX_AGE", "-1", "Invalid Conda repodata max age: -1"],
+            ["PDM_CONDA_SOLVER_CACHE_MAX_ENTRIES", "-5", "Invalid Conda solver cache max entries: -5"],
+            ["PDM_CONDA_PACKAGE_STORE_MAX_SIZE", "-1", "Invalid Conda package store max size: -1"],
+        ],
+    )
+    def test_invalid_numeric_env_var(self, project, monkeypatch, env_var, value, message):
+        """Test malformed or negative numeric env vars are reported naming the config."""
+        from pdm_conda.models.config import PluginConfig
+
+        monkeypatch.setenv(env_var, value)
+        with pytest.raises(ProjectError, match=message):
+            PluginConfig.load_config(project)
+
     @pytest.mark.parametrize("runner", ["micromamba", "mamba", "conda"])
     def test_temporary_config(self, project, runner):
         """Test config changes are temporary."""
@@ -0,0 +1,125 @@
+import pytest
+
+
+@pytest.mark.usefixtures("mock_conda_mapping")
+class TestRequirements:
+    @pytest.mark.parametrize("line", ["conda:python >=3.9", "conda:conda-forge::libgcc-ng >=12 h77fa898_1"])
+    def test_parse_requirement_cache(self, line):
+        """Test Conda requirements are parsed once and each call gets its own copy."""
+        from pdm_conda.models.requirements import _parse_conda_requirement, parse_requirement
+
+        _parse_conda_requirement.cache_clear()
+        req = parse_requirement(line)
+        other = parse_requirement(line)
+        assert _parse_conda_requirement.cache_info().hits == 1
+        assert req is not other
+        assert req == other
+        assert req.as_line(with_build_string=True) == other.as_line(with_build_string=True)
+
+        req.version_mapping["1"] = "1"
+        req.groups.append("dev")
+        req.build_string = "other"
+        other = parse_requirement(line)
+        assert "1" not in other.version_mapping
+        assert other.groups == []
+        assert other.build_string != "other"
+
+    @pytest.mark.parametrize(
+        "line,compatible",
+        [
+            ["conda:dep", [True, True, True]],
+            ["conda:dep>=1.5", [False, True, True]],
+            ["conda:dep 1.* py3*", [True, False, False]],
+            ["conda:dep >=1 *_cuda", [False, False, True]],
+        ],
+    )
+    def test_filter_compatible(self, line, compatible):
+        """Test compatibility check over many candidates matches testing them one by one."""
+        from types import SimpleNamespace
+
+        from pdm_conda.models.requirements import build_string_matcher, parse_requirement
+
+        candidates = [
+            SimpleNamespace(name="dep", version="1.0", build_string="py311_0"),
+            SimpleNamespace(name="dep", version="2.0", build_string="py311_0"),
+            SimpleNamespace(name="dep", version="2.0", build_string="h123_cuda"),
+        ]
+        req = parse_requirement(line)
+        build_string_matcher.cache_clear()
+        assert [req.is_compatible(c) for c in candidates] == compatible
+        assert req.filter_compatible(candidates) == [c for c, ok in zip(candidates, compatible, strict=True) if ok]
+        if req.build_string:
+            assert build_string_matcher.cache_info().misses == 1
+
+    def test_candidate_parsed_version(self, mocker):
+        """Test candidates version is parsed once and the parsed version is used to check compatibility."""
+        from packaging.specifiers import SpecifierSet
+        from packaging.version import Version
+        from pdm_conda.models.candidates import CondaCandidate
+        from pdm_conda.models.requirements import parse_requirement
+
+        can = CondaCandidate(parse_requirement("conda:dep"), "dep", "0.9", build_string="py311_0")
+        assert can.parsed_version == Version(can.version)
+        assert can.parsed_version is can.parsed_version
+        req = parse_requirement("conda:dep>=1.0")
+        contains = mocker.spy(SpecifierSet, "contains")
+        assert not req.is_compatible(can)
+        assert isinstance(contains.call_args.args[1], Version)
+
+        can.version = "2.0"
+        assert can.parsed_version == Version("2.0")
+        assert req.is_compatible(can)
+
+    def test_candidate_lazy_requirements(self, mocker):
+        """Test candidates dependencies, constrains and hashes are created on first access."""
+        from pdm_conda.models import candidates
+        from pdm_conda.models.candidates import CondaCandidate
+
+        package = {
+            "name": "dep",
+            "version": "1.0",
+            "build": "py311_0",
+            "build_number": 0,
+            "channel": "https://conda.anaconda.org/conda-forge/linux-64",
+            "url": "https://conda.anaconda.org/conda-forge/linux-64/dep-1.0-py311_0.conda",
+            "md5": "d41d8cd98f00b204e9800998ecf8427e",
+            "depends": ["python >=3.9", "libgcc-ng >=12", "other-dep 1.*"],
+            "constrains": ["constrained >=2"],
+        }
+        parse = mocker.spy(candidates, "parse_requirement")
+        can = CondaCandidate.from_conda_package(package)
+        parse.reset_mock()
+        other = can.copy_with(can.req)
+        assert parse.call_count == 0
+
+        assert [d.name for d in can.dependencies] == ["libgcc-ng", "other-dep"]
+        assert list(can.constrains) == ["constrained"]
+        assert parse.call_count == 3
+        assert can.dependencies is can.dependencies
+        assert can.hashes == [
+            {"url": package["url"], "file": "", "hash": f"md5:{package['md5']}"},
+        ]
+        assert [d.name for d in other.dependencies] == ["libgcc-ng", "other-dep"]
+        can.hashes = []
+        assert can.hashes == []
+        assert other.hashes != []
+
+    def test_candidate_record(self):
+        """Test candidates are slotted and copies share the package record."""
+        from pdm_conda.models.candidates import CondaCandidate
+        from pdm_conda.models.requirements import parse_requirement
+
+        can = CondaCandidate(
+            parse_requirement("conda:dep"),
+            "dep",
+            "1.0",
+            dependencies=["other-dep"],
+            build_string="py311_0",
+            channel="conda-forge",
+        )
+        assert not hasattr(can, "__dict__")
+        other = can.copy_with(parse_requirement("conda:dep>=1"))
+        assert other.record is can.record
+        assert other.req is not can.req
+        assert (other.conda_version, other.build_string, other.channel) == ("1.0", "py311_0", "conda-forge")
+        assert [d.name for d in other.dependencies] == ["other-dep"]